@@ -1,17 +1,129 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional
 import os
+import threading
+import time
 from dotenv import load_dotenv
+from starlette.concurrency import run_in_threadpool
 
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./construction.db")
 
+def _env_flag(name: str, default: str) -> bool:
+    return os.getenv(name, default).lower() in ("1", "true", "yes", "on")
+
+# ---- 커넥션 풀 설정 ----
+# 기본값은 Supabase 풀러(Supavisor) 기준: 워커당 연결은 적게 유지하고, 풀러가 끊은 유휴 연결은
+# pre-ping으로 걸러내며, 풀러 유휴 타임아웃보다 먼저 연결을 재생성한다.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "5"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+DB_POOL_PRE_PING = _env_flag("DB_POOL_PRE_PING", "true")
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "300"))
+
+class PoolMetrics:
+    """풀에서 연결을 받기까지의 대기시간/타임아웃/최대 사용량 누적 (풀 하나당 1개)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.wait_total = 0.0
+            self.wait_max = 0.0
+            self.peak_checked_out = 0
+            self.peak_overflow = 0
+
+    def record(self, pool, waited: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+            self.peak_checked_out = max(self.peak_checked_out, pool.checkedout())
+            self.peak_overflow = max(self.peak_overflow, pool.overflow())
+
+    def snapshot(self, pool) -> Dict:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                'pool_size': pool.size(),
+                'max_overflow': pool._max_overflow,
+                'pool_timeout': pool._timeout,
+                'pre_ping': pool._pre_ping,
+                'recycle': pool._recycle,
+                'checked_out': pool.checkedout(),
+                'checked_in': pool.checkedin(),
+                'overflow': max(pool.overflow(), 0),
+                'peak_checked_out': self.peak_checked_out,
+                'peak_overflow': max(self.peak_overflow, 0),
+                'checkouts': self.checkouts,
+                'timeouts': self.timeouts,
+                'wait_ms_avg': round(self.wait_total / attempts * 1000, 3) if attempts else 0.0,
+                'wait_ms_max': round(self.wait_max * 1000, 3),
+                'wait_ms_total': round(self.wait_total * 1000, 3)
+            }
+
+class _MeteredPoolMixin:
+    """연결 대여(_do_get) 시간을 재서 PoolMetrics에 기록"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self):
+        # dispose/재생성 후에도 같은 지표를 이어서 쓴다
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record(self, time.perf_counter() - started, timed_out=True)
+            raise
+        self.metrics.record(self, time.perf_counter() - started)
+        return connection
+
+class MeteredQueuePool(_MeteredPoolMixin, QueuePool):
+    pass
+
+class MeteredAsyncQueuePool(_MeteredPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+def pool_options(url: str, poolclass=MeteredQueuePool) -> Dict:
+    """환경변수 기반 풀 옵션 (인메모리 SQLite는 연결이 하나뿐이라 기본 풀 유지)"""
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return {}
+    return {
+        'poolclass': poolclass,
+        'pool_size': DB_POOL_SIZE,
+        'max_overflow': DB_MAX_OVERFLOW,
+        'pool_timeout': DB_POOL_TIMEOUT,
+        'pool_pre_ping': DB_POOL_PRE_PING,
+        'pool_recycle': DB_POOL_RECYCLE,
+    }
+
 if DATABASE_URL.startswith("sqlite"):
-    engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+    engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False}, **pool_options(DATABASE_URL))
 else:
-    engine = create_engine(DATABASE_URL)
+    engine = create_engine(DATABASE_URL, **pool_options(DATABASE_URL))
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -22,4 +134,118 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+# ---- 보관(콜드 스토리지) DB ----
+# 정산이 끝난 프로젝트의 작업일지/작업항목/투입 상세를 옮겨 두는 별도 DB.
+# 보관/복원이나 보관 데이터 조회를 처음 할 때 연결한다.
+ARCHIVE_DATABASE_URL = os.getenv("ARCHIVE_DATABASE_URL", "sqlite:///./construction_archive.db")
+
+_archive_engine: Optional[Engine] = None
+_archive_lock = threading.Lock()
+
+def get_archive_engine() -> Engine:
+    global _archive_engine
+    with _archive_lock:
+        if _archive_engine is None:
+            connect_args = {"check_same_thread": False} if ARCHIVE_DATABASE_URL.startswith("sqlite") else {}
+            _archive_engine = create_engine(
+                ARCHIVE_DATABASE_URL, connect_args=connect_args, **pool_options(ARCHIVE_DATABASE_URL)
+            )
+        return _archive_engine
+
+# ---- 비동기 엔진 모드 (DB_ASYNC=true) ----
+# PostgreSQL은 asyncpg, SQLite는 aiosqlite 드라이버를 쓴다. 동기 엔진도 그대로 두어
+# 백그라운드 작업/스크립트는 기존 SessionLocal을 계속 사용한다.
+DB_ASYNC = _env_flag("DB_ASYNC", "false")
+
+def to_async_url(url: str) -> str:
+    """동기 드라이버 URL을 비동기 드라이버 URL로 변환"""
+    scheme, sep, rest = url.partition("://")
+    if scheme.startswith("sqlite"):
+        return f"sqlite+aiosqlite{sep}{rest}"
+    if scheme.startswith("postgres"):
+        return f"postgresql+asyncpg{sep}{rest}"
+    return url
+
+async_engine = None
+AsyncSessionLocal = None
+if DB_ASYNC:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    async_engine = create_async_engine(
+        to_async_url(DATABASE_URL), **pool_options(DATABASE_URL, poolclass=MeteredAsyncQueuePool)
+    )
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False)
+
+def pool_status(reset: bool = False) -> Dict:
+    """엔진별 풀 사용 현황과 누적 대기 지표 (reset=True면 누적값 초기화)"""
+    status = {}
+    for name, pool in (("sync", engine.pool), ("async", async_engine.pool if async_engine else None)):
+        metrics = getattr(pool, "metrics", None)
+        if metrics is None:
+            continue
+        status[name] = metrics.snapshot(pool)
+        if reset:
+            metrics.reset()
+    return status
+
+class DBRunner:
+    """요청 세션에서 동기 ORM 코드를 실행
+
+    서비스 계층은 동기 Session 기준으로 작성되어 있으므로, 비동기 모드에서는
+    AsyncSession.run_sync로 이벤트 루프 위에서(스레드풀 없이) 실행하고
+    동기 모드에서는 기존 동기 엔드포인트처럼 스레드풀에서 실행한다.
+    fn의 첫 인자로 동기 Session이 전달된다. 지연 로딩은 fn 안에서만 가능하므로
+    응답에 필요한 값은 fn 안에서 만들어 반환해야 한다.
+    """
+
+    def __init__(self, session):
+        self.session = session
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        if DB_ASYNC:
+            return await self.session.run_sync(fn, *args, **kwargs)
+        return await run_in_threadpool(fn, self.session, *args, **kwargs)
+
+async def get_db_runner() -> AsyncIterator[DBRunner]:
+    """모드에 맞는 세션을 DBRunner로 감싸 제공하는 의존성"""
+    if DB_ASYNC:
+        async with AsyncSessionLocal() as session:
+            yield DBRunner(session)
+    else:
+        db = SessionLocal()
+        try:
+            yield DBRunner(db)
+        finally:
+            await run_in_threadpool(db.close)
+
+# ---- DB 왕복 횟수 측정 ----
+# 요청(또는 with 블록) 단위로 SQL 실행/커밋/롤백 횟수를 센다.
+# 카운터는 리스트 1칸으로 두어 스레드풀로 넘어간 동기 엔드포인트에서도 같은 값을 갱신한다.
+_round_trips: ContextVar[Optional[List[int]]] = ContextVar("db_round_trips", default=None)
+
+class RoundTripCounter:
+    def __init__(self, cell: List[int]):
+        self._cell = cell
+
+    @property
+    def count(self) -> int:
+        return self._cell[0]
+
+@contextmanager
+def count_round_trips() -> Iterator[RoundTripCounter]:
+    """블록 안에서 발생한 DB 왕복 횟수 측정"""
+    cell = [0]
+    token = _round_trips.set(cell)
+    try:
+        yield RoundTripCounter(cell)
+    finally:
+        _round_trips.reset(token)
+
+def _count_round_trip(*args, **kwargs):
+    cell = _round_trips.get()
+    if cell is not None:
+        cell[0] += 1
+
+for _event in ("before_cursor_execute", "commit", "rollback"):
+    event.listen(Engine, _event, _count_round_trip)
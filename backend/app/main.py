@@ -1,17 +1,24 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from .routers import clients, projects, work_logs, invoices
-from .routers import recommendations
-from .database import engine
+from .routers import aggregation, reference, recommendations, sync
+from .database import engine, count_round_trips, pool_status
+from .responses import FastJSONResponse
+from .compression import CompressionMiddleware
+from .services.recommendation_cache import get_recommendation_cache
 
 # 테이블은 이미 Supabase에서 생성되었으므로 create_all 제거
 
 app = FastAPI(
     title="건설업 현장 관리 시스템",
     description="현장 작업 단위 입력부터 청구서/세금계산서 출력까지 통합 관리",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=FastJSONResponse
 )
 
+# 1KB 이상 JSON/텍스트 응답은 brotli(지원 시) 또는 gzip으로 압축
+app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -19,26 +26,35 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-DB-Round-Trips", "X-Next-Cursor", "X-Results-Truncated"],
 )
 
-"""
-Note: some legacy routers are disabled below. The recommendations router is enabled
-to support labor-rate suggestions without affecting other endpoints.
-"""
-
-# app.include_router(clients.router, prefix="/api/clients", tags=["clients"])
-# app.include_router(projects.router, prefix="/api/projects", tags=["projects"])
-# app.include_router(work_logs.router, prefix="/api/work-logs", tags=["work-logs"])
-# app.include_router(invoices.router, prefix="/api/invoices", tags=["invoices"])
+@app.middleware("http")
+async def db_round_trip_header(request: Request, call_next):
+    """요청당 DB 왕복 횟수를 X-DB-Round-Trips 헤더로 노출"""
+    with count_round_trips() as counter:
+        response = await call_next(request)
+    response.headers["X-DB-Round-Trips"] = str(counter.count)
+    return response
 
-# Enable the new recommendation endpoints
+app.include_router(clients.router, prefix="/api/clients", tags=["clients"])
+app.include_router(projects.router, prefix="/api/projects", tags=["projects"])
+app.include_router(work_logs.router, prefix="/api/work-logs", tags=["work-logs"])
+app.include_router(invoices.router, prefix="/api/invoices", tags=["invoices"])
+app.include_router(aggregation.router, prefix="/api/aggregation", tags=["aggregation"])
+app.include_router(reference.router, prefix="/api/reference", tags=["reference"])
 app.include_router(recommendations.router, prefix="/api/recommendations", tags=["recommendations"])
 
-# Import additional routers (temporarily disabled due to missing dependencies)
-# from .routers import aggregation, pdf_export, reference
-# app.include_router(aggregation.router, prefix="/api/aggregation", tags=["aggregation"])
-# app.include_router(pdf_export.router, prefix="/api/export", tags=["export"])
-# app.include_router(reference.router, prefix="/api/reference", tags=["reference"])
+# 데스크톱 클라이언트 변경 동기화
+app.include_router(sync.router, prefix="/api/sync", tags=["sync"])
+
+# PDF 출력은 weasyprint(시스템 라이브러리 필요)가 설치된 경우에만 연결
+try:
+    from .routers import pdf_export
+except (ImportError, OSError):  # 패키지 또는 pango 등 시스템 라이브러리 없음
+    pdf_export = None
+if pdf_export is not None:
+    app.include_router(pdf_export.router, prefix="/api/export", tags=["export"])
 
 @app.get("/")
 async def root():
@@ -48,29 +64,23 @@ async def root():
 async def health_check():
     return {"status": "healthy"}
 
+@app.get("/health/db-pool")
+async def db_pool_metrics(reset: bool = False):
+    """커넥션 풀 현황 (대여 중/오버플로/대기시간/타임아웃, reset=true면 누적값 초기화)"""
+    return pool_status(reset=reset)
+
+@app.get("/health/recommendation-cache")
+async def recommendation_cache_metrics():
+    """단가 추천 캐시 적중/미적중/축출/무효화 카운터"""
+    return get_recommendation_cache().stats()
+
+@app.post("/health/recommendation-cache/clear")
+async def clear_recommendation_cache():
+    """단가 추천 캐시 전체 무효화 후 카운터 반환"""
+    cache = get_recommendation_cache()
+    cache.clear()
+    return cache.stats()
+
 @app.get("/api/test")
 async def test_api():
     return {"message": "API 연결 성공!", "status": "ok"}
-
-@app.get("/api/clients")
-async def get_clients_simple():
-    return {"clients": [], "message": "클라이언트 API 테스트 성공"}
-
-@app.post("/api/clients")
-async def create_client_simple(client_data: dict):
-    """간단한 클라이언트 생성 API (마이그레이션용)"""
-    try:
-        # 기본 ID 생성 (타임스탬프 기반)
-        import time
-        client_id = int(time.time() * 1000)
-        
-        response_data = {
-            "id": client_id,
-            "company_name": client_data.get("company_name"),
-            "message": "클라이언트 생성 성공 (임시)"
-        }
-        
-        print(f"📝 클라이언트 생성: {client_data.get('company_name')}")
-        return response_data
-    except Exception as e:
-        return {"error": str(e)}
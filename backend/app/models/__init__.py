@@ -8,6 +8,14 @@ from .material_entries import MaterialEntry
 from .invoices import Invoice
 from .invoice_lines import InvoiceLine
 from .reference_data import StdItem, StdEquipment
+from .cost_rollups import DailyCostRollup
+from .billing_runs import BillingRun, BillingRunItem
+from .progress_payments import ProgressPaymentLedger
+from .sync_tombstones import SyncTombstone
+from .table_versions import TableVersion
+from .project_archives import ProjectArchive
+from .labor_rate_stats import LaborRateStat
+from . import work_log_search  # noqa: F401  (검색 색인 DDL/동기화 리스너 등록)
 
 __all__ = [
     "Client",
@@ -20,5 +28,13 @@ __all__ = [
     "Invoice",
     "InvoiceLine",
     "StdItem",
-    "StdEquipment"
+    "StdEquipment",
+    "DailyCostRollup",
+    "BillingRun",
+    "BillingRunItem",
+    "ProgressPaymentLedger",
+    "SyncTombstone",
+    "TableVersion",
+    "ProjectArchive",
+    "LaborRateStat"
 ]
\ No newline at end of file
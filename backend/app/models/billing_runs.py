@@ -0,0 +1,50 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Numeric, Date, Enum, Text
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+from ..database import Base
+import enum
+
+class BillingRunStatus(str, enum.Enum):
+    PENDING = "pending"      # 대기
+    RUNNING = "running"      # 실행중
+    COMPLETED = "completed"  # 완료
+    PARTIAL = "partial"      # 일부 실패
+
+class BillingItemStatus(str, enum.Enum):
+    PENDING = "pending"      # 대기
+    SUCCEEDED = "succeeded"  # 청구서 발행
+    FAILED = "failed"        # 실패
+
+class BillingRun(Base):
+    """월말 일괄 청구 실행 단위"""
+    __tablename__ = "billing_runs"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    period_from = Column(Date, nullable=False)
+    period_to = Column(Date, nullable=False)
+    vat_rate = Column(Numeric(4, 2), default=10.0)
+    status = Column(Enum(BillingRunStatus), default=BillingRunStatus.PENDING, nullable=False)
+    
+    created_at = Column(DateTime, server_default=func.now())
+    heartbeat_at = Column(DateTime)  # 실행 중인 작업자가 주기적으로 갱신 (오래 멈추면 다른 작업자가 넘겨받음)
+    finished_at = Column(DateTime)
+    
+    # Relationships
+    items = relationship("BillingRunItem", back_populates="run", cascade="all, delete-orphan")
+
+class BillingRunItem(Base):
+    """일괄 청구 실행의 프로젝트별 처리 결과"""
+    __tablename__ = "billing_run_items"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    run_id = Column(Integer, ForeignKey("billing_runs.id"), nullable=False, index=True)
+    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
+    status = Column(Enum(BillingItemStatus), default=BillingItemStatus.PENDING, nullable=False)
+    invoice_id = Column(Integer, ForeignKey("invoices.id"))
+    attempts = Column(Integer, default=0, nullable=False)
+    error = Column(Text)
+    
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    
+    # Relationships
+    run = relationship("BillingRun", back_populates="items")
@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, DateTime
-from sqlalchemy.sql import func
+from sqlalchemy import BigInteger, Column, Integer, String, DateTime
+from sqlalchemy.sql import func, text
 from sqlalchemy.orm import relationship
 from ..database import Base
 
@@ -17,6 +17,7 @@ class Client(Base):
     
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    sync_version = Column(BigInteger, nullable=False, server_default=text("0"))  # 커밋 순서 변경 순번 (DB 트리거가 매김)
     
     # Relationships
     projects = relationship("Project", back_populates="client")
\ No newline at end of file
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, ForeignKey, Numeric, Date, Enum
+from ..database import Base
+import enum
+
+class CostCategory(str, enum.Enum):
+    LABOR = "labor"          # 노무비
+    EQUIPMENT = "equipment"  # 장비비
+    MATERIAL = "material"    # 자재비
+
+class DailyCostRollup(Base):
+    """프로젝트/일자/비용구분별 투입비 집계 (작업일지 저장 시 증분 갱신)"""
+    __tablename__ = "daily_cost_rollups"
+    
+    project_id = Column(Integer, ForeignKey("projects.id"), primary_key=True)
+    work_date = Column(Date, primary_key=True)
+    category = Column(Enum(CostCategory), primary_key=True)
+    amount = Column(Numeric(18, 5), nullable=False, default=0)  # 합계금액
+    row_count = Column(Integer, nullable=False, default=0)      # 투입 건수
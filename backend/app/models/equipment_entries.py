@@ -1,12 +1,16 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Numeric, Boolean
+from sqlalchemy import BigInteger, Column, Integer, String, ForeignKey, Numeric, Boolean, DateTime
+from sqlalchemy.sql import func, text
 from sqlalchemy.orm import relationship
 from ..database import Base
 
 class EquipmentEntry(Base):
     __tablename__ = "equipment_entries"
+    __table_args__ = {"sqlite_autoincrement": True}
+    # updated_at 서버 기본값을 INSERT마다 되읽지 않도록 (SQLite에서 행별 INSERT ... RETURNING 방지)
+    __mapper_args__ = {"eager_defaults": False}
     
     entry_id = Column(Integer, primary_key=True, index=True)
-    item_id = Column(Integer, ForeignKey("work_items.item_id"), nullable=False)
+    work_item_id = Column(Integer, ForeignKey("work_items.id"), nullable=False)
     equipment_code = Column(String, nullable=False, index=True)  # 장비코드 (27종 매핑)
     equipment_name = Column(String, nullable=False)
     specification = Column(String)  # 규격/톤수/붐길이
@@ -17,5 +21,8 @@ class EquipmentEntry(Base):
     mobilization_fee = Column(Numeric(10, 2), default=0)  # 이동/설치비
     total_cost = Column(Numeric(12, 2), nullable=False)  # 총비용
     
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())  # 변경 동기화용
+    sync_version = Column(BigInteger, nullable=False, server_default=text("0"))  # 커밋 순서 변경 순번 (DB 트리거가 매김)
+    
     # Relationships
     work_item = relationship("WorkItem", back_populates="equipment_entries")
\ No newline at end of file
@@ -6,7 +6,7 @@ class InvoiceLine(Base):
     __tablename__ = "invoice_lines"
     
     line_id = Column(Integer, primary_key=True, index=True)
-    invoice_id = Column(Integer, ForeignKey("invoices.invoice_id"), nullable=False)
+    invoice_id = Column(Integer, ForeignKey("invoices.id"), nullable=False)
     line_number = Column(Integer, nullable=False)  # 라인번호
     description = Column(String, nullable=False)   # 항목명
     quantity = Column(Numeric(10, 3))
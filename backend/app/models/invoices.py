@@ -24,6 +24,7 @@ class Invoice(Base):
     supply_amount = Column(Numeric(15, 2), nullable=False)  # 공급가액
     vat_amount = Column(Numeric(15, 2), nullable=False)     # 세액
     total_amount = Column(Numeric(15, 2), nullable=False)   # 합계
+    idempotency_key = Column(String, unique=True, index=True, nullable=True)  # 클라이언트 재시도 식별 키
     
     # Relationships
     project = relationship("Project", back_populates="invoices")
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Numeric, Enum
+from sqlalchemy import BigInteger, Column, Integer, String, ForeignKey, Numeric, Enum, DateTime
+from sqlalchemy.sql import func, text
 from sqlalchemy.orm import relationship
 from ..database import Base
 import enum
@@ -9,6 +10,9 @@ class RateType(str, enum.Enum):
 
 class LaborEntry(Base):
     __tablename__ = "labor_entries"
+    __table_args__ = {"sqlite_autoincrement": True}
+    # updated_at 서버 기본값을 INSERT마다 되읽지 않도록 (SQLite에서 행별 INSERT ... RETURNING 방지)
+    __mapper_args__ = {"eager_defaults": False}
     
     id = Column(Integer, primary_key=True, index=True)
     work_item_id = Column(Integer, ForeignKey("work_items.id"), nullable=False)
@@ -19,5 +23,8 @@ class LaborEntry(Base):
     unit_rate = Column(Numeric(10, 2), nullable=False)  # 단가
     total_cost = Column(Numeric(12, 2), nullable=False)  # 총비용
     
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())  # 변경 동기화용
+    sync_version = Column(BigInteger, nullable=False, server_default=text("0"))  # 커밋 순서 변경 순번 (DB 트리거가 매김)
+    
     # Relationships
     work_item = relationship("WorkItem", back_populates="labor_entries")
\ No newline at end of file
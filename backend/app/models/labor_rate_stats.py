@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Integer, String, Numeric, Date, Enum
+from ..database import Base
+from .labor_entries import RateType
+
+# 합계 행 표시 (NULL은 PK에 쓸 수 없어 0/빈 문자열로 둔다)
+ALL_PROJECTS = 0
+ALL_TASK_CODES = ""
+
+class LaborRateStat(Base):
+    """직종/단가유형/월별 단가 분포 (단가 값별 투입 건수, 단가 추천용 증분 집계)
+
+    단가는 사람이 정하는 값이라 종류가 적으므로 값별 건수를 그대로 두면 크기가 작고
+    월/프로젝트끼리 건수를 더해 합칠 수 있으며 분위수도 원천 데이터와 똑같이 나온다.
+    한 투입 내역은 세 단위에 한 번씩 더해진다:
+    (전체 프로젝트, 전체 작업코드), (프로젝트별, 전체 작업코드), (전체 프로젝트, 작업코드별)
+    """
+    __tablename__ = "labor_rate_stats"
+
+    trade = Column(String, primary_key=True)                            # 직종
+    rate_type = Column(Enum(RateType), primary_key=True)               # 원천 단가 유형
+    month = Column(Date, primary_key=True)                              # 작업월 1일
+    project_id = Column(Integer, primary_key=True, default=ALL_PROJECTS)
+    task_code = Column(String, primary_key=True, default=ALL_TASK_CODES)
+    unit_rate = Column(Numeric(10, 2), primary_key=True)                # 단가
+    entry_count = Column(Integer, nullable=False, default=0)            # 투입 건수
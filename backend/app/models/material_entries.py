@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Numeric, Enum
+from sqlalchemy import BigInteger, Column, Integer, String, ForeignKey, Numeric, Enum, DateTime
+from sqlalchemy.sql import func, text
 from sqlalchemy.orm import relationship
 from ..database import Base
 import enum
@@ -9,9 +10,12 @@ class StockType(str, enum.Enum):
 
 class MaterialEntry(Base):
     __tablename__ = "material_entries"
+    __table_args__ = {"sqlite_autoincrement": True}
+    # updated_at 서버 기본값을 INSERT마다 되읽지 않도록 (SQLite에서 행별 INSERT ... RETURNING 방지)
+    __mapper_args__ = {"eager_defaults": False}
     
     entry_id = Column(Integer, primary_key=True, index=True)
-    item_id = Column(Integer, ForeignKey("work_items.item_id"), nullable=False)
+    work_item_id = Column(Integer, ForeignKey("work_items.id"), nullable=False)
     material_code = Column(String, index=True)  # 표준품명/KS 코드
     material_name = Column(String, nullable=False)
     specification = Column(String)  # 규격
@@ -22,5 +26,8 @@ class MaterialEntry(Base):
     stock_type = Column(Enum(StockType), default=StockType.PURCHASE)
     supplier = Column(String)  # 공급처
     
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())  # 변경 동기화용
+    sync_version = Column(BigInteger, nullable=False, server_default=text("0"))  # 커밋 순서 변경 순번 (DB 트리거가 매김)
+    
     # Relationships
     work_item = relationship("WorkItem", back_populates="material_entries")
\ No newline at end of file
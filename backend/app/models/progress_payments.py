@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Numeric, UniqueConstraint
+from sqlalchemy.sql import func
+from ..database import Base
+
+class ProgressPaymentLedger(Base):
+    """프로젝트별 기성 원장 (차수마다 누적 기성액/선급금 공제/하자보수비 유보 기록)"""
+    __tablename__ = "progress_payment_ledger"
+    __table_args__ = (UniqueConstraint("project_id", "sequence", name="uq_progress_ledger_project_sequence"),)
+    
+    id = Column(Integer, primary_key=True, index=True)
+    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False, index=True)
+    sequence = Column(Integer, nullable=False)                 # 차수
+    invoice_id = Column(Integer, ForeignKey("invoices.id"))    # 연결 청구서
+    progress_rate = Column(Numeric(5, 2), nullable=False)      # 누적 기성율 %
+    
+    contract_amount = Column(Numeric(15, 2), nullable=False)    # 계약금액 (차수 시점)
+    cumulative_amount = Column(Numeric(15, 2), nullable=False)  # 누적 기성액
+    advance_deduction = Column(Numeric(15, 2), nullable=False)  # 선급금 공제 누계
+    defect_retention = Column(Numeric(15, 2), nullable=False)   # 하자보수비 유보 누계
+    current_payment = Column(Numeric(15, 2), nullable=False)    # 당회 기성액
+    cumulative_paid = Column(Numeric(15, 2), nullable=False)    # 기지급 누계 (당회 포함)
+    
+    created_at = Column(DateTime, server_default=func.now())
@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Enum
+from sqlalchemy.sql import func
+from ..database import Base
+import enum
+
+class ArchiveStatus(str, enum.Enum):
+    ARCHIVING = "archiving"  # 보관 DB로 옮기는 중 (중단되면 다시 실행)
+    ARCHIVED = "archived"    # 상세 행이 모두 보관 DB에 있음
+    RESTORING = "restoring"  # 운영 DB로 되돌리는 중
+
+class ProjectArchive(Base):
+    """보관(콜드 스토리지)으로 옮긴 프로젝트 (작업일지/작업항목/투입 상세는 보관 DB, 집계는 운영 DB에 유지)"""
+    __tablename__ = "project_archives"
+
+    project_id = Column(Integer, ForeignKey("projects.id"), primary_key=True)
+    status = Column(Enum(ArchiveStatus), nullable=False)
+    work_logs_count = Column(Integer, nullable=False, default=0)
+    work_items_count = Column(Integer, nullable=False, default=0)
+    entries_count = Column(Integer, nullable=False, default=0)  # 노무/장비/자재 투입 합계
+    archived_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
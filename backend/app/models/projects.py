@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Numeric, Enum
-from sqlalchemy.sql import func
+from sqlalchemy import BigInteger, Column, Integer, String, DateTime, ForeignKey, Numeric, Enum
+from sqlalchemy.sql import func, text
 from sqlalchemy.orm import relationship
 from ..database import Base
 import enum
@@ -23,6 +23,7 @@ class Project(Base):
     
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    sync_version = Column(BigInteger, nullable=False, server_default=text("0"))  # 커밋 순서 변경 순번 (DB 트리거가 매김)
     
     # Relationships
     client = relationship("Client", back_populates="projects")
@@ -0,0 +1,109 @@
+"""
+변경 동기화 추적 (삭제 톰스톤 + 커밋 순서 변경 순번)
+
+동기화 대상 테이블과 톰스톤의 sync_version은 행을 넣거나 바꿀 때 DB 트리거가 매긴다.
+시각(updated_at)은 트랜잭션 시작 시각이라 오래 걸린 트랜잭션이 이미 지난 워터마크보다
+이른 시각으로 커밋될 수 있지만, sync_version은 아래 상한과 함께 쓰면 커밋 순서를 따른다.
+
+- PostgreSQL: 쓰는 트랜잭션의 ID(pg_current_xact_id). 상한은 현재 스냅숏의 xmin으로,
+  그보다 작은 ID의 트랜잭션은 모두 끝났으므로 상한 아래 행은 이후에 새로 보이지 않는다.
+- SQLite: 쓰기 트랜잭션이 직렬화되므로 sync_clock 카운터를 행마다 올려 매긴다.
+  상한은 커밋된 카운터 + 1.
+"""
+from sqlalchemy import BigInteger, Column, Integer, String, DateTime, Index, event, text
+from sqlalchemy.sql import func
+from sqlalchemy.orm import Session
+from ..database import Base
+
+# 변경 동기화 대상 테이블 (삭제 시 톰스톤을 남긴다)
+SYNC_TABLES = (
+    "clients",
+    "projects",
+    "work_logs",
+    "work_items",
+    "labor_entries",
+    "equipment_entries",
+    "material_entries",
+)
+
+SYNC_CLOCK_TABLE = "sync_clock"
+
+class SyncTombstone(Base):
+    """동기화 대상 행의 삭제 기록 (클라이언트가 로컬 사본에서 지울 수 있도록)"""
+    __tablename__ = "sync_tombstones"
+    __table_args__ = (
+        Index("ix_sync_tombstones_version", "sync_version", "id"),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    entity = Column(String, nullable=False)      # 테이블명
+    entity_id = Column(Integer, nullable=False)  # 삭제된 행의 PK
+    deleted_at = Column(DateTime, nullable=False, default=func.now(), server_default=func.now())
+    sync_version = Column(BigInteger, nullable=False, server_default=text("0"))
+
+def _trigger_ddl(dialect: str, table_name: str):
+    if dialect == "postgresql":
+        return [
+            f"DROP TRIGGER IF EXISTS trg_{table_name}_sync_version ON {table_name}",
+            f"CREATE TRIGGER trg_{table_name}_sync_version BEFORE INSERT OR UPDATE ON {table_name} "
+            f"FOR EACH ROW EXECUTE FUNCTION sync_version_stamp()",
+        ]
+    stamp = (
+        f"UPDATE {SYNC_CLOCK_TABLE} SET version = version + 1; "
+        f"UPDATE {table_name} SET sync_version = (SELECT version FROM {SYNC_CLOCK_TABLE}) WHERE rowid = NEW.rowid; "
+    )
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS trg_{table_name}_sync_insert AFTER INSERT ON {table_name} "
+        f"BEGIN {stamp}END",
+        # 삽입 트리거가 순번을 매기는 UPDATE에는 다시 반응하지 않도록
+        f"CREATE TRIGGER IF NOT EXISTS trg_{table_name}_sync_update AFTER UPDATE ON {table_name} "
+        f"WHEN NEW.sync_version IS OLD.sync_version BEGIN {stamp}END",
+    ]
+
+def create_sync_triggers(connection) -> None:
+    """sync_version을 매기는 트리거 생성 (이미 있으면 그대로)"""
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        connection.execute(text(
+            "CREATE OR REPLACE FUNCTION sync_version_stamp() RETURNS trigger AS $$ "
+            "BEGIN NEW.sync_version := pg_current_xact_id()::text::bigint; RETURN NEW; END "
+            "$$ LANGUAGE plpgsql"
+        ))
+    elif dialect == "sqlite":
+        connection.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {SYNC_CLOCK_TABLE} "
+            f"(id INTEGER PRIMARY KEY CHECK (id = 1), version INTEGER NOT NULL)"
+        ))
+        connection.execute(text(f"INSERT OR IGNORE INTO {SYNC_CLOCK_TABLE} (id, version) VALUES (1, 0)"))
+    else:
+        return
+    for table_name in (*SYNC_TABLES, SyncTombstone.__tablename__):
+        for statement in _trigger_ddl(dialect, table_name):
+            connection.execute(text(statement))
+
+def sync_upper_bound(connection) -> int:
+    """이 값보다 작은 sync_version은 모두 커밋됐다 (동기화 구간의 배타적 상한)"""
+    if connection.dialect.name == "postgresql":
+        return connection.execute(text("SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint")).scalar()
+    return connection.execute(text(f"SELECT version + 1 FROM {SYNC_CLOCK_TABLE}")).scalar()
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_with_metadata(target, connection, **kw):
+    create_sync_triggers(connection)
+
+@event.listens_for(Base.metadata, "after_drop")
+def _drop_with_metadata(target, connection, **kw):
+    if connection.dialect.name == "postgresql":
+        connection.execute(text("DROP FUNCTION IF EXISTS sync_version_stamp()"))
+    else:
+        connection.execute(text(f"DROP TABLE IF EXISTS {SYNC_CLOCK_TABLE}"))
+
+@event.listens_for(Session, "before_flush")
+def _record_tombstones(session, flush_context, instances):
+    """ORM으로 삭제되는 동기화 대상 행마다 같은 트랜잭션에 톰스톤 추가 (Core 일괄 삭제는 직접 기록)"""
+    for obj in list(session.deleted):
+        table = getattr(obj, "__tablename__", None)
+        if table not in SYNC_TABLES:
+            continue
+        identity = session.identity_key(instance=obj)[1]
+        session.add(SyncTombstone(entity=table, entity_id=identity[0]))
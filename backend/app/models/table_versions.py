@@ -0,0 +1,73 @@
+import logging
+from sqlalchemy import Column, Integer, String, event
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from ..database import Base
+
+logger = logging.getLogger(__name__)
+
+# 조건부 GET(ETag)용 버전 카운터를 두는 테이블
+VERSIONED_TABLES = frozenset({"clients", "projects", "invoices", "invoice_lines"})
+
+class TableVersion(Base):
+    """테이블별 변경 카운터 (해당 테이블에 쓰기가 있는 트랜잭션이 커밋될 때마다 1 증가)"""
+    __tablename__ = "table_versions"
+    
+    table_name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+def bump_table_versions(connection, table_names) -> None:
+    """테이블 버전 증가 (ORM을 거치지 않는 Core 일괄 쓰기는 커밋 후 직접 호출)"""
+    rows = [{"table_name": name, "version": 1} for name in sorted(set(table_names) & VERSIONED_TABLES)]
+    if not rows:
+        return
+    if connection.dialect.name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+
+    stmt = dialect_insert(TableVersion)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[TableVersion.table_name],
+        set_={"version": TableVersion.version + 1}
+    )
+    connection.execute(stmt, rows)
+
+# 커밋 후 올릴 테이블 (session.info 키)
+_PENDING = "table_versions"
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_tables(session, flush_context):
+    """flush에서 추가/변경/삭제된 행의 테이블을 모아 두었다가 커밋 후에 버전을 올린다"""
+    touched = {getattr(obj, "__tablename__", None) for obj in session.new}
+    touched |= {getattr(obj, "__tablename__", None) for obj in session.deleted}
+    touched |= {
+        getattr(obj, "__tablename__", None) for obj in session.dirty
+        if session.is_modified(obj, include_collections=False)
+    }
+    touched &= VERSIONED_TABLES
+    if touched:
+        session.info.setdefault(_PENDING, set()).update(touched)
+
+@event.listens_for(Session, "after_commit")
+def _bump_committed_tables(session):
+    """커밋된 테이블의 버전을 별도의 짧은 트랜잭션으로 증가
+
+    쓰기 트랜잭션 안에서 올리면 PostgreSQL에서 카운터 행이 커밋까지 잠겨 같은 테이블에 쓰는
+    트랜잭션(일괄 청구 워커 등)이 모두 줄을 선다. 커밋과 증가 사이의 짧은 틈에는 새 데이터가
+    옛 ETag로 나갈 수 있지만 증가 후 첫 요청에서 바로 바뀐다. 데이터는 이미 커밋됐으므로
+    증가에 실패해도 요청을 실패시키지 않는다 (다음 쓰기에서 다시 바뀐다).
+    """
+    touched = session.info.pop(_PENDING, None)
+    if not touched:
+        return
+    try:
+        with session.get_bind().engine.connect() as connection:
+            bump_table_versions(connection, touched)
+            connection.commit()
+    except SQLAlchemyError:
+        logger.exception("테이블 버전 증가 실패: %s", sorted(touched))
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_tables(session):
+    session.info.pop(_PENDING, None)
@@ -1,9 +1,13 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Numeric, Text
+from sqlalchemy import BigInteger, Column, Integer, String, ForeignKey, Numeric, Text, DateTime
+from sqlalchemy.sql import func, text
 from sqlalchemy.orm import relationship
 from ..database import Base
 
 class WorkItem(Base):
     __tablename__ = "work_items"
+    __table_args__ = {"sqlite_autoincrement": True}
+    # updated_at 서버 기본값을 INSERT마다 되읽지 않도록 (SQLite에서 행별 INSERT ... RETURNING 방지)
+    __mapper_args__ = {"eager_defaults": False}
     
     id = Column(Integer, primary_key=True, index=True)
     work_log_id = Column(Integer, ForeignKey("work_logs.id"), nullable=False)
@@ -15,6 +19,9 @@ class WorkItem(Base):
     progress_rate = Column(Numeric(5, 2), default=100.00)  # 진행률 %
     notes = Column(Text)
     
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())  # 변경 동기화용
+    sync_version = Column(BigInteger, nullable=False, server_default=text("0"))  # 커밋 순서 변경 순번 (DB 트리거가 매김)
+    
     # Relationships
     work_log = relationship("WorkLog", back_populates="work_items")
     labor_entries = relationship("LaborEntry", back_populates="work_item")
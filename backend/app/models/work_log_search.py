@@ -0,0 +1,226 @@
+"""
+작업일지 전문 검색 색인 (work_log_search)
+
+작업일지 1건당 문서 1개: 작업일지의 구역/공정상태/비고와 작업항목의 작업명/규격.
+한국어는 조사·복합어가 붙어 띄어쓰기 단위로는 찾을 수 없으므로 한글 연속 구간을
+2글자 겹침(bigram) + 마지막 글자로 나눠 색인한다 ("방수공사" → 방수 수공 공사 사).
+영문/숫자는 소문자 단어 그대로 둔다. 이렇게 나눈 토큰을 공백으로 이어 저장하므로
+DB 쪽 토크나이저는 공백으로만 나누면 된다.
+
+- SQLite: FTS5 가상 테이블 (rowid = 작업일지 ID, bm25 순위)
+- PostgreSQL: tsvector('simple') + GIN 인덱스 (ts_rank_cd 순위)
+
+ORM으로 작업일지/작업항목을 쓰면 커밋 직전에 같은 트랜잭션에서 색인을 갱신한다.
+Core로 직접 넣거나 지운 행은 reindex_work_logs()로 알려 줘야 한다.
+"""
+import re
+from typing import Dict, Iterable, List, Optional, Set
+from sqlalchemy import bindparam, event, inspect, select, text
+from sqlalchemy.orm import Session
+from ..database import Base
+from .work_logs import WorkLog
+from .work_items import WorkItem
+
+SEARCH_TABLE = "work_log_search"
+
+_TOKEN_RUNS = re.compile(r"[가-힣]+|[0-9A-Za-z]+")
+
+# 색인 문서에 들어가는 컬럼 (이 값이 바뀔 때만 다시 색인)
+_WORK_LOG_FIELDS = ("area", "process_status", "notes")
+_WORK_ITEM_FIELDS = ("task_name", "specification", "work_log_id")
+
+_DDL = {
+    "sqlite": [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(body, tokenize='unicode61')",
+    ],
+    "postgresql": [
+        f"CREATE TABLE IF NOT EXISTS {SEARCH_TABLE} ("
+        f"work_log_id INTEGER PRIMARY KEY REFERENCES work_logs(id) ON DELETE CASCADE, "
+        f"document TSVECTOR NOT NULL)",
+        f"CREATE INDEX IF NOT EXISTS ix_{SEARCH_TABLE}_document ON {SEARCH_TABLE} USING gin (document)",
+    ],
+}
+
+# 커밋 때 반영할 색인 변경 (session.info 키)
+_PENDING = "work_log_search"
+
+
+def search_tokens(value: Optional[str], query: bool = False) -> List[str]:
+    """색인/검색 토큰
+
+    query=True면 검색어용: 마지막 한글 구간의 끝 글자는 빼서 마지막 bigram이
+    이어지는 글자와도 접두어로 맞도록 한다 ("방수" → 방수*, "방수공사"의 방수와 일치).
+    """
+    runs = _TOKEN_RUNS.findall(value or "")
+    tokens = []
+    for i, run in enumerate(runs):
+        if run.isascii():
+            tokens.append(run.lower())
+            continue
+        tokens.extend(run[j:j + 2] for j in range(len(run) - 1))
+        if not (query and i == len(runs) - 1 and len(run) > 1):
+            tokens.append(run[-1])
+    return tokens
+
+
+def document_body(work_log: Dict, work_items: Iterable[Dict]) -> str:
+    parts = [work_log.get(field) for field in _WORK_LOG_FIELDS]
+    for item in work_items:
+        parts += [item.get("task_name"), item.get("specification")]
+    return " ".join(token for part in parts if part for token in search_tokens(part))
+
+
+def create_search_index(connection) -> None:
+    """검색 색인 테이블 생성 (이미 있으면 그대로)"""
+    for statement in _DDL.get(connection.dialect.name, []):
+        connection.execute(text(statement))
+
+
+def reindex_work_logs(session: Session, work_log_ids: Iterable[int]) -> None:
+    """Core로 쓴 작업일지를 커밋 때 DB에서 다시 읽어 색인하도록 예약"""
+    pending = _pending(session)
+    for work_log_id in work_log_ids:
+        pending["fresh"].pop(work_log_id, None)
+        pending["fetch"].add(work_log_id)
+
+
+def rebuild_search_index(connection, batch_size: int = 1000) -> int:
+    """전체 작업일지 재색인 (색인 도입/복구용), 색인한 건수 반환"""
+    count = 0
+    last_id = 0
+    while True:
+        ids = connection.execute(
+            select(WorkLog.id).where(WorkLog.id > last_id).order_by(WorkLog.id).limit(batch_size)
+        ).scalars().all()
+        if not ids:
+            return count
+        documents = _fetch_documents(connection, ids)
+        _write_documents(connection, documents, removed=set(), created=set())
+        count += len(documents)
+        last_id = ids[-1]
+
+
+def _pending(session: Session) -> Dict:
+    # fresh: 이 트랜잭션에서 새로 만든 작업일지 → (객체, 새 작업항목들), 메모리에서 문서를 만든다
+    # fetch: DB에서 다시 읽어 색인할 작업일지 ID, deleted: 색인에서 뺄 ID
+    return session.info.setdefault(_PENDING, {"fresh": {}, "fetch": set(), "deleted": set()})
+
+
+def _changed(obj, fields) -> bool:
+    state = inspect(obj)
+    return any(state.attrs[field].history.has_changes() for field in fields)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_with_metadata(target, connection, **kw):
+    create_search_index(connection)
+
+
+@event.listens_for(Base.metadata, "before_drop")
+def _drop_with_metadata(target, connection, **kw):
+    connection.execute(text(f"DROP TABLE IF EXISTS {SEARCH_TABLE}"))
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session, flush_context):
+    """flush된 작업일지/작업항목에서 색인 대상 작업일지 ID를 모은다"""
+    if not any(isinstance(obj, (WorkLog, WorkItem)) for obj in (*session.new, *session.dirty, *session.deleted)):
+        return
+    pending = _pending(session)
+    fresh, fetch, deleted = pending["fresh"], pending["fetch"], pending["deleted"]
+
+    def refetch(work_log_id):
+        if work_log_id is not None:
+            fresh.pop(work_log_id, None)
+            fetch.add(work_log_id)
+
+    for obj in session.new:
+        if isinstance(obj, WorkLog):
+            fresh[obj.id] = (obj, [])
+    for obj in session.new:
+        if isinstance(obj, WorkItem):
+            if obj.work_log_id in fresh:
+                fresh[obj.work_log_id][1].append(obj)
+            else:
+                refetch(obj.work_log_id)
+    for obj in session.dirty:
+        if isinstance(obj, WorkLog) and obj.id not in fresh and _changed(obj, _WORK_LOG_FIELDS):
+            refetch(obj.id)
+        elif isinstance(obj, WorkItem) and _changed(obj, _WORK_ITEM_FIELDS):
+            # 다른 작업일지로 옮긴 작업항목은 이전 작업일지도 다시 색인
+            for work_log_id in (obj.work_log_id, *inspect(obj).attrs.work_log_id.history.deleted):
+                refetch(work_log_id)
+    for obj in session.deleted:
+        if isinstance(obj, WorkLog):
+            fresh.pop(obj.id, None)
+            fetch.discard(obj.id)
+            deleted.add(obj.id)
+        elif isinstance(obj, WorkItem) and obj.work_log_id not in deleted:
+            refetch(obj.work_log_id)
+
+
+@event.listens_for(Session, "before_commit")
+def _apply_changes(session):
+    """커밋 직전 같은 트랜잭션에서 색인 반영"""
+    session.flush()
+    pending = session.info.pop(_PENDING, None)
+    if not pending:
+        return
+    fetch = pending["fetch"] - pending["deleted"]
+    documents = {
+        work_log_id: document_body(
+            {field: getattr(work_log, field) for field in _WORK_LOG_FIELDS},
+            ({"task_name": item.task_name, "specification": item.specification} for item in items)
+        )
+        for work_log_id, (work_log, items) in pending["fresh"].items()
+    }
+    connection = session.connection()
+    fetched = _fetch_documents(connection, fetch) if fetch else {}
+    documents.update(fetched)
+    removed = pending["deleted"] | (fetch - fetched.keys())
+    _write_documents(connection, documents, removed, created=set(pending["fresh"]))
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_changes(session, transaction):
+    """롤백으로 끝난 트랜잭션의 예약은 버린다 (SAVEPOINT 롤백은 커밋 때 DB에서 다시 확인)"""
+    if transaction.parent is None:
+        session.info.pop(_PENDING, None)
+
+
+def _fetch_documents(connection, work_log_ids) -> Dict[int, str]:
+    ids = list(work_log_ids)
+    logs = connection.execute(
+        select(WorkLog.id, *(getattr(WorkLog, field) for field in _WORK_LOG_FIELDS)).where(WorkLog.id.in_(ids))
+    ).mappings().all()
+    items: Dict[int, List] = {}
+    for row in connection.execute(
+        select(WorkItem.work_log_id, WorkItem.task_name, WorkItem.specification)
+        .where(WorkItem.work_log_id.in_(ids)).order_by(WorkItem.id)
+    ).mappings():
+        items.setdefault(row["work_log_id"], []).append(row)
+    return {row["id"]: document_body(row, items.get(row["id"], [])) for row in logs}
+
+
+def _write_documents(connection, documents: Dict[int, str], removed: Set[int], created: Set[int]) -> None:
+    """문서 교체/삭제 (created는 색인에 아직 없는 것이 확실한 ID)"""
+    delete = text(f"DELETE FROM {SEARCH_TABLE} WHERE "
+                  f"{'rowid' if connection.dialect.name == 'sqlite' else 'work_log_id'} IN :ids")
+    delete = delete.bindparams(bindparam("ids", expanding=True))
+    rows = [{"id": work_log_id, "body": body} for work_log_id, body in documents.items()]
+
+    if connection.dialect.name == "sqlite":
+        stale = removed | (documents.keys() - created)
+        if stale:
+            connection.execute(delete, {"ids": list(stale)})
+        if rows:
+            connection.execute(text(f"INSERT INTO {SEARCH_TABLE} (rowid, body) VALUES (:id, :body)"), rows)
+        return
+
+    if removed:
+        connection.execute(delete, {"ids": list(removed)})
+    if rows:
+        connection.execute(text(
+            f"INSERT INTO {SEARCH_TABLE} (work_log_id, document) VALUES (:id, to_tsvector('simple', :body)) "
+            f"ON CONFLICT (work_log_id) DO UPDATE SET document = EXCLUDED.document"
+        ), rows)
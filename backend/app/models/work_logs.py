@@ -1,10 +1,12 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Date, Text
-from sqlalchemy.sql import func
+from sqlalchemy import BigInteger, Column, Integer, String, DateTime, ForeignKey, Date, Text
+from sqlalchemy.sql import func, text
 from sqlalchemy.orm import relationship
 from ..database import Base
 
 class WorkLog(Base):
     __tablename__ = "work_logs"
+    # 보관으로 최근 ID가 비어도 SQLite가 그 번호를 다시 쓰지 않도록 (하위 테이블도 같음, 복원 시 ID 충돌 방지)
+    __table_args__ = {"sqlite_autoincrement": True}
     
     id = Column(Integer, primary_key=True, index=True)
     project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
@@ -16,6 +18,7 @@ class WorkLog(Base):
     
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    sync_version = Column(BigInteger, nullable=False, server_default=text("0"))  # 커밋 순서 변경 순번 (DB 트리거가 매김)
     
     # Relationships
     project = relationship("Project", back_populates="work_logs")
@@ -0,0 +1,34 @@
+"""
+orjson 기반 JSON 응답
+
+FastAPI 기본 JSONResponse(json.dumps)보다 빠르게 직렬화한다. date/datetime/UUID/Enum/dataclass는
+orjson이 직접 처리하고, Decimal은 jsonable_encoder와 같은 규칙(정수면 int, 아니면 float)으로
+바꿔 기존 응답 형식을 유지한다. 그 밖의 타입(pydantic 모델 등)은 jsonable_encoder로 넘긴다.
+
+response_model이 없는 엔드포인트는 dict를 그대로 반환하면 FastAPI가 jsonable_encoder로
+전체를 한 번 더 훑으므로, 큰 응답은 FastJSONResponse(content)를 직접 반환해 그 단계를 건너뛴다.
+"""
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.encoders import decimal_encoder, jsonable_encoder
+from fastapi.responses import JSONResponse
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, Decimal):
+        return decimal_encoder(obj)
+    return jsonable_encoder(obj)
+
+
+def dumps(content: Any) -> bytes:
+    """응답 본문 직렬화 (dict의 int/date 키도 허용)"""
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONResponse(JSONResponse):
+    """앱 기본 응답 클래스 (main.py의 default_response_class)"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -1,26 +1,38 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from typing import Optional
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Query
+from pydantic import BaseModel
+from typing import List, Optional
 from datetime import date
 from decimal import Decimal
-from ..database import get_db
-from ..services.invoice_service import InvoiceAggregationService
+from ..database import DBRunner, get_db_runner
+from ..responses import FastJSONResponse
+from ..services.invoice_service import (
+    DuplicateInvoiceNumberError, IdempotencyKeyConflictError, InvoiceAggregationService
+)
 from ..services.calculation_service import CostCalculationService
+from ..services.batch_calculation_service import BatchCostCalculator
+from ..services.rollup_service import CostRollupService, TimeBucket
+from ..services.breakdown_service import BreakdownDimension, BreakdownSort, CostBreakdownService
+from ..services.progress_payment_service import ProgressPaymentService
+from ..services.billing_service import BatchBillingService, BillingRunInProgressError, execute_billing_run
+from ..models.cost_rollups import CostCategory
 
 router = APIRouter()
 
+MAX_BATCH_ROWS = 50000
+
 @router.get("/projects/{project_id}/cost-summary")
-def get_project_cost_summary(
+async def get_project_cost_summary(
     project_id: int,
     period_from: date = Query(..., description="집계 시작일"),
     period_to: date = Query(..., description="집계 종료일"),
-    db: Session = Depends(get_db)
+    db: DBRunner = Depends(get_db_runner)
 ):
     """프로젝트별 비용 집계 조회"""
     try:
-        service = InvoiceAggregationService(db)
-        aggregation = service.aggregate_work_costs(project_id, period_from, period_to)
-        
+        aggregation = await db.run(
+            lambda session: InvoiceAggregationService(session).aggregate_work_costs(project_id, period_from, period_to)
+        )
+
         return {
             "project_id": project_id,
             "period_from": period_from,
@@ -31,45 +43,308 @@ def get_project_cost_summary(
                 "material_cost": float(aggregation['material_cost']),
                 "total_supply_amount": float(aggregation['total_supply_amount'])
             },
-            "work_logs_count": len(aggregation['work_logs']),
-            "work_items_count": len(aggregation['work_items'])
+            "work_logs_count": aggregation['work_logs_count'],
+            "work_items_count": aggregation['work_items_count']
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"집계 중 오류가 발생했습니다: {str(e)}")
+
+@router.get("/projects/{project_id}/cost-timeseries")
+async def get_project_cost_timeseries(
+    project_id: int,
+    period_from: date = Query(..., description="집계 시작일"),
+    period_to: date = Query(..., description="집계 종료일"),
+    bucket: TimeBucket = Query(TimeBucket.DAY, description="집계 단위 (day/week/month)"),
+    db: DBRunner = Depends(get_db_runner)
+):
+    """프로젝트별 구간(일/주/월) 비용 추이와 누적 합계"""
+    if period_from > period_to:
+        raise HTTPException(status_code=400, detail="집계 시작일이 종료일보다 늦습니다")
+    try:
+        series = await db.run(
+            lambda session: CostRollupService(session).time_series(project_id, period_from, period_to, bucket)
+        )
+
+        def cost_summary(amounts):
+            return {
+                "labor_cost": float(amounts[CostCategory.LABOR]),
+                "equipment_cost": float(amounts[CostCategory.EQUIPMENT]),
+                "material_cost": float(amounts[CostCategory.MATERIAL]),
+                "total_supply_amount": float(sum(amounts.values()))
+            }
+
+        return FastJSONResponse({
+            "project_id": project_id,
+            "period_from": period_from,
+            "period_to": period_to,
+            "bucket": bucket.value,
+            "buckets": [
+                {
+                    "bucket_start": point['bucket_start'],
+                    "bucket_end": point['bucket_end'],
+                    "cost_summary": cost_summary(point['amounts']),
+                    "cumulative": cost_summary(point['cumulative']),
+                    "entries_count": point['entries_count']
+                }
+                for point in series
+            ]
+        })
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"집계 중 오류가 발생했습니다: {str(e)}")
+
+@router.get("/projects/{project_id}/cost-breakdown")
+async def get_project_cost_breakdown(
+    project_id: int,
+    dimension: BreakdownDimension = Query(..., description="집계 기준 (trade/equipment_code/material_code/supplier)"),
+    period_from: date = Query(..., description="집계 시작일"),
+    period_to: date = Query(..., description="집계 종료일"),
+    sort: BreakdownSort = Query(BreakdownSort.AMOUNT, description="정렬 (amount: 금액순, key: 키순)"),
+    limit: int = Query(20, ge=1, le=CostBreakdownService.MAX_LIMIT, description="페이지 크기 (상위 N건)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    db: DBRunner = Depends(get_db_runner)
+):
+    """직종/장비코드/자재코드/공급처별 비용 상세 (키셋 페이지네이션)"""
+    try:
+        page = await db.run(lambda session: CostBreakdownService(session).breakdown(
+            project_id, period_from, period_to, dimension, sort=sort, limit=limit, cursor=cursor
+        ))
+        return FastJSONResponse({
+            "project_id": project_id,
+            "period_from": period_from,
+            "period_to": period_to,
+            "dimension": dimension.value,
+            "sort": sort.value,
+            "items": [
+                {
+                    "key": item['key'],
+                    "label": item['label'],
+                    "amount": float(item['amount']),
+                    "entries_count": item['entries_count']
+                }
+                for item in page['items']
+            ],
+            "next_cursor": page['next_cursor']
+        })
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"집계 중 오류가 발생했습니다: {str(e)}")
+
+class PortfolioCostSummaryRequest(BaseModel):
+    period_from: date
+    period_to: date
+    project_ids: Optional[List[int]] = None  # 생략 시 기간 내 투입 이력이 있는 전체 프로젝트
+
+@router.post("/portfolio/cost-summary")
+async def get_portfolio_cost_summary(request: PortfolioCostSummaryRequest, db: DBRunner = Depends(get_db_runner)):
+    """여러 프로젝트의 비용 집계를 한 번에 조회 (프로젝트별 + 전체 합계)"""
+    try:
+        project_ids = sorted(set(request.project_ids)) if request.project_ids is not None else None
+        totals = await db.run(
+            lambda session: CostRollupService(session).summarize_projects(project_ids, request.period_from, request.period_to)
+        )
+
+        def cost_summary(by_category):
+            amounts = {category: by_category.get(category, (Decimal('0'), 0))[0] for category in CostCategory}
+            return {
+                "labor_cost": float(amounts[CostCategory.LABOR]),
+                "equipment_cost": float(amounts[CostCategory.EQUIPMENT]),
+                "material_cost": float(amounts[CostCategory.MATERIAL]),
+                "total_supply_amount": float(sum(amounts.values()))
+            }
+
+        grand_total: dict = {}
+        projects = []
+        for project_id in (project_ids if project_ids is not None else sorted(totals)):
+            by_category = totals.get(project_id, {})
+            for category, (amount, count) in by_category.items():
+                prev_amount, prev_count = grand_total.get(category, (Decimal('0'), 0))
+                grand_total[category] = (prev_amount + amount, prev_count + count)
+            projects.append({
+                "project_id": project_id,
+                "cost_summary": cost_summary(by_category),
+                "entries_count": sum(count for _, count in by_category.values())
+            })
+
+        return {
+            "period_from": request.period_from,
+            "period_to": request.period_to,
+            "projects_count": len(projects),
+            "projects": projects,
+            "grand_total": cost_summary(grand_total)
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"집계 중 오류가 발생했습니다: {str(e)}")
 
 @router.post("/projects/{project_id}/generate-invoice")
-def generate_invoice_from_work_logs(
+async def generate_invoice_from_work_logs(
     project_id: int,
     period_from: date,
     period_to: date,
-    sequence: int = 1,
+    sequence: Optional[int] = Query(None, description="청구 차수 (생략 시 다음 차수 자동 할당)"),
     vat_rate: Optional[float] = 10.0,
-    db: Session = Depends(get_db)
+    idempotency_key: Optional[str] = Header(None, description="재시도 시 같은 청구서를 돌려받기 위한 키"),
+    db: DBRunner = Depends(get_db_runner)
 ):
     """작업일지 기반 청구서 자동 생성"""
-    try:
-        service = InvoiceAggregationService(db)
-        invoice = service.create_invoice_from_aggregation(
+    def create(session):
+        invoice = InvoiceAggregationService(session).create_invoice_from_aggregation(
             project_id=project_id,
             period_from=period_from,
             period_to=period_to,
             sequence=sequence,
-            vat_rate=Decimal(str(vat_rate))
+            vat_rate=Decimal(str(vat_rate)),
+            idempotency_key=idempotency_key
         )
-        
+        # 커밋 후 만료된 속성은 세션 작업 안에서 다시 읽는다
         return {
             "message": "청구서가 성공적으로 생성되었습니다",
-            "invoice_id": invoice.invoice_id,
+            "invoice_id": invoice.id,
             "invoice_number": invoice.invoice_number,
             "total_amount": float(invoice.total_amount),
             "supply_amount": float(invoice.supply_amount),
             "vat_amount": float(invoice.vat_amount)
         }
+
+    try:
+        return await db.run(create)
+    except (DuplicateInvoiceNumberError, IdempotencyKeyConflictError) as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"청구서 생성 중 오류가 발생했습니다: {str(e)}")
 
+def _ledger_entry_dict(entry) -> dict:
+    return {
+        "sequence": entry.sequence,
+        "invoice_id": entry.invoice_id,
+        "progress_rate": float(entry.progress_rate),
+        "contract_amount": float(entry.contract_amount),
+        "cumulative_amount": float(entry.cumulative_amount),
+        "advance_deduction": float(entry.advance_deduction),
+        "defect_retention": float(entry.defect_retention),
+        "current_payment": float(entry.current_payment),
+        "cumulative_paid": float(entry.cumulative_paid)
+    }
+
+@router.get("/projects/{project_id}/progress-payments")
+async def get_progress_payment_schedule(project_id: int, db: DBRunner = Depends(get_db_runner)):
+    """프로젝트 기성 내역 전체 조회 (차수별 누계)"""
+    sequences = await db.run(
+        lambda session: [_ledger_entry_dict(entry) for entry in ProgressPaymentService(session).get_schedule(project_id)]
+    )
+    return {
+        "project_id": project_id,
+        "sequences": sequences
+    }
+
+@router.post("/projects/{project_id}/progress-payments")
+async def record_progress_payment(
+    project_id: int,
+    progress_rate: float = Query(..., ge=0, le=100, description="누적 기성율 (%)"),
+    invoice_id: Optional[int] = None,
+    dry_run: bool = False,
+    db: DBRunner = Depends(get_db_runner)
+):
+    """다음 차수 기성 계산 및 원장 기록 (dry_run=true면 계산만)"""
+    if dry_run:
+        try:
+            result = await db.run(
+                lambda session: ProgressPaymentService(session).calculate_next(project_id, Decimal(str(progress_rate)))
+            )
+            return {
+                "project_id": project_id,
+                "sequence": result['sequence'],
+                "progress_rate": progress_rate,
+                "contract_amount": float(result['contract_amount']),
+                "cumulative_amount": float(result['cumulative_amount']),
+                "advance_deduction": float(result['advance_amount']),
+                "defect_retention": float(result['defect_amount']),
+                "previous_payments": float(result['previous_payments']),
+                "current_payment": float(result['current_payment']),
+                "cumulative_paid": float(result['cumulative_paid'])
+            }
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"기성 계산 중 오류가 발생했습니다: {str(e)}")
+
+    def record(session):
+        entry = ProgressPaymentService(session).record_next(project_id, Decimal(str(progress_rate)), invoice_id=invoice_id)
+        return {"project_id": project_id, **_ledger_entry_dict(entry)}
+
+    try:
+        return await db.run(record)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"기성 계산 중 오류가 발생했습니다: {str(e)}")
+
+class BillingRunRequest(BaseModel):
+    period_from: date
+    period_to: date
+    project_ids: Optional[List[int]] = None  # 생략 시 기간 내 투입 이력이 있는 전체 프로젝트
+    vat_rate: float = 10.0
+    concurrency: int = BatchBillingService.DEFAULT_CONCURRENCY
+
+@router.post("/billing-runs")
+async def start_billing_run(request: BillingRunRequest, background_tasks: BackgroundTasks, db: DBRunner = Depends(get_db_runner)):
+    """월말 일괄 청구 실행 (백그라운드 처리, 실행은 스레드풀에서 동기 세션으로)"""
+    def create(session):
+        service = BatchBillingService(session)
+        run = service.create_run(
+            period_from=request.period_from,
+            period_to=request.period_to,
+            project_ids=request.project_ids,
+            vat_rate=Decimal(str(request.vat_rate))
+        )
+        return service.get_progress(run.id)
+
+    try:
+        progress = await db.run(create)
+        background_tasks.add_task(execute_billing_run, progress['run_id'], request.concurrency)
+        return progress
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"일괄 청구 시작 중 오류가 발생했습니다: {str(e)}")
+
+@router.get("/billing-runs/{run_id}")
+async def get_billing_run(run_id: int, db: DBRunner = Depends(get_db_runner)):
+    """일괄 청구 진행 상황 조회"""
+    progress = await db.run(lambda session: BatchBillingService(session).get_progress(run_id))
+    if progress is None:
+        raise HTTPException(status_code=404, detail="일괄 청구 실행을 찾을 수 없습니다")
+    return progress
+
+@router.post("/billing-runs/{run_id}/resume")
+async def resume_billing_run(
+    run_id: int,
+    background_tasks: BackgroundTasks,
+    concurrency: int = BatchBillingService.DEFAULT_CONCURRENCY,
+    db: DBRunner = Depends(get_db_runner)
+):
+    """중단/실패한 일괄 청구 재개 (완료된 프로젝트는 건너뜀)
+
+    다른 작업자가 실행 중이면 409. 작업자가 죽어 heartbeat가 LEASE_SECONDS 넘게 멈춘 실행은 넘겨받는다.
+    """
+    def claim(session):
+        service = BatchBillingService(session)
+        service.claim_run(run_id)
+        return service.get_progress(run_id)
+
+    try:
+        progress = await db.run(claim)
+    except BillingRunInProgressError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    background_tasks.add_task(execute_billing_run, run_id, concurrency, claimed=True)
+    return progress
+
 @router.post("/calculate/labor-cost")
 def calculate_labor_cost(
     persons: int,
@@ -188,4 +463,89 @@ def calculate_vat(
             }
         }
     except Exception as e:
-        raise HTTPException(status_code=400, detail=f"VAT 계산 오류: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=400, detail=f"VAT 계산 오류: {str(e)}")
+
+class LaborCostRow(BaseModel):
+    persons: int
+    hours: float
+    unit_rate: float
+    rate_type: str = "daily"
+
+class EquipmentCostRow(BaseModel):
+    units: int
+    hours: float
+    hourly_rate: float
+    min_hours: float = 4.0
+    mobilization_fee: float = 0.0
+
+class MaterialCostRow(BaseModel):
+    quantity: float
+    unit_price: float
+    waste_rate: float = 0.03
+
+class VATRow(BaseModel):
+    supply_amount: float
+    vat_rate: float = 10.0
+    tax_mode: str = "taxable"
+
+def _check_batch_size(rows: list):
+    if len(rows) > MAX_BATCH_ROWS:
+        raise HTTPException(status_code=413, detail=f"한 번에 최대 {MAX_BATCH_ROWS}건까지 계산할 수 있습니다")
+
+@router.post("/calculate/labor-cost/batch")
+def calculate_labor_cost_batch(rows: List[LaborCostRow]):
+    """노무비 일괄 계산 (입력 순서대로 반환)"""
+    _check_batch_size(rows)
+    try:
+        totals = BatchCostCalculator.labor_costs(
+            persons=[row.persons for row in rows],
+            hours=[row.hours for row in rows],
+            unit_rates=[row.unit_rate for row in rows]
+        )
+        return {"count": len(rows), "results": [{"total_cost": total} for total in totals]}
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"노무비 계산 오류: {str(e)}")
+
+@router.post("/calculate/equipment-cost/batch")
+def calculate_equipment_cost_batch(rows: List[EquipmentCostRow]):
+    """장비비 일괄 계산 (입력 순서대로 반환)"""
+    _check_batch_size(rows)
+    try:
+        results = BatchCostCalculator.equipment_costs(
+            units=[row.units for row in rows],
+            hours=[row.hours for row in rows],
+            hourly_rates=[row.hourly_rate for row in rows],
+            min_hours=[row.min_hours for row in rows],
+            mobilization_fees=[row.mobilization_fee for row in rows]
+        )
+        return {"count": len(rows), "results": results}
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"장비비 계산 오류: {str(e)}")
+
+@router.post("/calculate/material-cost/batch")
+def calculate_material_cost_batch(rows: List[MaterialCostRow]):
+    """자재비 일괄 계산 (입력 순서대로 반환)"""
+    _check_batch_size(rows)
+    try:
+        results = BatchCostCalculator.material_costs(
+            quantities=[row.quantity for row in rows],
+            unit_prices=[row.unit_price for row in rows],
+            waste_rates=[row.waste_rate for row in rows]
+        )
+        return {"count": len(rows), "results": results}
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"자재비 계산 오류: {str(e)}")
+
+@router.post("/calculate/vat/batch")
+def calculate_vat_batch(rows: List[VATRow]):
+    """부가가치세 일괄 계산 (입력 순서대로 반환)"""
+    _check_batch_size(rows)
+    try:
+        results = BatchCostCalculator.vat(
+            supply_amounts=[row.supply_amount for row in rows],
+            vat_rates=[row.vat_rate for row in rows],
+            tax_modes=[row.tax_mode for row in rows]
+        )
+        return {"count": len(rows), "results": results}
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"VAT 계산 오류: {str(e)}")
@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 from typing import List
 from ..database import get_db
 from ..models import Client
 from ..schemas.clients import ClientCreate, ClientResponse
+from ..services.http_cache import check_not_modified, table_version, weak_etag
 
 router = APIRouter()
 
@@ -16,20 +17,23 @@ def create_client(client: ClientCreate, db: Session = Depends(get_db)):
     return db_client
 
 @router.get("/", response_model=List[ClientResponse])
-def get_clients(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def get_clients(request: Request, response: Response, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+    """거래처 목록 (테이블 버전 기반 ETag, 변경 없으면 304)"""
+    check_not_modified(request, response, weak_etag("clients", skip, limit, *table_version(db, "clients")))
     clients = db.query(Client).offset(skip).limit(limit).all()
     return clients
 
 @router.get("/{client_id}", response_model=ClientResponse)
-def get_client(client_id: int, db: Session = Depends(get_db)):
-    client = db.query(Client).filter(Client.client_id == client_id).first()
+def get_client(client_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
+    check_not_modified(request, response, weak_etag("client", client_id, *table_version(db, "clients")))
+    client = db.query(Client).filter(Client.id == client_id).first()
     if client is None:
         raise HTTPException(status_code=404, detail="거래처를 찾을 수 없습니다")
     return client
 
 @router.put("/{client_id}", response_model=ClientResponse)
 def update_client(client_id: int, client: ClientCreate, db: Session = Depends(get_db)):
-    db_client = db.query(Client).filter(Client.client_id == client_id).first()
+    db_client = db.query(Client).filter(Client.id == client_id).first()
     if db_client is None:
         raise HTTPException(status_code=404, detail="거래처를 찾을 수 없습니다")
     
@@ -42,7 +46,7 @@ def update_client(client_id: int, client: ClientCreate, db: Session = Depends(ge
 
 @router.delete("/{client_id}")
 def delete_client(client_id: int, db: Session = Depends(get_db)):
-    db_client = db.query(Client).filter(Client.client_id == client_id).first()
+    db_client = db.query(Client).filter(Client.id == client_id).first()
     if db_client is None:
         raise HTTPException(status_code=404, detail="거래처를 찾을 수 없습니다")
     
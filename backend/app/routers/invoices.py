@@ -1,39 +1,46 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from ..database import get_db
 from ..models import Invoice, InvoiceLine
 from ..schemas.invoices import InvoiceCreate, InvoiceResponse
+from ..services.invoice_service import InvoiceAggregationService
+from ..services.http_cache import check_not_modified, table_version, weak_etag
 
 router = APIRouter()
 
 @router.post("/", response_model=InvoiceResponse)
-def create_invoice(invoice: InvoiceCreate, db: Session = Depends(get_db)):
-    # Create invoice
-    invoice_data = invoice.dict(exclude={'lines'})
-    db_invoice = Invoice(**invoice_data)
-    db.add(db_invoice)
-    db.commit()
-    db.refresh(db_invoice)
-    
-    # Create invoice lines
-    for line in invoice.lines:
-        line_data = line.dict()
-        line_data['invoice_id'] = db_invoice.invoice_id
-        db_line = InvoiceLine(**line_data)
-        db.add(db_line)
-    
-    db.commit()
-    return db_invoice
+def create_invoice(
+    invoice: InvoiceCreate,
+    idempotency_key: Optional[str] = Header(None, description="재시도 시 같은 청구서를 돌려받기 위한 키"),
+    db: Session = Depends(get_db)
+):
+    service = InvoiceAggregationService(db)
+    try:
+        if idempotency_key:
+            existing = service.find_by_idempotency_key(idempotency_key, invoice.project_id)
+            if existing is not None:
+                return existing
+
+        # Create invoice with its lines (single transaction)
+        invoice_data = invoice.dict(exclude={'lines'})
+        db_invoice = Invoice(**invoice_data, idempotency_key=idempotency_key)
+        db_invoice.invoice_lines = [InvoiceLine(**line.dict()) for line in invoice.lines]
+        return service.save_invoice(db_invoice)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
 
 @router.get("/", response_model=List[InvoiceResponse])
-def get_invoices(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def get_invoices(request: Request, response: Response, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+    """청구서 목록 (테이블 버전 기반 ETag, 변경 없으면 304)"""
+    check_not_modified(request, response, weak_etag("invoices", skip, limit, *table_version(db, "invoices")))
     invoices = db.query(Invoice).offset(skip).limit(limit).all()
     return invoices
 
 @router.get("/{invoice_id}", response_model=InvoiceResponse)
-def get_invoice(invoice_id: int, db: Session = Depends(get_db)):
-    invoice = db.query(Invoice).filter(Invoice.invoice_id == invoice_id).first()
+def get_invoice(invoice_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
+    check_not_modified(request, response, weak_etag("invoice", invoice_id, *table_version(db, "invoices")))
+    invoice = db.query(Invoice).filter(Invoice.id == invoice_id).first()
     if invoice is None:
         raise HTTPException(status_code=404, detail="청구서를 찾을 수 없습니다")
     return invoice
\ No newline at end of file
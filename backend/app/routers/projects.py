@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 from typing import List
 from ..database import get_db
 from ..models import Project
 from ..schemas.projects import ProjectCreate, ProjectResponse
+from ..services.http_cache import check_not_modified, table_version, weak_etag
 
 router = APIRouter()
 
@@ -16,13 +17,16 @@ def create_project(project: ProjectCreate, db: Session = Depends(get_db)):
     return db_project
 
 @router.get("/", response_model=List[ProjectResponse])
-def get_projects(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def get_projects(request: Request, response: Response, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+    """프로젝트 목록 (테이블 버전 기반 ETag, 변경 없으면 304)"""
+    check_not_modified(request, response, weak_etag("projects", skip, limit, *table_version(db, "projects")))
     projects = db.query(Project).offset(skip).limit(limit).all()
     return projects
 
 @router.get("/{project_id}", response_model=ProjectResponse)
-def get_project(project_id: int, db: Session = Depends(get_db)):
-    project = db.query(Project).filter(Project.project_id == project_id).first()
+def get_project(project_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
+    check_not_modified(request, response, weak_etag("project", project_id, *table_version(db, "projects")))
+    project = db.query(Project).filter(Project.id == project_id).first()
     if project is None:
         raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다")
     return project
\ No newline at end of file
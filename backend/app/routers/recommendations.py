@@ -3,9 +3,7 @@ from pydantic import BaseModel
 from typing import Optional
 from decimal import Decimal
 
-from sqlalchemy.orm import Session
-
-from ..database import get_db
+from ..database import DBRunner, get_db_runner
 from ..models.labor_entries import RateType
 from ..services.recommendation_service import RecommendationService
 
@@ -26,16 +24,16 @@ class LaborRecommendationResponse(BaseModel):
 
 
 @router.get("/labor", response_model=LaborRecommendationResponse)
-def recommend_labor_rate(
+async def recommend_labor_rate(
     trade: str = Query(..., description="직종명 예: 목공, 철근공 등"),
     rate_type: RateType = Query(RateType.DAILY, description="단가 유형: daily | hourly"),
     task_code_prefix: Optional[str] = Query(None, description="작업코드 접두 (필터)"),
     project_id: Optional[int] = Query(None, description="프로젝트 ID (필터)"),
     lookback_days: int = Query(180, ge=1, le=3650, description="과거 조회 기간(일)"),
-    db: Session = Depends(get_db),
+    db: DBRunner = Depends(get_db_runner),
 ):
-    result = RecommendationService.recommend_labor_rate(
-        db,
+    result = await db.run(
+        RecommendationService.cached_labor_rate,
         trade=trade,
         rate_type=rate_type,
         task_code_prefix=task_code_prefix,
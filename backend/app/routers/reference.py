@@ -1,4 +1,4 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Request, Response
 from typing import List, Dict
 from ..data.reference_data import (
     CONSTRUCTION_EQUIPMENT_TYPES,
@@ -7,8 +7,17 @@ from ..data.reference_data import (
     STANDARD_UNITS,
     WEATHER_CONDITIONS
 )
+from ..services.http_cache import check_not_modified, weak_etag
 
-router = APIRouter()
+# 참조 데이터는 코드와 함께 배포되는 상수이므로 프로세스당 한 번만 ETag를 계산한다
+REFERENCE_ETAG = weak_etag(
+    CONSTRUCTION_EQUIPMENT_TYPES, STANDARD_TRADES, STANDARD_WORK_ITEMS, STANDARD_UNITS, WEATHER_CONDITIONS
+)
+
+def reference_not_modified(request: Request, response: Response):
+    check_not_modified(request, response, REFERENCE_ETAG)
+
+router = APIRouter(dependencies=[Depends(reference_not_modified)])
 
 @router.get("/equipment-types", response_model=List[Dict])
 def get_equipment_types():
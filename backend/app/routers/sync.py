@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Optional
+from ..database import DBRunner, get_db_runner
+from ..responses import FastJSONResponse
+from ..services.sync_service import SyncService
+
+router = APIRouter()
+
+@router.get("/changes")
+async def get_changes(
+    since: Optional[str] = Query(None, description="이전 응답의 next (생략 시 전체 동기화)"),
+    limit: int = Query(SyncService.DEFAULT_LIMIT, ge=1, le=SyncService.MAX_LIMIT, description="페이지당 최대 행 수"),
+    db: DBRunner = Depends(get_db_runner)
+):
+    """워터마크 이후 변경분 (거래처/프로젝트/작업일지/작업항목/투입 내역)
+
+    has_more=true면 next로 바로 다음 페이지를 요청하고, false면 next를 다음 동기화의 since로 저장한다.
+    reset=true면 로컬 사본을 비우고 받은 행으로 새로 채운다. 행은 columns 순서의 배열로 내려준다.
+    """
+    try:
+        return FastJSONResponse(await db.run(lambda session: SyncService(session).changes(since, limit)))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
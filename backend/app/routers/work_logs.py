@@ -1,100 +1,186 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Response, UploadFile
 from sqlalchemy.orm import Session
-from typing import List
-from ..database import get_db
+from typing import List, Optional
+from datetime import date
+import io
+from starlette.concurrency import run_in_threadpool
+from ..database import DBRunner, get_db, get_db_runner
 from ..models import WorkLog, WorkItem, LaborEntry, EquipmentEntry, MaterialEntry
-from ..schemas.work_logs import WorkLogCreate, WorkLogResponse, WorkItemCreate, LaborCreate, EquipmentCreate, MaterialCreate
+from ..services.archive_service import merge_pages, read_archive
+from ..services.labor_stats_service import LaborRateStatsService
+from ..services.rollup_service import CostRollupService
+from ..services.work_log_service import WorkLogService
+from ..services.import_service import ImportFormat, WorkLogImportService
+from ..services.search_service import WorkLogSearchService
+from ..schemas.work_logs import (
+    WorkLogCloneRequest, WorkLogCloneResult, WorkLogCreate, WorkLogResponse, WorkLogSearchHit
+)
 
 router = APIRouter()
 
 @router.post("/", response_model=WorkLogResponse)
-def create_work_log(work_log: WorkLogCreate, db: Session = Depends(get_db)):
-    # Extract nested data
-    work_items_data = work_log.work_items
-    labor_entries_data = work_log.labor_entries
-    equipment_entries_data = work_log.equipment_entries
-    material_entries_data = work_log.material_entries
-
-    # Create WorkLog instance without nested data first
-    db_work_log = WorkLog(
-        project_id=work_log.project_id,
-        work_date=work_log.work_date,
-        area=work_log.area,
-        weather=work_log.weather,
-        process_status=work_log.process_status,
-        notes=work_log.notes
-    )
-    db.add(db_work_log)
-    db.flush() # Flush to get work_id for related items
-
-    # Add WorkItems
-    for item_data in work_items_data:
-        db_work_item = WorkItem(**item_data.dict(), work_id=db_work_log.work_id)
-        db.add(db_work_item)
-        db.flush() # Flush to get item_id for related entries
-
-        # Add LaborEntries for this WorkItem
-        for labor_data in labor_entries_data: # Assuming labor entries are associated with the first work item for simplicity, or need a way to link them
-            total_cost = labor_data.persons * labor_data.hours * labor_data.unit_rate
-            db_labor_entry = LaborEntry(**labor_data.dict(), item_id=db_work_item.item_id, total_cost=total_cost)
-            db.add(db_labor_entry)
-
-        # Add EquipmentEntries for this WorkItem
-        for equipment_data in equipment_entries_data: # Assuming equipment entries are associated with the first work item for simplicity, or need a way to link them
-            total_cost = (equipment_data.units * equipment_data.hours * equipment_data.hourly_rate) + equipment_data.mobilization_fee
-            db_equipment_entry = EquipmentEntry(**equipment_data.dict(), item_id=db_work_item.item_id, total_cost=total_cost)
-            db.add(db_equipment_entry)
-
-        # Add MaterialEntries for this WorkItem
-        for material_data in material_entries_data: # Assuming material entries are associated with the first work item for simplicity, or need a way to link them
-            total_cost = material_data.quantity * material_data.unit_price
-            db_material_entry = MaterialEntry(**material_data.dict(), item_id=db_work_item.item_id, total_cost=total_cost)
-            db.add(db_material_entry)
+async def create_work_log(work_log: WorkLogCreate, db: DBRunner = Depends(get_db_runner)):
+    """작업일지 생성 (작업항목 수와 무관하게 고정 횟수의 DB 왕복, 응답은 재조회 없이 구성)"""
+    try:
+        return await db.run(lambda session: WorkLogService(session).create(work_log))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    db.commit()
-    db.refresh(db_work_log) # Refresh to load relationships
-
-    # Manually populate nested data for response as relationships are viewonly or not directly loaded
-    response_work_items = []
-    for db_item in db_work_log.work_items:
-        item_dict = db_item.__dict__.copy()
-        item_dict["labor_entries"] = [LaborCreate.from_orm(le) for le in db_item.labor_entries]
-        item_dict["equipment_entries"] = [EquipmentCreate.from_orm(ee) for ee in db_item.equipment_entries]
-        item_dict["material_entries"] = [MaterialCreate.from_orm(me) for me in db_item.material_entries]
-        response_work_items.append(WorkItemCreate.from_orm(db_item)) # This will not include nested items
-
-    # For WorkLogResponse, we need to ensure the nested lists are populated.
-    # Since we made the relationships viewonly, we might need to load them explicitly or adjust the response model.
-    # For now, let's try to refresh and see if it works with from_orm.
-    # If not, we might need to construct the response manually or adjust the WorkLogResponse schema.
-
-    # Re-fetch the work log with all relationships loaded for the response
-    # This is a common pattern when relationships are not eager loaded or viewonly
-    full_work_log = db.query(WorkLog).filter(WorkLog.work_id == db_work_log.work_id).first()
-    if full_work_log:
-        # Populate nested data for the response
-        response_data = WorkLogResponse.from_orm(full_work_log)
-        response_data.work_items = [WorkItemCreate.from_orm(item) for item in full_work_log.work_items]
-        
-        # For each work item, populate its nested entries
-        for i, item_response in enumerate(response_data.work_items):
-            db_item = full_work_log.work_items[i]
-            item_response.labor_entries = [LaborCreate.from_orm(le) for le in db_item.labor_entries]
-            item_response.equipment_entries = [EquipmentCreate.from_orm(ee) for ee in db_item.equipment_entries]
-            item_response.material_entries = [MaterialCreate.from_orm(me) for me in db_item.material_entries]
-        
-        return response_data
-    
-    return WorkLogResponse.from_orm(db_work_log) # Fallback, might not have full nested data
+@router.post("/import")
+def import_work_logs(
+    file: UploadFile = File(..., description="CSV 또는 JSONL 파일 (UTF-8)"),
+    format: Optional[ImportFormat] = Query(None, description="파일 형식 (생략 시 확장자로 판단)"),
+    chunk_size: int = Query(WorkLogImportService.DEFAULT_CHUNK_SIZE, ge=1, le=10000, description="커밋 단위 작업일지 수"),
+    db: Session = Depends(get_db)
+):
+    """작업일지 대량 가져오기 (청크 단위 검증/일괄 적재/커밋, 행별 오류 보고)
+
+    업로드 파일을 동기 스트림으로 읽으며 COPY/executemany를 쓰므로 비동기 모드에서도 스레드풀에서 실행한다.
+    """
+    import_format = format
+    if import_format is None:
+        filename = (file.filename or "").lower()
+        if filename.endswith(".csv"):
+            import_format = ImportFormat.CSV
+        elif filename.endswith((".jsonl", ".ndjson")):
+            import_format = ImportFormat.JSONL
+        else:
+            raise HTTPException(status_code=400, detail="파일 형식을 알 수 없습니다 (format=csv|jsonl 지정)")
+
+    stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        return WorkLogImportService(db, chunk_size=chunk_size).import_stream(stream, import_format)
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="UTF-8 인코딩 파일만 가져올 수 있습니다")
+    finally:
+        stream.detach()
 
 @router.get("/", response_model=List[WorkLogResponse])
-def get_work_logs(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    work_logs = db.query(WorkLog).offset(skip).limit(limit).all()
+async def get_work_logs(
+    response: Response,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값"),
+    project_id: Optional[int] = None,
+    date_from: Optional[date] = Query(None, description="작업일 시작"),
+    date_to: Optional[date] = Query(None, description="작업일 종료"),
+    include_archived: bool = Query(False, description="보관(콜드 스토리지)된 프로젝트의 작업일지도 포함"),
+    db: DBRunner = Depends(get_db_runner)
+):
+    """작업일지 목록 (작업일/ID 내림차순 키셋 페이지네이션, 다음 페이지 커서는 X-Next-Cursor 헤더)
+
+    include_archived면 운영 DB와 보관 DB를 같은 커서로 읽어 합친다.
+    """
+    def list_page(session):
+        logs, next_cursor = WorkLogService(session).list_page(
+            limit=limit, cursor=cursor, project_id=project_id, date_from=date_from, date_to=date_to
+        )
+        return [WorkLogResponse.model_validate(log, from_attributes=True) for log in logs], next_cursor
+
+    try:
+        work_logs, next_cursor = await db.run(list_page)
+        if include_archived:
+            archived = await run_in_threadpool(read_archive, list_page)
+            work_logs, next_cursor = merge_pages(
+                [(work_logs, next_cursor), archived], limit, key=lambda log: (log.work_date, log.work_id)
+            )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return work_logs
 
+@router.get("/search", response_model=List[WorkLogSearchHit])
+async def search_work_logs(
+    response: Response,
+    q: str = Query(..., min_length=1, description="검색어 (공백으로 나눈 단어를 모두 포함)"),
+    project_id: Optional[int] = None,
+    limit: int = Query(WorkLogSearchService.DEFAULT_LIMIT, ge=1, le=WorkLogSearchService.MAX_LIMIT),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값"),
+    db: DBRunner = Depends(get_db_runner)
+):
+    """작업일지 전문 검색 (구역/공정상태/비고/작업명/규격, 관련도순, 다음 페이지 커서는 X-Next-Cursor 헤더)
+
+    결과가 더 있지만 최대 조회 위치를 넘어 커서를 줄 수 없으면 X-Results-Truncated: true를 붙인다
+    (검색어를 좁히거나 project_id로 거르라는 뜻).
+    """
+    def search(session):
+        rows, next_cursor, truncated = WorkLogSearchService(session).search(
+            q, project_id=project_id, limit=limit, cursor=cursor
+        )
+        return [WorkLogSearchHit.model_validate(dict(row)) for row in rows], next_cursor, truncated
+
+    try:
+        hits, next_cursor, truncated = await db.run(search)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    if truncated:
+        response.headers["X-Results-Truncated"] = "true"
+    return hits
+
 @router.get("/{work_id}", response_model=WorkLogResponse)
-def get_work_log(work_id: int, db: Session = Depends(get_db)):
-    work_log = db.query(WorkLog).filter(WorkLog.work_id == work_id).first()
+async def get_work_log(
+    work_id: int,
+    include_archived: bool = Query(False, description="운영 DB에 없으면 보관 DB에서 조회"),
+    db: DBRunner = Depends(get_db_runner)
+):
+    def get(session):
+        work_log = WorkLogService(session).get(work_id)
+        return WorkLogResponse.model_validate(work_log, from_attributes=True) if work_log is not None else None
+
+    work_log = await db.run(get)
+    if work_log is None and include_archived:
+        work_log = await run_in_threadpool(read_archive, get)
     if work_log is None:
         raise HTTPException(status_code=404, detail="작업일지를 찾을 수 없습니다")
-    return work_log
\ No newline at end of file
+    return work_log
+
+@router.post("/{work_id}/clone", response_model=WorkLogCloneResult)
+async def clone_work_log(work_id: int, request: WorkLogCloneRequest, db: DBRunner = Depends(get_db_runner)):
+    """전날 복사: 작업일지를 작업항목/투입 내역째 다른 날짜(또는 기간)로 복사
+
+    직종/장비코드별 변경값(labor_overrides/equipment_overrides)으로 인원·시간·단가를 바꾸거나 제외할 수 있다.
+    """
+    try:
+        dates = WorkLogService.clone_dates(request.work_date, request.date_from, request.date_to, request.exclude_weekdays)
+        result = await db.run(
+            lambda session: WorkLogService(session).clone(
+                work_id, dates, request.labor_overrides, request.equipment_overrides
+            )
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"작업일지 복사 중 오류가 발생했습니다: {str(e)}")
+    if result is None:
+        raise HTTPException(status_code=404, detail="작업일지를 찾을 수 없습니다")
+    return result
+
+@router.delete("/{work_id}")
+async def delete_work_log(work_id: int, db: DBRunner = Depends(get_db_runner)):
+    deleted = await db.run(_delete_work_log, work_id)
+    if not deleted:
+        raise HTTPException(status_code=404, detail="작업일지를 찾을 수 없습니다")
+    return {"message": "작업일지가 삭제되었습니다"}
+
+def _delete_work_log(db: Session, work_id: int) -> bool:
+    work_log = db.query(WorkLog).filter(WorkLog.id == work_id).first()
+    if work_log is None:
+        return False
+
+    item_ids = [item.id for item in work_log.work_items]
+    entries = []
+    for model in (LaborEntry, EquipmentEntry, MaterialEntry):
+        if item_ids:
+            entries.extend(db.query(model).filter(model.work_item_id.in_(item_ids)).all())
+
+    # 행이 지워지기 전에 일별 비용 롤업과 노무 단가 분포에서 차감
+    CostRollupService(db).remove_entries(work_log.project_id, work_log.work_date, entries)
+    LaborRateStatsService(db).add_work_logs([work_id], sign=-1)
+
+    for entry in entries:
+        db.delete(entry)
+    db.delete(work_log)
+    db.commit()
+    return True
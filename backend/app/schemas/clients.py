@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import AliasChoices, BaseModel, Field
 from datetime import datetime
 from typing import Optional
 
@@ -15,7 +15,7 @@ class ClientCreate(ClientBase):
     pass
 
 class ClientResponse(ClientBase):
-    client_id: int
+    client_id: int = Field(validation_alias=AliasChoices('client_id', 'id'))
     created_at: datetime
     updated_at: datetime
     
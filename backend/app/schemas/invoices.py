@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import AliasChoices, BaseModel, Field
 from datetime import date
 from typing import Optional, List
 from decimal import Decimal
@@ -31,7 +31,7 @@ class InvoiceCreate(InvoiceBase):
     lines: List[InvoiceLineBase] = []
 
 class InvoiceResponse(InvoiceBase):
-    invoice_id: int
+    invoice_id: int = Field(validation_alias=AliasChoices('invoice_id', 'id'))
     
     class Config:
         from_attributes = True
\ No newline at end of file
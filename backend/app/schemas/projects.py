@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import AliasChoices, BaseModel, Field
 from datetime import datetime
 from typing import Optional
 from decimal import Decimal
@@ -17,7 +17,7 @@ class ProjectCreate(ProjectBase):
     pass
 
 class ProjectResponse(ProjectBase):
-    project_id: int
+    project_id: int = Field(validation_alias=AliasChoices('project_id', 'id'))
     created_at: datetime
     updated_at: datetime
     
@@ -1,9 +1,9 @@
-from pydantic import BaseModel
+from pydantic import AliasChoices, BaseModel, Field
 from datetime import datetime, date
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 class WorkItemCreate(BaseModel):
-    task_code: Optional[str] = None
+    task_code: str
     task_name: str
     specification: Optional[str] = None
     quantity: float
@@ -18,14 +18,17 @@ class LaborCreate(BaseModel):
     unit_rate: float
 
 class EquipmentCreate(BaseModel):
+    equipment_code: str
     equipment_name: str
     specification: Optional[str] = None
     units: int
     hours: float
     hourly_rate: float
-    mobilization_fee: float
+    min_hours: float = 4.0
+    mobilization_fee: float = 0
 
 class MaterialCreate(BaseModel):
+    material_code: Optional[str] = None
     material_name: str
     specification: Optional[str] = None
     quantity: float
@@ -48,7 +51,7 @@ class WorkLogCreate(WorkLogBase):
     material_entries: List[MaterialCreate] = []
 
 class WorkLogResponse(WorkLogBase):
-    work_id: int
+    work_id: int = Field(validation_alias=AliasChoices('work_id', 'id'))
     created_at: datetime
     updated_at: datetime
     work_items: List[WorkItemCreate] = [] # Using Create schema for response for simplicity for now
@@ -57,4 +60,57 @@ class WorkLogResponse(WorkLogBase):
     material_entries: List[MaterialCreate] = []
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class WorkLogSearchHit(WorkLogBase):
+    work_id: int = Field(validation_alias=AliasChoices('work_id', 'id'))
+    score: float  # 관련도 (클수록 관련 높음)
+
+    class Config:
+        from_attributes = True
+
+# ---- 대량 가져오기 (작업항목 아래에 투입 내역을 중첩) ----
+
+class WorkItemImport(WorkItemCreate):
+    progress_rate: float = 100.0
+    notes: Optional[str] = None
+    labor_entries: List[LaborCreate] = []
+    equipment_entries: List[EquipmentCreate] = []
+    material_entries: List[MaterialCreate] = []
+
+class WorkLogImport(WorkLogBase):
+    work_items: List[WorkItemImport] = []
+
+# ---- 전날 복사 (작업일지 복제) ----
+
+class LaborOverride(BaseModel):
+    """직종별 변경값 (생략한 값은 원본 그대로, exclude=True면 해당 직종 제외)"""
+    persons: Optional[int] = Field(None, ge=0)
+    hours: Optional[float] = Field(None, ge=0)
+    unit_rate: Optional[float] = Field(None, ge=0)
+    exclude: bool = False
+
+class EquipmentOverride(BaseModel):
+    """장비코드별 변경값 (생략한 값은 원본 그대로, exclude=True면 해당 장비 제외)"""
+    units: Optional[int] = Field(None, ge=0)
+    hours: Optional[float] = Field(None, ge=0)
+    hourly_rate: Optional[float] = Field(None, ge=0)
+    exclude: bool = False
+
+class WorkLogCloneRequest(BaseModel):
+    work_date: Optional[date] = None   # 하루만 복사
+    date_from: Optional[date] = None   # 또는 기간 복사 (시작/종료일 포함)
+    date_to: Optional[date] = None
+    exclude_weekdays: List[int] = []   # 기간 복사 시 건너뛸 요일 (0=월 ... 6=일)
+    labor_overrides: Dict[str, LaborOverride] = {}          # 직종 → 변경값
+    equipment_overrides: Dict[str, EquipmentOverride] = {}  # 장비코드 → 변경값
+
+class ClonedWorkLog(BaseModel):
+    work_id: int
+    work_date: date
+
+class WorkLogCloneResult(BaseModel):
+    source_work_id: int
+    work_logs: List[ClonedWorkLog]
+    work_items_count: int
+    entries_count: int
@@ -0,0 +1,289 @@
+"""
+프로젝트 보관(콜드 스토리지)
+
+청구 기간이 모든 작업일을 덮는(정산이 끝난) 프로젝트의 작업일지/작업항목/투입 상세를
+별도 보관 DB(ARCHIVE_DATABASE_URL)로 옮겨 운영 DB의 테이블과 인덱스를 가볍게 유지한다.
+일자별 비용 집계(daily_cost_rollups)와 청구서는 운영 DB에 그대로 두므로 비용 추이/요약은
+보관 후에도 같은 값을 낸다. 상세 조회는 include_archived로 요청할 때만 보관 DB를 함께 읽는다.
+
+작업일지 batch_size건 단위로 옮긴다: 보관 DB에 먼저 쓰고 커밋한 뒤 운영 DB에서 지우므로
+중간에 실패해도 데이터를 잃지 않고, 같은 명령을 다시 실행하면 남은 부분부터 이어 간다.
+운영 DB에서 지운 행은 변경 동기화 톰스톤과 검색 색인 삭제를 같은 트랜잭션에 기록하고,
+복원한 행은 updated_at/sync_version을 새로 받아 동기화 클라이언트가 다시 내려받는다.
+"""
+import threading
+from datetime import date
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import Column, Index, MetaData, Table, delete, func, insert, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from ..database import Base, get_archive_engine
+from ..models import Invoice, Project, WorkLog
+from ..models.project_archives import ArchiveStatus, ProjectArchive
+from ..models.sync_tombstones import SyncTombstone
+from ..models.work_log_search import reindex_work_logs
+from .labor_stats_service import LaborRateStatsService
+from .pagination import encode_cursor
+
+ENTRY_TABLES = ("labor_entries", "equipment_entries", "material_entries")
+# 부모 → 자식 순 (넣을 때는 이 순서, 지울 때는 역순)
+ARCHIVE_TABLES = ("work_logs", "work_items", *ENTRY_TABLES)
+
+# 운영 DB에서만 의미가 있는 컬럼 (동기화 순번은 복원할 때 새로 매긴다)
+LIVE_ONLY_COLUMNS = ("sync_version",)
+
+# 보관 DB 스키마: 운영 테이블과 같은 이름/컬럼(동기화 순번 제외), 외래키 없이 조회용 인덱스만
+archive_metadata = MetaData()
+for _name in ARCHIVE_TABLES:
+    Table(_name, archive_metadata, *(
+        Column(column.name, column.type, primary_key=column.primary_key, nullable=column.nullable)
+        for column in Base.metadata.tables[_name].columns if column.name not in LIVE_ONLY_COLUMNS
+    ))
+Index("ix_archive_work_logs_project_date", archive_metadata.tables["work_logs"].c.project_id,
+      archive_metadata.tables["work_logs"].c.work_date, archive_metadata.tables["work_logs"].c.id)
+Index("ix_archive_work_items_work_log", archive_metadata.tables["work_items"].c.work_log_id)
+for _name in ENTRY_TABLES:
+    Index(f"ix_archive_{_name}_work_item", archive_metadata.tables[_name].c.work_item_id)
+
+_schema_lock = threading.Lock()
+_schema_ready = set()
+
+
+def archive_engine() -> Engine:
+    """보관 DB 엔진 (처음 쓸 때 보관 테이블 생성)"""
+    engine = get_archive_engine()
+    with _schema_lock:
+        if id(engine) not in _schema_ready:
+            archive_metadata.create_all(engine)
+            _schema_ready.add(id(engine))
+    return engine
+
+
+def read_archive(fn: Callable, *args, **kwargs):
+    """보관 DB 세션으로 fn(session, ...) 실행
+
+    보관 테이블은 운영 테이블과 이름/컬럼이 같아 WorkLogService 등 기존 조회 코드를 그대로 쓴다.
+    동기 엔진이므로 비동기 엔드포인트에서는 스레드풀에서 호출한다.
+    """
+    with Session(archive_engine()) as session:
+        return fn(session, *args, **kwargs)
+
+
+def merge_pages(
+    pages: Sequence[Tuple[List, Optional[str]]], limit: int, key: Callable[[object], Tuple[date, int]]
+) -> Tuple[List, Optional[str]]:
+    """운영/보관 DB에서 같은 커서로 읽은 (work_date, id) 내림차순 페이지를 한 페이지로 합침 (key는 항목의 (work_date, id))"""
+    items = sorted((item for page, _ in pages for item in page), key=key, reverse=True)
+    more = len(items) > limit or any(next_cursor for _, next_cursor in pages)
+    items = items[:limit]
+    if not (more and items):
+        return items, None
+    last_date, last_id = key(items[-1])
+    return items, encode_cursor([last_date.isoformat(), last_id])
+
+
+class ProjectArchiveService:
+    DEFAULT_BATCH_SIZE = 200
+
+    def __init__(self, db: Session, archive: Optional[Engine] = None, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.db = db
+        self.archive = archive if archive is not None else archive_engine()
+        self.batch_size = batch_size
+        self.live_tables = {name: Base.metadata.tables[name] for name in ARCHIVE_TABLES}
+        self.archive_tables = {name: archive_metadata.tables[name] for name in ARCHIVE_TABLES}
+
+    def status(self, project_id: int) -> Optional[ProjectArchive]:
+        return self.db.get(ProjectArchive, project_id)
+
+    def uninvoiced_work_logs(self, project_id: int) -> int:
+        """작업일이 어느 청구 기간에도 들지 않는 작업일지 수"""
+        invoiced = select(Invoice.id).where(
+            Invoice.project_id == project_id,
+            Invoice.period_from <= WorkLog.work_date,
+            Invoice.period_to >= WorkLog.work_date
+        ).exists()
+        return self.db.query(func.count(WorkLog.id)).filter(WorkLog.project_id == project_id, ~invoiced).scalar()
+
+    def archive_project(self, project_id: int, progress: Optional[Callable[[int], None]] = None) -> ProjectArchive:
+        """프로젝트의 작업 상세를 보관 DB로 이동 (progress에는 옮긴 작업일지 누계 전달)"""
+        if self.db.get(Project, project_id) is None:
+            raise ValueError("프로젝트를 찾을 수 없습니다")
+        record = self.status(project_id)
+        if record is not None and record.status == ArchiveStatus.RESTORING:
+            raise ValueError("복원 중인 프로젝트입니다. 복원을 먼저 끝내세요")
+        uninvoiced = self.uninvoiced_work_logs(project_id)
+        if uninvoiced:
+            raise ValueError(f"청구되지 않은 작업일지가 {uninvoiced}건 있어 보관할 수 없습니다")
+
+        record = self._mark(project_id, ArchiveStatus.ARCHIVING)
+        moved = 0
+        work_logs = self.live_tables["work_logs"]
+        while True:
+            log_ids = self.db.execute(
+                select(work_logs.c.id).where(work_logs.c.project_id == project_id)
+                .order_by(work_logs.c.id).limit(self.batch_size)
+            ).scalars().all()
+            if not log_ids:
+                break
+            rows = _read_rows(self.db.connection(), self.live_tables, log_ids)
+            with self.archive.begin() as conn:
+                # 이전 실행이 보관 DB에만 쓰고 끝났을 수 있으므로 같은 ID를 먼저 지운다
+                _delete_rows(conn, self.archive_tables, rows)
+                _insert_rows(conn, self.archive_tables, rows, exclude=LIVE_ONLY_COLUMNS)
+            self._delete_live(rows)
+            self.db.commit()
+            moved += len(log_ids)
+            if progress:
+                progress(moved)
+
+        self._count_archived(record)
+        record.status = ArchiveStatus.ARCHIVED
+        self.db.commit()
+        return record
+
+    def restore_project(self, project_id: int, progress: Optional[Callable[[int], None]] = None) -> int:
+        """보관 DB의 작업 상세를 운영 DB로 되돌리고 되돌린 작업일지 수 반환"""
+        if self.status(project_id) is None:
+            raise ValueError("보관된 프로젝트가 아닙니다")
+        self._mark(project_id, ArchiveStatus.RESTORING)
+
+        restored = 0
+        work_logs = self.archive_tables["work_logs"]
+        while True:
+            with self.archive.connect() as conn:
+                log_ids = conn.execute(
+                    select(work_logs.c.id).where(work_logs.c.project_id == project_id)
+                    .order_by(work_logs.c.id).limit(self.batch_size)
+                ).scalars().all()
+                if not log_ids:
+                    break
+                rows = _read_rows(conn, self.archive_tables, log_ids)
+            self._insert_live(project_id, rows)
+            with self.archive.begin() as conn:
+                _delete_rows(conn, self.archive_tables, rows)
+            restored += len(log_ids)
+            if progress:
+                progress(restored)
+
+        self.db.delete(self.status(project_id))
+        self.db.commit()
+        return restored
+
+    def _mark(self, project_id: int, status: ArchiveStatus) -> ProjectArchive:
+        record = self.status(project_id)
+        if record is None:
+            record = ProjectArchive(project_id=project_id, status=status)
+            self.db.add(record)
+        record.status = status
+        self.db.commit()
+        return record
+
+    def _count_archived(self, record: ProjectArchive) -> None:
+        tables = self.archive_tables
+        log_ids = select(tables["work_logs"].c.id).where(tables["work_logs"].c.project_id == record.project_id)
+        item_ids = select(tables["work_items"].c.id).where(tables["work_items"].c.work_log_id.in_(log_ids))
+        with self.archive.connect() as conn:
+            record.work_logs_count = conn.execute(
+                select(func.count()).select_from(log_ids.subquery())
+            ).scalar()
+            record.work_items_count = conn.execute(
+                select(func.count()).select_from(item_ids.subquery())
+            ).scalar()
+            record.entries_count = sum(
+                conn.execute(select(func.count()).where(tables[name].c.work_item_id.in_(item_ids))).scalar()
+                for name in ENTRY_TABLES
+            )
+
+    def _delete_live(self, rows: Dict[str, List[Dict]]) -> None:
+        """운영 DB에서 삭제 (톰스톤/검색 색인은 Core 삭제라 직접 기록)
+
+        직종별 단가 분포는 운영 DB의 노무 투입만 반영하므로 지우기 전에 뺀다.
+        """
+        LaborRateStatsService(self.db).add_work_logs([row["id"] for row in rows["work_logs"]], sign=-1)
+        connection = self.db.connection()
+        _delete_rows(connection, self.live_tables, rows)
+        tombstones = [
+            {"entity": name, "entity_id": row[_primary_key(self.live_tables[name]).name]}
+            for name in ARCHIVE_TABLES for row in rows[name]
+        ]
+        if tombstones:
+            connection.execute(insert(SyncTombstone), tombstones)
+        reindex_work_logs(self.db, [row["id"] for row in rows["work_logs"]])
+
+    def _insert_live(self, project_id: int, rows: Dict[str, List[Dict]]) -> None:
+        """운영 DB에 다시 넣고 커밋
+
+        앞선 복원이 운영 DB 커밋 후 보관 DB 삭제 전에 끝났다면 그 작업일지는 이미 들어가 있으므로 건너뛴다.
+        보관한 행의 ID는 다시 쓰이지 않으므로(PostgreSQL 시퀀스, SQLite AUTOINCREMENT) 겹치지 않아야 하지만,
+        다른 경로로 같은 ID가 들어와 있으면 덮어쓰지 않고 복원을 거부한다.
+        """
+        log_ids = [row["id"] for row in rows["work_logs"]]
+        existing = dict(self.db.execute(
+            select(WorkLog.id, WorkLog.project_id).where(WorkLog.id.in_(log_ids))
+        ).all())
+        if any(owner != project_id for owner in existing.values()):
+            raise ValueError("복원할 작업일지 ID가 운영 DB의 다른 작업일지와 겹칩니다")
+        if existing:
+            rows = _without_work_logs(rows, set(existing))
+
+        connection = self.db.connection()
+        try:
+            _insert_rows(connection, self.live_tables, rows, exclude=("updated_at",))
+            log_ids = [row["id"] for row in rows["work_logs"]]
+            LaborRateStatsService(self.db).add_work_logs(log_ids)
+            reindex_work_logs(self.db, log_ids)
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            raise ValueError("복원할 행의 ID가 운영 DB의 다른 행과 겹칩니다")
+
+
+def _read_rows(connection, tables: Dict[str, Table], log_ids: Sequence[int]) -> Dict[str, List[Dict]]:
+    """작업일지 ID들의 작업일지/작업항목/투입 행 (테이블명 → 행 목록)"""
+    rows = {
+        "work_logs": connection.execute(select(tables["work_logs"]).where(tables["work_logs"].c.id.in_(log_ids))),
+        "work_items": connection.execute(
+            select(tables["work_items"]).where(tables["work_items"].c.work_log_id.in_(log_ids))
+        ),
+    }
+    rows = {name: [dict(row) for row in result.mappings()] for name, result in rows.items()}
+    item_ids = [row["id"] for row in rows["work_items"]]
+    for name in ENTRY_TABLES:
+        rows[name] = [dict(row) for row in connection.execute(
+            select(tables[name]).where(tables[name].c.work_item_id.in_(item_ids))
+        ).mappings()] if item_ids else []
+    return rows
+
+
+def _insert_rows(connection, tables: Dict[str, Table], rows: Dict[str, List[Dict]], exclude: Sequence[str] = ()) -> None:
+    for name in ARCHIVE_TABLES:
+        if rows[name]:
+            connection.execute(
+                insert(tables[name]),
+                [{key: value for key, value in row.items() if key not in exclude} for row in rows[name]]
+            )
+
+
+def _delete_rows(connection, tables: Dict[str, Table], rows: Dict[str, List[Dict]]) -> None:
+    for name in reversed(ARCHIVE_TABLES):
+        if rows[name]:
+            key = _primary_key(tables[name])
+            connection.execute(delete(tables[name]).where(key.in_([row[key.name] for row in rows[name]])))
+
+
+def _primary_key(table: Table) -> Column:
+    # 장비/자재 투입은 PK가 entry_id
+    return next(iter(table.primary_key.columns))
+
+
+def _without_work_logs(rows: Dict[str, List[Dict]], log_ids: set) -> Dict[str, List[Dict]]:
+    """작업일지 ID들과 그 하위 행을 뺀 행 묶음"""
+    item_ids = {row["id"] for row in rows["work_items"] if row["work_log_id"] in log_ids}
+    kept = {
+        "work_logs": [row for row in rows["work_logs"] if row["id"] not in log_ids],
+        "work_items": [row for row in rows["work_items"] if row["id"] not in item_ids],
+    }
+    for name in ENTRY_TABLES:
+        kept[name] = [row for row in rows[name] if row["work_item_id"] not in item_ids]
+    return kept
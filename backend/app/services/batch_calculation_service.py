@@ -0,0 +1,223 @@
+"""
+배열 기반 일괄 원가 계산
+
+CostCalculationService와 같은 규칙(최소호출시간, 할증율, 과세구분, 0.01원 ROUND_HALF_EVEN)을
+정수 단위 numpy 배열 연산으로 한 번에 적용한다. 입력 float는 Decimal(str(x))와 같은 값으로
+해석하며, 정해진 자릿수를 넘는 입력이나 int64 범위를 넘을 수 있는 행은 단건 서비스로
+계산해 결과가 항상 단건 API와 같도록 한다.
+"""
+from decimal import Decimal
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from .calculation_service import CostCalculationService
+
+# int64 곱셈 결과가 넘치지 않도록 허용하는 최대 절댓값
+_INT64_SAFE = float(2 ** 62)
+# float64가 소수 자릿수를 정확히 구분할 수 있는 정수부 한계
+_FLOAT_EXACT = float(2 ** 52)
+
+
+def _to_units(values: Sequence[float], scale: int) -> Tuple[np.ndarray, np.ndarray]:
+    """float 배열을 10^-scale 단위 정수 배열로 변환. (units, 정확히 표현되는지 여부)"""
+    x = np.asarray(values, dtype=np.float64)
+    factor = 10.0 ** scale
+    units = np.rint(x * factor)
+    exact = np.isfinite(x) & (np.abs(units) < _FLOAT_EXACT) & (units / factor == x)
+    return np.where(exact, units, 0).astype(np.int64), exact
+
+
+def _round_half_even(units: np.ndarray, drop: int) -> np.ndarray:
+    """10^drop 로 나눈 몫을 ROUND_HALF_EVEN으로 반올림"""
+    if drop <= 0:
+        return units * (10 ** -drop)
+    divisor = np.int64(10 ** drop)
+    quotient, remainder = np.divmod(units, divisor)
+    twice = remainder * 2
+    round_up = (twice > divisor) | ((twice == divisor) & ((quotient & 1) == 1))
+    return quotient + round_up
+
+
+def _cents_to_float(cents: np.ndarray) -> List[float]:
+    """0.01원 정수 → float (float(Decimal('x.xx'))와 같은 값)"""
+    return (cents / 100.0).tolist()
+
+
+def _safe(*magnitudes: np.ndarray) -> np.ndarray:
+    """근사 크기(float)가 int64 안전 범위 안인지"""
+    ok = np.ones(len(magnitudes[0]), dtype=bool)
+    for magnitude in magnitudes:
+        ok &= np.abs(magnitude) < _INT64_SAFE
+    return ok
+
+
+class BatchCostCalculator:
+    """노무비/장비비/자재비/VAT 일괄 계산 (결과는 입력 순서 유지)"""
+
+    @staticmethod
+    def labor_costs(persons: Sequence[int], hours: Sequence[float], unit_rates: Sequence[float]) -> List[float]:
+        """노무비 = 인원 × 시간 × 단가"""
+        p = np.asarray(persons, dtype=np.int64)
+        h, h_ok = _to_units(hours, 2)
+        r, r_ok = _to_units(unit_rates, 2)
+
+        ok = h_ok & r_ok & _safe(p.astype(np.float64) * h * r)
+        cents = _round_half_even(p * h * r, 2)
+        result = _cents_to_float(np.where(ok, cents, 0))
+
+        for i in np.flatnonzero(~ok):
+            result[i] = float(CostCalculationService.calculate_labor_cost(
+                persons=int(persons[i]),
+                hours=Decimal(str(hours[i])),
+                unit_rate=Decimal(str(unit_rates[i]))
+            ))
+        return result
+
+    @staticmethod
+    def equipment_costs(
+        units: Sequence[int],
+        hours: Sequence[float],
+        hourly_rates: Sequence[float],
+        min_hours: Sequence[float],
+        mobilization_fees: Sequence[float]
+    ) -> List[Dict]:
+        """장비비 = 대수 × max(시간, 최소호출시간) × 시간단가 + 이동/설치비"""
+        n = np.asarray(units, dtype=np.int64)
+        h, h_ok = _to_units(hours, 2)
+        m, m_ok = _to_units(min_hours, 2)
+        r, r_ok = _to_units(hourly_rates, 2)
+        f, f_ok = _to_units(mobilization_fees, 2)
+
+        min_applied = m > h
+        applied = np.where(min_applied, m, h)
+        base = n * applied * r                       # 10^-4
+        ok = h_ok & m_ok & r_ok & f_ok & _safe(n.astype(np.float64) * applied * r, f * 100.0)
+
+        base_cents = _round_half_even(np.where(ok, base, 0), 2)
+        total_cents = _round_half_even(np.where(ok, base + f * 100, 0), 2)
+
+        base_list = _cents_to_float(base_cents)
+        fee_list = _cents_to_float(f)
+        total_list = _cents_to_float(total_cents)
+        applied_list = np.where(min_applied, np.asarray(min_hours, dtype=np.float64),
+                                np.asarray(hours, dtype=np.float64)).tolist()
+        applied_flags = min_applied.tolist()
+
+        ok_list = ok.tolist()
+        results = []
+        for i in range(len(base_list)):
+            if ok_list[i]:
+                results.append({
+                    'base_cost': base_list[i],
+                    'mobilization_fee': fee_list[i],
+                    'total_cost': total_list[i],
+                    'applied_hours': applied_list[i],
+                    'min_hours_applied': applied_flags[i]
+                })
+                continue
+            single = CostCalculationService.calculate_equipment_cost(
+                units=int(units[i]),
+                hours=Decimal(str(hours[i])),
+                hourly_rate=Decimal(str(hourly_rates[i])),
+                min_hours=Decimal(str(min_hours[i])),
+                mobilization_fee=Decimal(str(mobilization_fees[i]))
+            )
+            results.append({
+                'base_cost': float(single['base_cost']),
+                'mobilization_fee': float(single['mobilization_fee']),
+                'total_cost': float(single['total_cost']),
+                'applied_hours': float(single['applied_hours']),
+                'min_hours_applied': single['min_hours_applied']
+            })
+        return results
+
+    @staticmethod
+    def material_costs(
+        quantities: Sequence[float],
+        unit_prices: Sequence[float],
+        waste_rates: Sequence[float]
+    ) -> List[Dict]:
+        """자재비 = 수량 × 단가 × (1 + 할증율)"""
+        q, q_ok = _to_units(quantities, 3)
+        p, p_ok = _to_units(unit_prices, 2)
+        w, w_ok = _to_units(waste_rates, 4)
+
+        approx_base = q.astype(np.float64) * p
+        ok = q_ok & p_ok & w_ok & _safe(approx_base * 10 ** 4, approx_base * w)
+
+        base = np.where(ok, q * p, 0)                 # 10^-5
+        waste = base * np.where(ok, w, 0)             # 10^-9
+        total = base * 10 ** 4 + waste                # 10^-9
+
+        base_list = _cents_to_float(_round_half_even(base, 3))
+        waste_list = _cents_to_float(_round_half_even(waste, 7))
+        total_list = _cents_to_float(_round_half_even(total, 7))
+        rate_percent = (w / 100.0).tolist()
+
+        ok_list = ok.tolist()
+        results = []
+        for i in range(len(base_list)):
+            if ok_list[i]:
+                results.append({
+                    'base_cost': base_list[i],
+                    'waste_amount': waste_list[i],
+                    'total_cost': total_list[i],
+                    'waste_rate_percent': rate_percent[i]
+                })
+                continue
+            single = CostCalculationService.calculate_material_cost(
+                quantity=Decimal(str(quantities[i])),
+                unit_price=Decimal(str(unit_prices[i])),
+                waste_rate=Decimal(str(waste_rates[i]))
+            )
+            results.append({
+                'base_cost': float(single['base_cost']),
+                'waste_amount': float(single['waste_amount']),
+                'total_cost': float(single['total_cost']),
+                'waste_rate_percent': float(single['waste_rate'])
+            })
+        return results
+
+    @staticmethod
+    def vat(supply_amounts: Sequence[float], vat_rates: Sequence[float], tax_modes: Sequence[str]) -> List[Dict]:
+        """부가세 = 공급가액 × 세율% (면세/영세율은 0)"""
+        s, s_ok = _to_units(supply_amounts, 2)
+        r, r_ok = _to_units(vat_rates, 2)
+        taxable = ~np.isin(np.asarray(tax_modes, dtype=object), ["exempt", "zero"])
+
+        ok = s_ok & r_ok & _safe(s.astype(np.float64) * r, s * 10.0 ** 4)
+
+        vat_units = np.where(ok & taxable, s * r, 0)  # 10^-6 (세율% → /100)
+        total_units = np.where(ok, s * 10 ** 4, 0) + vat_units
+
+        supply_list = _cents_to_float(s)
+        vat_list = _cents_to_float(_round_half_even(vat_units, 4))
+        total_list = _cents_to_float(_round_half_even(total_units, 4))
+        rates = np.asarray(vat_rates, dtype=np.float64).tolist()
+
+        ok_list = ok.tolist()
+        results = []
+        for i in range(len(supply_list)):
+            if ok_list[i]:
+                results.append({
+                    'supply_amount': supply_list[i],
+                    'vat_amount': vat_list[i],
+                    'total_amount': total_list[i],
+                    'vat_rate': rates[i],
+                    'tax_mode': tax_modes[i]
+                })
+                continue
+            single = CostCalculationService.calculate_vat(
+                supply_amount=Decimal(str(supply_amounts[i])),
+                vat_rate=Decimal(str(vat_rates[i])),
+                tax_mode=tax_modes[i]
+            )
+            results.append({
+                'supply_amount': float(single['supply_amount']),
+                'vat_amount': float(single['vat_amount']),
+                'total_amount': float(single['total_amount']),
+                'vat_rate': float(single['vat_rate']),
+                'tax_mode': single['tax_mode']
+            })
+        return results
@@ -0,0 +1,248 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from sqlalchemy import func, or_, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, sessionmaker
+from typing import Callable, Dict, List, Optional
+from datetime import date, datetime, timedelta
+import time
+from decimal import Decimal
+from ..database import SessionLocal
+from ..models import Invoice
+from ..models.billing_runs import BillingRun, BillingRunItem, BillingRunStatus, BillingItemStatus
+from .invoice_service import InvoiceAggregationService
+from .rollup_service import CostRollupService
+
+ProgressCallback = Callable[[int, int, BillingRunItem], None]
+
+
+class BillingRunInProgressError(ValueError):
+    """이미 실행 중인 일괄 청구를 다시 시작하려 함"""
+
+
+class BatchBillingService:
+    """월말 일괄 청구 서비스
+
+    - 기간 내 투입 이력이 있고 아직 해당 기간 청구서가 없는 프로젝트를 대상으로 실행을 만든다.
+    - 프로젝트마다 별도 세션/트랜잭션으로 청구서를 생성하며 동시 실행 수는 concurrency로 제한한다.
+    - 실패는 프로젝트 단위로 기록되고, 재실행(resume) 시 완료된 프로젝트는 건너뛴다.
+    - 청구서 커밋 직후 중단되어도 재실행 시 같은 기간의 기존 청구서를 찾아 연결하므로 중복 발행되지 않는다.
+    - 실행 시작은 조건부 UPDATE로 RUNNING을 선점하므로 같은 실행을 두 작업자가 동시에 처리하지 않는다.
+    - 실행 중에는 heartbeat_at을 HEARTBEAT_SECONDS마다 갱신한다. 작업자가 죽어 LEASE_SECONDS 넘게
+      갱신이 없으면 다른 작업자가 재개로 넘겨받고, 실행 도중 예외가 나면 PARTIAL로 남겨 재개할 수 있게 한다.
+    """
+
+    DEFAULT_CONCURRENCY = 4
+    HEARTBEAT_SECONDS = 30
+    LEASE_SECONDS = 600
+
+    def __init__(self, db: Session, session_factory: sessionmaker = SessionLocal):
+        self.db = db
+        self.session_factory = session_factory
+
+    def create_run(
+        self,
+        period_from: date,
+        period_to: date,
+        project_ids: Optional[List[int]] = None,
+        vat_rate: Decimal = Decimal('10.0')
+    ) -> BillingRun:
+        """청구 대상 프로젝트를 확정하여 실행 레코드 생성"""
+        if period_from > period_to:
+            raise ValueError("청구 시작일이 종료일보다 늦습니다")
+
+        active = CostRollupService(self.db).summarize_projects(project_ids, period_from, period_to)
+
+        billed = {
+            project_id for (project_id,) in self.db.query(Invoice.project_id).filter(
+                Invoice.period_from == period_from,
+                Invoice.period_to == period_to
+            )
+        }
+
+        run = BillingRun(period_from=period_from, period_to=period_to, vat_rate=vat_rate)
+        run.items = [
+            BillingRunItem(project_id=project_id)
+            for project_id in sorted(active)
+            if project_id not in billed
+        ]
+        self.db.add(run)
+        self.db.commit()
+        self.db.refresh(run)
+        return run
+
+    def claim_run(self, run_id: int, force: bool = False) -> None:
+        """실행을 RUNNING으로 전환 (다른 작업자가 실행 중이면 BillingRunInProgressError)
+
+        조회 후 갱신하면 동시에 들어온 재개 요청이 둘 다 통과하므로 상태 조건을 건 UPDATE 한 번으로 선점한다.
+        RUNNING이어도 heartbeat_at이 LEASE_SECONDS 넘게 멈췄으면 작업자가 죽은 것으로 보고 넘겨받는다.
+        force=True는 갱신 시각과 관계없이 넘겨받는다 (운영자가 작업자가 없음을 확인했을 때만).
+        """
+        now = datetime.now()
+        stmt = update(BillingRun).where(BillingRun.id == run_id)
+        if not force:
+            stmt = stmt.where(or_(
+                BillingRun.status != BillingRunStatus.RUNNING,
+                BillingRun.heartbeat_at.is_(None),
+                BillingRun.heartbeat_at < now - timedelta(seconds=self.LEASE_SECONDS)
+            ))
+        result = self.db.execute(stmt.values(status=BillingRunStatus.RUNNING, heartbeat_at=now, finished_at=None))
+        self.db.commit()
+        if result.rowcount == 0:
+            if self.db.get(BillingRun, run_id) is None:
+                raise ValueError("일괄 청구 실행을 찾을 수 없습니다")
+            raise BillingRunInProgressError(
+                f"이미 실행 중인 일괄 청구입니다 (작업자 응답이 {self.LEASE_SECONDS}초 넘게 없으면 재개할 수 있습니다)"
+            )
+
+    def execute(
+        self,
+        run_id: int,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        progress: Optional[ProgressCallback] = None,
+        claimed: bool = False
+    ) -> BillingRun:
+        """대기/실패 상태 프로젝트를 병렬 처리 (중단된 실행의 재개에도 사용)
+
+        claimed=True면 호출자가 이미 claim_run으로 실행을 선점한 것으로 본다.
+        프로젝트 처리 밖에서 예외가 나면(작업 스레드 오류, 최종 커밋 실패 등) 실행을 PARTIAL로 남기고 다시 던진다.
+        """
+        if not claimed:
+            self.claim_run(run_id)
+        finished = False
+        try:
+            run = self.db.get(BillingRun, run_id)
+            if run is None:
+                raise ValueError("일괄 청구 실행을 찾을 수 없습니다")
+
+            pending_ids = [
+                item.id for item in run.items
+                if item.status != BillingItemStatus.SUCCEEDED
+            ]
+            period_from, period_to, vat_rate = run.period_from, run.period_to, Decimal(str(run.vat_rate))
+
+            done = 0
+            last_beat = time.monotonic()
+            with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+                pending = {
+                    executor.submit(self._bill_project, item_id, period_from, period_to, vat_rate)
+                    for item_id in pending_ids
+                }
+                while pending:
+                    completed, pending = wait(pending, timeout=self.HEARTBEAT_SECONDS, return_when=FIRST_COMPLETED)
+                    for future in completed:
+                        item = future.result()
+                        done += 1
+                        if progress is not None:
+                            progress(done, len(pending_ids), item)
+                    if time.monotonic() - last_beat >= self.HEARTBEAT_SECONDS:
+                        self._heartbeat(run_id)
+                        last_beat = time.monotonic()
+
+            self.db.expire_all()
+            run = self.db.get(BillingRun, run_id)
+            failed = any(item.status == BillingItemStatus.FAILED for item in run.items)
+            run.status = BillingRunStatus.PARTIAL if failed else BillingRunStatus.COMPLETED
+            run.finished_at = datetime.now()
+            self.db.commit()
+            finished = True
+        finally:
+            if not finished:
+                try:
+                    self._abandon(run_id)
+                except SQLAlchemyError:
+                    pass  # 원래 예외를 가리지 않는다 (표시하지 못한 실행은 리스가 끝나면 넘겨받는다)
+        self.db.refresh(run)
+        return run
+
+    def _heartbeat(self, run_id: int) -> None:
+        self.db.execute(update(BillingRun).where(BillingRun.id == run_id).values(heartbeat_at=datetime.now()))
+        self.db.commit()
+
+    def _abandon(self, run_id: int) -> None:
+        """실행 중 오류로 끝난 실행을 PARTIAL로 표시 (재개 가능하도록)"""
+        self.db.rollback()
+        self.db.execute(
+            update(BillingRun)
+            .where(BillingRun.id == run_id, BillingRun.status == BillingRunStatus.RUNNING)
+            .values(status=BillingRunStatus.PARTIAL, finished_at=datetime.now())
+        )
+        self.db.commit()
+
+    def _bill_project(self, item_id: int, period_from: date, period_to: date, vat_rate: Decimal) -> BillingRunItem:
+        """프로젝트 1건 청구 (작업 스레드 전용 세션 사용)"""
+        db = self.session_factory()
+        try:
+            item = db.get(BillingRunItem, item_id)
+            item.attempts += 1
+            try:
+                existing = db.query(Invoice).filter(
+                    Invoice.project_id == item.project_id,
+                    Invoice.period_from == period_from,
+                    Invoice.period_to == period_to
+                ).first()
+
+                if existing is None:
+                    existing = InvoiceAggregationService(db).create_invoice_from_aggregation(
+                        project_id=item.project_id,
+                        period_from=period_from,
+                        period_to=period_to,
+                        vat_rate=vat_rate,
+                        idempotency_key=f"billing:{item.project_id}:{period_from.isoformat()}:{period_to.isoformat()}"
+                    )
+
+                item.status = BillingItemStatus.SUCCEEDED
+                item.invoice_id = existing.id
+                item.error = None
+            except Exception as e:
+                db.rollback()
+                item = db.get(BillingRunItem, item_id)
+                item.attempts += 1
+                item.status = BillingItemStatus.FAILED
+                item.error = str(e)
+
+            db.commit()
+            db.refresh(item)
+            db.expunge(item)
+            return item
+        finally:
+            db.close()
+
+    def get_progress(self, run_id: int) -> Optional[Dict]:
+        """실행 상태와 프로젝트 상태별 건수"""
+        run = self.db.get(BillingRun, run_id)
+        if run is None:
+            return None
+
+        counts = {status.value: 0 for status in BillingItemStatus}
+        for status, count in self.db.query(BillingRunItem.status, func.count()).filter(
+            BillingRunItem.run_id == run_id
+        ).group_by(BillingRunItem.status):
+            counts[status.value] = count
+
+        return {
+            'run_id': run.id,
+            'period_from': run.period_from,
+            'period_to': run.period_to,
+            'status': run.status.value,
+            'total': sum(counts.values()),
+            'counts': counts,
+            'heartbeat_at': run.heartbeat_at,
+            'finished_at': run.finished_at,
+            'failures': [
+                {'project_id': item.project_id, 'error': item.error, 'attempts': item.attempts}
+                for item in run.items if item.status == BillingItemStatus.FAILED
+            ]
+        }
+
+
+def execute_billing_run(
+    run_id: int,
+    concurrency: int = BatchBillingService.DEFAULT_CONCURRENCY,
+    claimed: bool = False
+) -> None:
+    """백그라운드 작업용 진입점 (요청 세션과 분리된 세션 사용)"""
+    db = SessionLocal()
+    try:
+        BatchBillingService(db).execute(run_id, concurrency=concurrency, claimed=claimed)
+    finally:
+        db.close()
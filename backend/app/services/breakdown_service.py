@@ -0,0 +1,128 @@
+from sqlalchemy import Numeric, func, or_, type_coerce
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional
+from datetime import date
+from decimal import Decimal, InvalidOperation
+import enum
+from ..models import WorkLog, WorkItem, LaborEntry, EquipmentEntry, MaterialEntry
+from .pagination import decode_cursor, encode_cursor
+from .rollup_service import labor_cost_expr, equipment_cost_expr, material_cost_expr
+
+# 정렬과 커서 비교는 0.01원 단위로 반올림한 합계로 한다 (부동소수 합계의 미세한 차이로 행이 누락되지 않도록)
+SORT_AMOUNT_TYPE = Numeric(18, 2)
+
+
+class BreakdownDimension(str, enum.Enum):
+    TRADE = "trade"                    # 노무: 직종
+    EQUIPMENT_CODE = "equipment_code"  # 장비: 장비코드
+    MATERIAL_CODE = "material_code"    # 자재: 자재코드
+    SUPPLIER = "supplier"              # 자재: 공급처
+
+
+class BreakdownSort(str, enum.Enum):
+    AMOUNT = "amount"  # 금액 내림차순 (같은 금액이면 키 오름차순)
+    KEY = "key"        # 키 오름차순
+
+
+# 기준별 (투입 테이블의 작업항목 FK, 그룹 키 컬럼, 표시명 컬럼, 금액식)
+DIMENSIONS = {
+    BreakdownDimension.TRADE: (LaborEntry.work_item_id, LaborEntry.trade, None, labor_cost_expr),
+    BreakdownDimension.EQUIPMENT_CODE: (
+        EquipmentEntry.work_item_id, EquipmentEntry.equipment_code, EquipmentEntry.equipment_name, equipment_cost_expr
+    ),
+    BreakdownDimension.MATERIAL_CODE: (
+        MaterialEntry.work_item_id, MaterialEntry.material_code, MaterialEntry.material_name, material_cost_expr
+    ),
+    BreakdownDimension.SUPPLIER: (MaterialEntry.work_item_id, MaterialEntry.supplier, None, material_cost_expr),
+}
+
+
+def _decode_sort_key(cursor: str, sort: BreakdownSort) -> List:
+    """커서를 정렬 기준에 맞는 (금액, 키) 또는 (키,)로 해석"""
+    if sort == BreakdownSort.AMOUNT:
+        amount, key = decode_cursor(cursor, 2)
+        try:
+            return [Decimal(str(amount)), str(key)]
+        except InvalidOperation:
+            raise ValueError("잘못된 커서입니다")
+    (key,) = decode_cursor(cursor, 1)
+    return [str(key)]
+
+
+class CostBreakdownService:
+    """직종/장비코드/자재코드/공급처별 비용 상세 집계
+
+    그룹핑, 정렬, 상위 N건 제한을 모두 DB에서 수행하고,
+    다음 페이지는 (금액, 키) 키셋 커서로 이어서 조회한다.
+    """
+
+    MAX_LIMIT = 500
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def breakdown(
+        self,
+        project_id: int,
+        period_from: date,
+        period_to: date,
+        dimension: BreakdownDimension,
+        sort: BreakdownSort = BreakdownSort.AMOUNT,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> Dict:
+        """기준별 비용 합계 한 페이지와 다음 페이지 커서"""
+        work_item_fk, key_column, label_column, cost_expr = DIMENSIONS[dimension]
+        limit = max(1, min(limit, self.MAX_LIMIT))
+
+        # 코드가 비어 있는 행은 빈 문자열 키로 묶는다 (커서 비교가 NULL 없이 되도록)
+        key = func.coalesce(key_column, '')
+        amount = type_coerce(func.round(func.sum(cost_expr()), 2), SORT_AMOUNT_TYPE)
+        columns = [key.label('key'), amount.label('amount'), func.count().label('entries_count')]
+        if label_column is not None:
+            columns.append(func.max(label_column).label('label'))
+
+        query = self.db.query(*columns).select_from(work_item_fk.table).join(
+            WorkItem, work_item_fk == WorkItem.id
+        ).join(
+            WorkLog, WorkItem.work_log_id == WorkLog.id
+        ).filter(
+            WorkLog.project_id == project_id,
+            WorkLog.work_date >= period_from,
+            WorkLog.work_date <= period_to
+        ).group_by(key)
+
+        if sort == BreakdownSort.AMOUNT:
+            if cursor:
+                last_amount, last_key = _decode_sort_key(cursor, sort)
+                query = query.having(or_(amount < last_amount, (amount == last_amount) & (key > last_key)))
+            query = query.order_by(amount.desc(), key)
+        else:
+            if cursor:
+                (last_key,) = _decode_sort_key(cursor, sort)
+                query = query.filter(key > last_key)
+            query = query.order_by(key)
+
+        rows = query.limit(limit + 1).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        items = [
+            {
+                'key': row.key or None,
+                'label': getattr(row, 'label', None) or row.key or None,
+                'amount': Decimal(row.amount or 0),
+                'entries_count': row.entries_count
+            }
+            for row in rows
+        ]
+
+        next_cursor = None
+        if has_more:
+            last = rows[-1]
+            if sort == BreakdownSort.AMOUNT:
+                next_cursor = encode_cursor([str(last.amount), last.key])
+            else:
+                next_cursor = encode_cursor([last.key])
+
+        return {'items': items, 'next_cursor': next_cursor}
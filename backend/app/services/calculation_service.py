@@ -1,6 +1,7 @@
 from decimal import Decimal
 from typing import Dict, List
 from ..models import LaborEntry, EquipmentEntry, MaterialEntry, WorkItem
+from .money import ZERO, as_decimal, percent_of, quantize
 
 class CostCalculationService:
     """건설업 표준 원가 계산 서비스"""
@@ -17,8 +18,8 @@ class CostCalculationService:
         - 일당: 인원 × 일수 × 일당
         - 시급: 인원 × 시간 × 시급
         """
-        base_cost = Decimal(str(persons)) * hours * unit_rate
-        return base_cost.quantize(Decimal('0.01'))
+        base_cost = as_decimal(persons) * hours * unit_rate
+        return quantize(base_cost)
     
     @staticmethod
     def calculate_equipment_cost(
@@ -37,15 +38,15 @@ class CostCalculationService:
         actual_hours = max(hours, min_hours)
         
         # 기본 장비비
-        base_cost = Decimal(str(units)) * actual_hours * hourly_rate
+        base_cost = as_decimal(units) * actual_hours * hourly_rate
         
         # 총 장비비 (이동/설치비 포함)
         total_cost = base_cost + mobilization_fee
         
         return {
-            'base_cost': base_cost.quantize(Decimal('0.01')),
-            'mobilization_fee': mobilization_fee.quantize(Decimal('0.01')),
-            'total_cost': total_cost.quantize(Decimal('0.01')),
+            'base_cost': quantize(base_cost),
+            'mobilization_fee': quantize(mobilization_fee),
+            'total_cost': quantize(total_cost),
             'applied_hours': actual_hours,
             'min_hours_applied': actual_hours > hours
         }
@@ -66,9 +67,9 @@ class CostCalculationService:
         total_cost = base_cost + waste_amount
         
         return {
-            'base_cost': base_cost.quantize(Decimal('0.01')),
-            'waste_amount': waste_amount.quantize(Decimal('0.01')),
-            'total_cost': total_cost.quantize(Decimal('0.01')),
+            'base_cost': quantize(base_cost),
+            'waste_amount': quantize(waste_amount),
+            'total_cost': quantize(total_cost),
             'waste_rate': waste_rate * 100  # 백분율로 표시
         }
     
@@ -85,16 +86,16 @@ class CostCalculationService:
         - 영세율: 0% VAT
         """
         if tax_mode == "exempt" or tax_mode == "zero":
-            vat_amount = Decimal('0')
+            vat_amount = ZERO
         else:
-            vat_amount = supply_amount * (vat_rate / Decimal('100'))
+            vat_amount = percent_of(supply_amount, vat_rate)
         
         total_amount = supply_amount + vat_amount
         
         return {
-            'supply_amount': supply_amount.quantize(Decimal('0.01')),
-            'vat_amount': vat_amount.quantize(Decimal('0.01')),
-            'total_amount': total_amount.quantize(Decimal('0.01')),
+            'supply_amount': quantize(supply_amount),
+            'vat_amount': quantize(vat_amount),
+            'total_amount': quantize(total_amount),
             'vat_rate': vat_rate,
             'tax_mode': tax_mode
         }
@@ -112,24 +113,24 @@ class CostCalculationService:
         - 계약금액 × 기성율 - 선급금 - 기지급액 - 하자보수비
         """
         # 누적 기성액
-        cumulative_amount = contract_amount * (progress_rate / Decimal('100'))
+        cumulative_amount = percent_of(contract_amount, progress_rate)
         
         # 선급금
-        advance_amount = contract_amount * (advance_rate / Decimal('100'))
+        advance_amount = percent_of(contract_amount, advance_rate)
         
         # 하자보수비 (기성액 기준)
-        defect_amount = cumulative_amount * (defect_rate / Decimal('100'))
+        defect_amount = percent_of(cumulative_amount, defect_rate)
         
         # 당회 기성액
         current_payment = cumulative_amount - advance_amount - previous_payments - defect_amount
         
         return {
-            'contract_amount': contract_amount.quantize(Decimal('0.01')),
-            'cumulative_amount': cumulative_amount.quantize(Decimal('0.01')),
-            'advance_amount': advance_amount.quantize(Decimal('0.01')),
-            'defect_amount': defect_amount.quantize(Decimal('0.01')),
-            'previous_payments': previous_payments.quantize(Decimal('0.01')),
-            'current_payment': max(current_payment, Decimal('0')).quantize(Decimal('0.01')),
+            'contract_amount': quantize(contract_amount),
+            'cumulative_amount': quantize(cumulative_amount),
+            'advance_amount': quantize(advance_amount),
+            'defect_amount': quantize(defect_amount),
+            'previous_payments': quantize(previous_payments),
+            'current_payment': quantize(max(current_payment, ZERO)),
             'progress_rate': progress_rate
         }
     
@@ -160,7 +161,7 @@ class CostCalculationService:
         })
         
         # 수량 기준 소요량 계산
-        quantity = Decimal(str(work_item.quantity))
+        quantity = as_decimal(work_item.quantity)
         
         return {
             'required_labor_hours': (quantity * coefficients['labor_coefficient']).quantize(Decimal('0.1')),
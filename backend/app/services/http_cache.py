@@ -0,0 +1,47 @@
+"""
+조건부 GET(ETag) 도우미
+
+목록/상세 응답의 약한 ETag를 실제 조회·직렬화 없이 테이블 버전 카운터(table_versions)
+조회 1회로 만들고, If-None-Match가 일치하면 본문 없이 304로 끝낸다.
+"""
+from fastapi import HTTPException, Request, Response
+from sqlalchemy.orm import Session
+from typing import Optional, Tuple
+import hashlib
+import json
+from ..models.table_versions import TableVersion
+
+# 캐시는 하되 매번 ETag로 재검증하도록
+CACHE_CONTROL = "no-cache"
+
+
+def weak_etag(*parts) -> str:
+    """버전 값들로 약한 ETag 생성"""
+    digest = hashlib.sha1(json.dumps(parts, default=str, ensure_ascii=False).encode()).hexdigest()
+    return f'W/"{digest[:24]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 etag와 일치하는지 (약한 비교)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag.removeprefix("W/") for tag in candidates)
+
+
+def check_not_modified(request: Request, response: Response, etag: str) -> None:
+    """If-None-Match가 일치하면 304로 중단, 아니면 응답 헤더에 ETag 설정"""
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        raise HTTPException(status_code=304, headers=headers)
+    response.headers.update(headers)
+
+
+def table_version(db: Session, *table_names: str) -> Tuple[int, ...]:
+    """테이블별 버전 카운터 (쓰기가 한 번도 없었던 테이블은 0)"""
+    versions = dict(
+        db.query(TableVersion.table_name, TableVersion.version).filter(TableVersion.table_name.in_(table_names))
+    )
+    return tuple(versions.get(name, 0) for name in table_names)
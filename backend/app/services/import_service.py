@@ -0,0 +1,422 @@
+"""
+작업일지 대량 가져오기 (CSV / JSONL)
+
+입력은 한 번에 한 작업일지씩 스트리밍으로 읽고, chunk_size개씩 검증하여
+일괄 INSERT(PostgreSQL은 COPY, SQLite는 executemany) 후 청크마다 커밋한다.
+메모리에는 현재 청크와 (상한이 있는) 오류 목록만 남는다.
+
+JSONL: 한 줄에 작업일지 1건 (WorkLogImport 형식, 작업항목 아래에 투입 내역 중첩)
+
+CSV: 한 행에 투입 내역 1건. log_key가 같은 연속된 행이 한 작업일지,
+그 안에서 item_key가 같은 행이 한 작업항목이 된다. 작업일지/작업항목 컬럼은
+그룹의 첫 행 값을 쓰며, entry_type이 비어 있는 행은 투입 없는 작업항목(또는 작업일지)이다.
+
+    log_key, project_id, work_date, area, weather, process_status, notes,
+    item_key, task_code, task_name, specification, quantity, unit, progress_rate,
+    entry_type (labor | equipment | material),
+    trade, persons, hours, rate_type, unit_rate,
+    equipment_code, equipment_name, equipment_specification, units, equipment_hours,
+    hourly_rate, min_hours, mobilization_fee,
+    material_code, material_name, material_specification, material_quantity,
+    material_unit, unit_price, supplier
+"""
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+from pydantic import ValidationError
+from typing import Callable, Dict, Iterator, List, Optional, TextIO, Tuple
+from decimal import Decimal
+import csv
+import enum
+import io
+import json
+import time
+from ..models import Project, WorkLog, WorkItem, LaborEntry, EquipmentEntry, MaterialEntry
+from ..models.cost_rollups import CostCategory
+from ..models.labor_entries import RateType
+from ..models.material_entries import StockType
+from ..models.work_log_search import reindex_work_logs
+from ..schemas.work_logs import WorkLogImport
+from . import money
+from .labor_stats_service import LaborRateStatsService
+from .rollup_service import CostRollupService, RollupKey, equipment_cost, labor_cost, material_cost
+
+# (줄 번호, 작업일지 원본 dict 또는 파싱 오류 메시지)
+RawRecord = Tuple[int, object]
+ProgressCallback = Callable[[Dict], None]
+
+
+class ImportFormat(str, enum.Enum):
+    CSV = "csv"
+    JSONL = "jsonl"
+
+
+LOG_COLUMNS = ("project_id", "work_date", "area", "weather", "process_status", "notes")
+ITEM_COLUMNS = ("task_code", "task_name", "specification", "quantity", "unit", "progress_rate")
+# entry_type별 (중첩 목록 키, {스키마 필드: CSV 컬럼})
+ENTRY_COLUMNS = {
+    "labor": ("labor_entries", {
+        "trade": "trade", "persons": "persons", "hours": "hours",
+        "rate_type": "rate_type", "unit_rate": "unit_rate",
+    }),
+    "equipment": ("equipment_entries", {
+        "equipment_code": "equipment_code", "equipment_name": "equipment_name",
+        "specification": "equipment_specification", "units": "units", "hours": "equipment_hours",
+        "hourly_rate": "hourly_rate", "min_hours": "min_hours", "mobilization_fee": "mobilization_fee",
+    }),
+    "material": ("material_entries", {
+        "material_code": "material_code", "material_name": "material_name",
+        "specification": "material_specification", "quantity": "material_quantity",
+        "unit": "material_unit", "unit_price": "unit_price", "supplier": "supplier",
+    }),
+}
+
+
+def _pick(row: Dict[str, str], columns) -> Dict[str, str]:
+    """빈 칸은 생략하여 스키마 기본값이 적용되도록 한다"""
+    if isinstance(columns, dict):
+        pairs = columns.items()
+    else:
+        pairs = ((column, column) for column in columns)
+    return {field: row[column] for field, column in pairs if row.get(column) not in (None, "")}
+
+
+def iter_jsonl(stream: TextIO) -> Iterator[RawRecord]:
+    """JSONL 스트림에서 작업일지 1건씩"""
+    for line_no, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_no, json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_no, f"JSON 형식 오류: {e.msg}"
+
+
+def iter_csv(stream: TextIO) -> Iterator[RawRecord]:
+    """CSV 스트림에서 log_key가 같은 연속 행을 묶어 작업일지 1건씩"""
+    reader = csv.DictReader(stream)
+    current_key = None
+    current: Optional[Dict] = None
+    current_line = 0
+    items: Dict[str, Dict] = {}
+    bad: Optional[str] = None
+
+    for row in reader:
+        line_no = reader.line_num
+        log_key = (row.get("log_key") or "").strip()
+        if not log_key:
+            yield line_no, "log_key가 비어 있습니다"
+            continue
+
+        if log_key != current_key:
+            if current is not None:
+                yield current_line, bad or current
+            current_key, current_line, bad = log_key, line_no, None
+            current = _pick(row, LOG_COLUMNS)
+            current["work_items"] = []
+            items = {}
+
+        item_key = (row.get("item_key") or "").strip()
+        if not item_key:
+            if row.get("entry_type"):
+                bad = bad or f"{line_no}행: 투입 내역에 item_key가 없습니다"
+            continue
+
+        item = items.get(item_key)
+        if item is None:
+            item = _pick(row, ITEM_COLUMNS)
+            items[item_key] = item
+            current["work_items"].append(item)
+
+        entry_type = (row.get("entry_type") or "").strip()
+        if not entry_type:
+            continue
+        if entry_type not in ENTRY_COLUMNS:
+            bad = bad or f"{line_no}행: 알 수 없는 entry_type입니다: {entry_type}"
+            continue
+        list_key, columns = ENTRY_COLUMNS[entry_type]
+        item.setdefault(list_key, []).append(_pick(row, columns))
+
+    if current is not None:
+        yield current_line, bad or current
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}"
+        for detail in error.errors()
+    )
+
+
+def _copy_value(value):
+    """COPY CSV 값 (None은 NULL, Enum은 SQLAlchemy Enum 컬럼과 같이 이름으로 저장)"""
+    if value is None:
+        return None
+    if isinstance(value, enum.Enum):
+        return value.name
+    return value
+
+
+class WorkLogImportService:
+    """작업일지 대량 가져오기 서비스"""
+
+    DEFAULT_CHUNK_SIZE = 500
+    MAX_REPORTED_ERRORS = 1000
+
+    def __init__(self, db: Session, chunk_size: int = DEFAULT_CHUNK_SIZE, max_errors: int = MAX_REPORTED_ERRORS):
+        self.db = db
+        self.chunk_size = max(1, chunk_size)
+        self.max_errors = max_errors
+        self.is_postgresql = db.get_bind().dialect.name == "postgresql"
+        self._known_projects = set()
+
+    def import_stream(
+        self,
+        stream: TextIO,
+        import_format: ImportFormat,
+        progress: Optional[ProgressCallback] = None
+    ) -> Dict:
+        """스트림 전체를 청크 단위로 가져오고 결과 요약 반환"""
+        records = iter_csv(stream) if import_format == ImportFormat.CSV else iter_jsonl(stream)
+        self.stats = {
+            'records_read': 0,
+            'work_logs_imported': 0,
+            'work_items_imported': 0,
+            'entries_imported': 0,
+            'failed': 0,
+            'errors': [],
+        }
+        started = time.perf_counter()
+
+        chunk: List[Tuple[int, WorkLogImport]] = []
+        for line_no, raw in records:
+            self.stats['records_read'] += 1
+            record = self._validate(line_no, raw)
+            if record is not None:
+                chunk.append((line_no, record))
+            if len(chunk) >= self.chunk_size:
+                self._flush_chunk(chunk)
+                chunk = []
+                if progress is not None:
+                    progress(self._summary(started))
+        if chunk:
+            self._flush_chunk(chunk)
+
+        return self._summary(started)
+
+    def _summary(self, started: float) -> Dict:
+        elapsed = time.perf_counter() - started
+        summary = dict(self.stats)
+        summary['elapsed_seconds'] = round(elapsed, 3)
+        summary['records_per_second'] = round(self.stats['records_read'] / elapsed, 1) if elapsed > 0 else None
+        return summary
+
+    def _error(self, line_no: int, message: str) -> None:
+        self.stats['failed'] += 1
+        if len(self.stats['errors']) < self.max_errors:
+            self.stats['errors'].append({'line': line_no, 'error': message})
+
+    def _validate(self, line_no: int, raw) -> Optional[WorkLogImport]:
+        if isinstance(raw, str):
+            self._error(line_no, raw)
+            return None
+        try:
+            record = WorkLogImport(**raw)
+            for item in record.work_items:
+                for labor in item.labor_entries:
+                    RateType(labor.rate_type)
+            return record
+        except ValidationError as e:
+            self._error(line_no, _validation_message(e))
+        except (TypeError, ValueError) as e:
+            self._error(line_no, str(e))
+        return None
+
+    # ---- 청크 적재 ----
+
+    def _flush_chunk(self, chunk: List[Tuple[int, WorkLogImport]]) -> None:
+        """프로젝트 존재 확인 후 청크를 한 트랜잭션으로 적재 (실패 시 건별로 다시 시도해 오류 행을 찾는다)"""
+        unknown = {record.project_id for _, record in chunk} - self._known_projects
+        if unknown:
+            found = {
+                project_id for (project_id,) in
+                self.db.query(Project.id).filter(Project.id.in_(unknown))
+            }
+            self._known_projects |= found
+        valid = []
+        for line_no, record in chunk:
+            if record.project_id in self._known_projects:
+                valid.append((line_no, record))
+            else:
+                self._error(line_no, f"프로젝트를 찾을 수 없습니다: {record.project_id}")
+        if not valid:
+            return
+
+        # 적재 건수는 커밋이 성공한 뒤에만 더한다 (커밋 실패 후 건별 재시도에서 중복 집계하지 않도록)
+        try:
+            counts = self._write([record for _, record in valid])
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            for line_no, record in valid:
+                try:
+                    counts = self._write([record])
+                    self.db.commit()
+                except Exception as e:
+                    self.db.rollback()
+                    self._error(line_no, str(e).splitlines()[0])
+                else:
+                    self._add_counts(counts)
+        else:
+            self._add_counts(counts)
+
+    def _add_counts(self, counts: Dict[str, int]) -> None:
+        for name, count in counts.items():
+            self.stats[name] += count
+
+    def _write(self, records: List[WorkLogImport]) -> Dict[str, int]:
+        """작업일지들을 일괄 INSERT (커밋은 호출자), 적재한 행 수 반환"""
+        log_rows = [
+            {
+                'project_id': record.project_id,
+                'work_date': record.work_date,
+                'area': record.area,
+                'weather': record.weather,
+                'process_status': record.process_status,
+                'notes': record.notes,
+            }
+            for record in records
+        ]
+        log_ids = self._insert_with_ids(WorkLog, log_rows)
+        reindex_work_logs(self.db, log_ids)  # Core INSERT라 검색 색인은 커밋 때 따로 반영
+
+        item_rows = []
+        item_sources = []
+        for record, log_id in zip(records, log_ids):
+            for item in record.work_items:
+                item_rows.append({
+                    'work_log_id': log_id,
+                    'task_code': item.task_code,
+                    'task_name': item.task_name,
+                    'specification': item.specification,
+                    'quantity': money.as_decimal(item.quantity),
+                    'unit': item.unit,
+                    'progress_rate': money.as_decimal(item.progress_rate),
+                    'notes': item.notes,
+                })
+                item_sources.append((record, item))
+        item_ids = self._insert_with_ids(WorkItem, item_rows)
+
+        rows: Dict[type, List[Dict]] = {LaborEntry: [], EquipmentEntry: [], MaterialEntry: []}
+        deltas: Dict[RollupKey, Tuple[Decimal, int]] = {}
+        for (record, item), item_id in zip(item_sources, item_ids):
+            for model, category, values, cost in self._entries(item, item_id):
+                key = (record.project_id, record.work_date, category)
+                amount, count = deltas.get(key, (money.ZERO, 0))
+                deltas[key] = (amount + cost, count + 1)
+
+                values['total_cost'] = money.quantize(cost)
+                rows[model].append(values)
+
+        for model, model_rows in rows.items():
+            self._bulk_insert(model, model_rows)
+        CostRollupService(self.db).add_deltas(deltas)
+        LaborRateStatsService(self.db).add_work_logs(log_ids)
+
+        return {
+            'work_logs_imported': len(log_rows),
+            'work_items_imported': len(item_rows),
+            'entries_imported': sum(len(model_rows) for model_rows in rows.values()),
+        }
+
+    @staticmethod
+    def _entries(item, work_item_id: int) -> Iterator[Tuple[type, CostCategory, Dict, Decimal]]:
+        """작업항목의 투입 내역별 (모델, 비용구분, 컬럼 값, 금액)"""
+        for labor in item.labor_entries:
+            values = {
+                'work_item_id': work_item_id,
+                'trade': labor.trade,
+                'persons': labor.persons,
+                'hours': money.as_decimal(labor.hours),
+                'rate_type': RateType(labor.rate_type),
+                'unit_rate': money.as_decimal(labor.unit_rate),
+            }
+            cost = labor_cost(values['persons'], values['hours'], values['unit_rate'])
+            yield LaborEntry, CostCategory.LABOR, values, cost
+        for equipment in item.equipment_entries:
+            values = {
+                'work_item_id': work_item_id,
+                'equipment_code': equipment.equipment_code,
+                'equipment_name': equipment.equipment_name,
+                'specification': equipment.specification,
+                'units': equipment.units,
+                'hours': money.as_decimal(equipment.hours),
+                'hourly_rate': money.as_decimal(equipment.hourly_rate),
+                'min_hours': money.as_decimal(equipment.min_hours),
+                'mobilization_fee': money.as_decimal(equipment.mobilization_fee),
+            }
+            cost = equipment_cost(values['units'], values['hours'], values['min_hours'], values['hourly_rate'],
+                                  values['mobilization_fee'])
+            yield EquipmentEntry, CostCategory.EQUIPMENT, values, cost
+        for material in item.material_entries:
+            values = {
+                'work_item_id': work_item_id,
+                'material_code': material.material_code,
+                'material_name': material.material_name,
+                'specification': material.specification,
+                'quantity': money.as_decimal(material.quantity),
+                'unit': material.unit,
+                'unit_price': money.as_decimal(material.unit_price),
+                'stock_type': StockType.PURCHASE,
+                'supplier': material.supplier,
+            }
+            cost = material_cost(values['quantity'], values['unit_price'])
+            yield MaterialEntry, CostCategory.MATERIAL, values, cost
+
+    # ---- 방언별 일괄 INSERT ----
+
+    def _insert_with_ids(self, model, rows: List[Dict]) -> List[int]:
+        """부모 행을 일괄 INSERT하고 입력 순서대로 PK 반환"""
+        if not rows:
+            return []
+        if self.is_postgresql:
+            # 시퀀스에서 PK를 미리 받아 COPY로 적재
+            table = model.__table__.name
+            ids = self.db.execute(
+                select(func.nextval(func.pg_get_serial_sequence(table, 'id'))).select_from(
+                    func.generate_series(1, len(rows))
+                )
+            ).scalars().all()
+            for row, row_id in zip(rows, ids):
+                row['id'] = row_id
+            self._copy(model, rows)
+            return ids
+        table = model.__table__
+        return self.db.execute(
+            insert(table).returning(table.c.id, sort_by_parameter_order=True), rows
+        ).scalars().all()
+
+    def _bulk_insert(self, model, rows: List[Dict]) -> None:
+        if not rows:
+            return
+        if self.is_postgresql:
+            self._copy(model, rows)
+        else:
+            self.db.execute(insert(model.__table__), rows)
+
+    def _copy(self, model, rows: List[Dict]) -> None:
+        """PostgreSQL COPY ... FROM STDIN (세션과 같은 트랜잭션의 커넥션 사용)"""
+        columns = list(rows[0].keys())
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow([_copy_value(row[column]) for column in columns])
+        buffer.seek(0)
+
+        cursor = self.db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {model.__table__.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+                buffer
+            )
+        finally:
+            cursor.close()
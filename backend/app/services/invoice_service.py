@@ -1,11 +1,21 @@
+from sqlalchemy import distinct, func
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from typing import List, Dict
+from typing import Dict, List, Optional, Tuple
 from datetime import date, datetime
 from decimal import Decimal
-from ..models import (
-    WorkLog, WorkItem, LaborEntry, EquipmentEntry, MaterialEntry,
-    Invoice, InvoiceLine, Project
-)
+from ..models import WorkLog, WorkItem, Invoice, InvoiceLine, Project
+from ..models.cost_rollups import CostCategory
+from .rollup_service import CostRollupService
+
+
+class DuplicateInvoiceNumberError(ValueError):
+    """같은 청구서 번호가 이미 있음"""
+
+
+class IdempotencyKeyConflictError(ValueError):
+    """멱등성 키가 다른 프로젝트의 청구서에 이미 쓰임"""
+
 
 class InvoiceAggregationService:
     """작업 데이터를 집계하여 청구서를 생성하는 서비스"""
@@ -14,103 +24,70 @@ class InvoiceAggregationService:
         self.db = db
     
     def aggregate_work_costs(self, project_id: int, period_from: date, period_to: date) -> Dict:
-        """기간별 작업 비용 집계"""
-        
-        # 해당 기간의 작업 로그 조회
-        work_logs = self.db.query(WorkLog).filter(
-            WorkLog.project_id == project_id,
-            WorkLog.work_date >= period_from,
-            WorkLog.work_date <= period_to
-        ).all()
-        
-        work_log_ids = [log.work_id for log in work_logs]
-        
-        if not work_log_ids:
-            return self._empty_aggregation()
-        
-        # 작업 항목들 조회
-        work_items = self.db.query(WorkItem).filter(
-            WorkItem.work_id.in_(work_log_ids)
-        ).all()
-        
-        work_item_ids = [item.item_id for item in work_items]
-        
-        if not work_item_ids:
-            return self._empty_aggregation()
-        
-        # 비용 집계
-        labor_cost = self._aggregate_labor_costs(work_item_ids)
-        equipment_cost = self._aggregate_equipment_costs(work_item_ids)
-        material_cost = self._aggregate_material_costs(work_item_ids)
-        
+        """기간별 작업 비용 집계
+
+        비용 합계는 일자별 집계 테이블(daily_cost_rollups)에서,
+        작업일지/작업항목 건수는 별도의 카운트 쿼리로 가져온다.
+        """
+        work_logs_count, work_items_count = self._count_work_records(project_id, period_from, period_to)
+
+        if not work_items_count:
+            return self._empty_aggregation(work_logs_count)
+
+        totals = CostRollupService(self.db).summarize(project_id, period_from, period_to)
+
+        labor_cost = totals.get(CostCategory.LABOR, (Decimal('0'), 0))[0]
+        equipment_cost = totals.get(CostCategory.EQUIPMENT, (Decimal('0'), 0))[0]
+        material_cost = totals.get(CostCategory.MATERIAL, (Decimal('0'), 0))[0]
+
         total_supply = labor_cost + equipment_cost + material_cost
-        
+
         return {
             'labor_cost': labor_cost,
             'equipment_cost': equipment_cost,
             'material_cost': material_cost,
             'total_supply_amount': total_supply,
-            'work_items': work_items,
-            'work_logs': work_logs
+            'work_logs_count': work_logs_count,
+            'work_items_count': work_items_count
         }
-    
-    def _aggregate_labor_costs(self, work_item_ids: List[int]) -> Decimal:
-        """노무비 집계"""
-        labor_entries = self.db.query(LaborEntry).filter(
-            LaborEntry.item_id.in_(work_item_ids)
-        ).all()
-        
-        total = Decimal('0')
-        for entry in labor_entries:
-            # 총비용 = 인원 × 시간 × 단가
-            cost = Decimal(str(entry.persons)) * Decimal(str(entry.hours)) * Decimal(str(entry.unit_rate))
-            total += cost
-        
-        return total
-    
-    def _aggregate_equipment_costs(self, work_item_ids: List[int]) -> Decimal:
-        """장비비 집계"""
-        equipment_entries = self.db.query(EquipmentEntry).filter(
-            EquipmentEntry.item_id.in_(work_item_ids)
-        ).all()
-        
-        total = Decimal('0')
-        for entry in equipment_entries:
-            # 최소호출시간 적용
-            actual_hours = max(Decimal(str(entry.hours)), Decimal(str(entry.min_hours)))
-            
-            # 장비비 = (시간 × 시간단가) + 이동/설치비
-            cost = (actual_hours * Decimal(str(entry.hourly_rate))) + Decimal(str(entry.mobilization_fee))
-            total += cost
-        
-        return total
-    
-    def _aggregate_material_costs(self, work_item_ids: List[int]) -> Decimal:
-        """자재비 집계"""
-        material_entries = self.db.query(MaterialEntry).filter(
-            MaterialEntry.item_id.in_(work_item_ids)
-        ).all()
-        
-        total = Decimal('0')
-        for entry in material_entries:
-            # 자재비 = 수량 × 단가
-            cost = Decimal(str(entry.quantity)) * Decimal(str(entry.unit_price))
-            total += cost
-        
-        return total
+
+    def _count_work_records(self, project_id: int, period_from: date, period_to: date) -> Tuple[int, int]:
+        """기간 내 작업일지/작업항목 건수"""
+        row = self.db.query(
+            func.count(distinct(WorkLog.id)),
+            func.count(WorkItem.id)
+        ).select_from(WorkLog).outerjoin(
+            WorkItem, WorkItem.work_log_id == WorkLog.id
+        ).filter(
+            WorkLog.project_id == project_id,
+            WorkLog.work_date >= period_from,
+            WorkLog.work_date <= period_to
+        ).one()
+
+        return int(row[0] or 0), int(row[1] or 0)
     
     def create_invoice_from_aggregation(
         self, 
         project_id: int, 
         period_from: date, 
         period_to: date,
-        sequence: int = 1,
-        vat_rate: Decimal = Decimal('10.0')
+        sequence: Optional[int] = None,
+        vat_rate: Decimal = Decimal('10.0'),
+        idempotency_key: Optional[str] = None
     ) -> Invoice:
-        """집계 데이터로부터 청구서 생성"""
-        
-        # 프로젝트 정보 조회
-        project = self.db.query(Project).filter(Project.project_id == project_id).first()
+        """집계 데이터로부터 청구서 생성
+
+        청구서와 라인은 한 트랜잭션(1회 commit)으로 기록한다. sequence를 생략하면
+        프로젝트 행을 잠근 상태에서 다음 차수를 할당한다. idempotency_key가 주어지고
+        같은 키로 이미 생성된 청구서가 있으면 새로 만들지 않고 그 청구서를 반환한다.
+        """
+        if idempotency_key:
+            existing = self.find_by_idempotency_key(idempotency_key, project_id)
+            if existing is not None:
+                return existing
+
+        # 프로젝트 정보 조회 (차수 할당이 겹치지 않도록 행 잠금)
+        project = self.db.query(Project).filter(Project.id == project_id).with_for_update().first()
         if not project:
             raise ValueError("프로젝트를 찾을 수 없습니다")
         
@@ -120,11 +97,14 @@ class InvoiceAggregationService:
         supply_amount = aggregation['total_supply_amount']
         vat_amount = supply_amount * (vat_rate / Decimal('100'))
         total_amount = supply_amount + vat_amount
+
+        if sequence is None:
+            sequence = self._next_sequence(project_id)
         
         # 청구서 번호 생성
         invoice_number = self._generate_invoice_number(project_id, sequence)
         
-        # 청구서 생성
+        # 청구서 + 라인 생성 (flush 시 라인은 한 번의 다중 행 INSERT로 기록)
         invoice = Invoice(
             project_id=project_id,
             invoice_number=invoice_number,
@@ -135,61 +115,59 @@ class InvoiceAggregationService:
             vat_rate=vat_rate,
             supply_amount=supply_amount,
             vat_amount=vat_amount,
-            total_amount=total_amount
+            total_amount=total_amount,
+            idempotency_key=idempotency_key
         )
+        invoice.invoice_lines = self._build_invoice_lines(aggregation)
         
+        return self.save_invoice(invoice)
+
+    def save_invoice(self, invoice: Invoice) -> Invoice:
+        """청구서(라인 포함)를 한 번에 커밋
+
+        같은 idempotency_key로 동시에 들어온 요청이 먼저 커밋된 경우에는
+        롤백 후 먼저 생성된 청구서를 반환한다.
+        """
         self.db.add(invoice)
-        self.db.commit()
-        self.db.refresh(invoice)
-        
-        # 청구서 라인 생성
-        self._create_invoice_lines(invoice.invoice_id, aggregation)
-        
+        try:
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            if invoice.idempotency_key:
+                existing = self.find_by_idempotency_key(invoice.idempotency_key, invoice.project_id)
+                if existing is not None:
+                    return existing
+            raise DuplicateInvoiceNumberError(f"이미 존재하는 청구서 번호입니다: {invoice.invoice_number}")
         return invoice
+
+    def find_by_idempotency_key(self, idempotency_key: str, project_id: int) -> Optional[Invoice]:
+        """멱등성 키로 생성된 청구서 조회 (다른 프로젝트에서 쓰인 키면 IdempotencyKeyConflictError)"""
+        existing = self.db.query(Invoice).filter(Invoice.idempotency_key == idempotency_key).first()
+        if existing is not None and existing.project_id != project_id:
+            raise IdempotencyKeyConflictError("다른 프로젝트의 청구서에 사용된 멱등성 키입니다")
+        return existing
+
+    def _next_sequence(self, project_id: int) -> int:
+        """프로젝트의 다음 청구 차수"""
+        last_sequence = self.db.query(func.max(Invoice.sequence)).filter(
+            Invoice.project_id == project_id
+        ).scalar()
+        return (last_sequence or 0) + 1
     
-    def _create_invoice_lines(self, invoice_id: int, aggregation: Dict):
-        """청구서 라인 생성"""
-        line_number = 1
-        
-        # 노무비 라인
-        if aggregation['labor_cost'] > 0:
-            labor_line = InvoiceLine(
-                invoice_id=invoice_id,
-                line_number=line_number,
-                description="노무비",
-                supply_amount=aggregation['labor_cost'],
-                vat_amount=aggregation['labor_cost'] * Decimal('0.1'),
-                total_amount=aggregation['labor_cost'] * Decimal('1.1')
-            )
-            self.db.add(labor_line)
-            line_number += 1
-        
-        # 장비비 라인
-        if aggregation['equipment_cost'] > 0:
-            equipment_line = InvoiceLine(
-                invoice_id=invoice_id,
-                line_number=line_number,
-                description="장비비",
-                supply_amount=aggregation['equipment_cost'],
-                vat_amount=aggregation['equipment_cost'] * Decimal('0.1'),
-                total_amount=aggregation['equipment_cost'] * Decimal('1.1')
-            )
-            self.db.add(equipment_line)
-            line_number += 1
-        
-        # 자재비 라인
-        if aggregation['material_cost'] > 0:
-            material_line = InvoiceLine(
-                invoice_id=invoice_id,
-                line_number=line_number,
-                description="자재비",
-                supply_amount=aggregation['material_cost'],
-                vat_amount=aggregation['material_cost'] * Decimal('0.1'),
-                total_amount=aggregation['material_cost'] * Decimal('1.1')
-            )
-            self.db.add(material_line)
-        
-        self.db.commit()
+    def _build_invoice_lines(self, aggregation: Dict) -> List[InvoiceLine]:
+        """비용구분별 청구서 라인 (금액이 있는 항목만)"""
+        lines = []
+        for description, key in (("노무비", 'labor_cost'), ("장비비", 'equipment_cost'), ("자재비", 'material_cost')):
+            cost = aggregation[key]
+            if cost > 0:
+                lines.append(InvoiceLine(
+                    line_number=len(lines) + 1,
+                    description=description,
+                    supply_amount=cost,
+                    vat_amount=cost * Decimal('0.1'),
+                    total_amount=cost * Decimal('1.1')
+                ))
+        return lines
     
     def _generate_invoice_number(self, project_id: int, sequence: int) -> str:
         """청구서 번호 생성"""
@@ -197,13 +175,13 @@ class InvoiceAggregationService:
         month = datetime.now().month
         return f"INV-{year}-{project_id:03d}-{sequence:02d}"
     
-    def _empty_aggregation(self) -> Dict:
+    def _empty_aggregation(self, work_logs_count: int = 0) -> Dict:
         """빈 집계 결과"""
         return {
             'labor_cost': Decimal('0'),
             'equipment_cost': Decimal('0'),
             'material_cost': Decimal('0'),
             'total_supply_amount': Decimal('0'),
-            'work_items': [],
-            'work_logs': []
-        }
\ No newline at end of file
+            'work_logs_count': work_logs_count,
+            'work_items_count': 0
+        }
@@ -0,0 +1,203 @@
+"""
+직종별 단가 분포 집계(labor_rate_stats) 유지/조회
+
+단가 추천이 요청마다 기간 내 노무 투입 전체를 읽어 정렬하지 않도록 (직종, 단가유형, 월,
+프로젝트/작업코드)별 단가 값별 건수를 쓰기 경로에서 같은 트랜잭션으로 더해 둔다.
+조회는 기간에 완전히 들어가는 월은 집계 행을, 시작일이 걸친 첫 달만 원천 테이블을 읽어
+단가 값별 건수로 합친다. 값별 건수이므로 분위수는 원천 데이터로 계산한 것과 같다
+(분위수 계산은 RecommendationService가 이 분포 위에서 DB 쿼리로 한다).
+갱신한 (직종, 프로젝트)는 커밋 때 추천 결과 캐시를 무효화하도록 세션에 기록한다.
+"""
+from collections import Counter
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import Date, cast, delete, func, literal, literal_column, select, true, union_all
+from sqlalchemy.orm import Session
+from ..models import LaborEntry, WorkItem, WorkLog
+from ..models.labor_entries import RateType
+from ..models.labor_rate_stats import ALL_PROJECTS, ALL_TASK_CODES, LaborRateStat
+from . import money
+from .recommendation_cache import note_all_changed, note_labor_changes
+
+_COLUMNS = ["trade", "rate_type", "month", "project_id", "task_code", "unit_rate", "entry_count"]
+
+
+def next_month(day: date) -> date:
+    return date(day.year + day.month // 12, day.month % 12 + 1, 1)
+
+
+class LaborRateStatsService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    # ---- 증분 갱신 (commit은 호출자가 수행) ----
+
+    def add_entries(self, project_id: int, work_date: date, task_code: Optional[str], entries: Iterable, sign: int = 1) -> None:
+        """메모리에 있는 투입 내역 중 노무 투입을 집계에 더한다 (sign=-1이면 뺀다)"""
+        counts: Counter = Counter()
+        month = work_date.replace(day=1)
+        for entry in entries:
+            if not isinstance(entry, LaborEntry):
+                continue
+            for grain_project, grain_task in self._grains(project_id, task_code):
+                key = (entry.trade, RateType(entry.rate_type), month, grain_project, grain_task,
+                       money.quantize(money.as_decimal(entry.unit_rate)))
+                counts[key] += sign
+        if counts:
+            self._upsert([dict(zip(_COLUMNS, (*key, count))) for key, count in counts.items()])
+            if sign < 0:
+                self._drop_empty()
+            note_labor_changes(self.db, {(key[0], project_id) for key in counts})
+
+    def add_work_logs(self, work_log_ids: Iterable[int], sign: int = 1) -> None:
+        """Core로 쓴(또는 지울) 작업일지들의 노무 투입을 DB에서 바로 집계에 더한다 (INSERT ... SELECT 1회)"""
+        ids = list(work_log_ids)
+        if not ids:
+            return
+        touched = self._upsert_select(self._source(WorkLog.id.in_(ids), sign), returning=True)
+        if sign < 0:
+            self._drop_empty()
+        # 모든 투입이 프로젝트별 행에도 더해지므로 그 행들로 바뀐 (직종, 프로젝트)를 안다
+        note_labor_changes(self.db, {
+            (trade, project_id) for trade, project_id in touched if project_id != ALL_PROJECTS
+        })
+
+    def rebuild(self) -> int:
+        """집계 테이블을 노무 투입 전체로부터 다시 계산"""
+        self.db.execute(delete(LaborRateStat))
+        result = self._upsert_select(self._source(true(), 1))
+        note_all_changed(self.db)
+        self.db.commit()
+        return result.rowcount
+
+    @staticmethod
+    def _grains(project_id: int, task_code: Optional[str]) -> List[Tuple[int, str]]:
+        grains = [(ALL_PROJECTS, ALL_TASK_CODES), (project_id, ALL_TASK_CODES)]
+        if task_code:
+            grains.append((ALL_PROJECTS, task_code))
+        return grains
+
+    def _month(self, column):
+        if self.db.get_bind().dialect.name == "sqlite":
+            return func.date(column, 'start of month')
+        return cast(func.date_trunc(literal_column("'month'"), column), Date)
+
+    def _source(self, where, sign: int):
+        """세 집계 단위별 (직종, 단가유형, 월, 프로젝트, 작업코드, 단가, 건수) SELECT"""
+        month = self._month(WorkLog.work_date)
+        grains = (
+            (literal(ALL_PROJECTS), literal(ALL_TASK_CODES), true()),
+            (WorkLog.project_id, literal(ALL_TASK_CODES), true()),
+            (literal(ALL_PROJECTS), WorkItem.task_code, WorkItem.task_code.isnot(None) & (WorkItem.task_code != "")),
+        )
+        selects = []
+        for project_col, task_col, grain_where in grains:
+            selects.append(
+                select(
+                    LaborEntry.trade, LaborEntry.rate_type, month.label("month"), project_col.label("project_id"),
+                    task_col.label("task_code"), LaborEntry.unit_rate, (func.count() * sign).label("entry_count")
+                ).select_from(LaborEntry).join(
+                    WorkItem, LaborEntry.work_item_id == WorkItem.id
+                ).join(
+                    WorkLog, WorkItem.work_log_id == WorkLog.id
+                ).where(where, grain_where).group_by(
+                    LaborEntry.trade, LaborEntry.rate_type, month, project_col, task_col, LaborEntry.unit_rate
+                )
+            )
+        return union_all(*selects).subquery()
+
+    def _insert(self):
+        if self.db.get_bind().dialect.name == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        return dialect_insert(LaborRateStat)
+
+    def _on_conflict(self, stmt):
+        """같은 (직종, 단가유형, 월, 프로젝트, 작업코드, 단가) 행이 있으면 건수만 원자적으로 가산"""
+        return stmt.on_conflict_do_update(
+            index_elements=[LaborRateStat.trade, LaborRateStat.rate_type, LaborRateStat.month,
+                            LaborRateStat.project_id, LaborRateStat.task_code, LaborRateStat.unit_rate],
+            set_={"entry_count": LaborRateStat.entry_count + stmt.excluded.entry_count}
+        )
+
+    def _upsert(self, rows: List[Dict]) -> None:
+        self.db.execute(self._on_conflict(self._insert()), rows)
+
+    def _upsert_select(self, source, returning: bool = False):
+        # SQLite는 INSERT ... SELECT 뒤 ON CONFLICT를 구분하려면 SELECT에 WHERE가 있어야 한다
+        stmt = self._on_conflict(self._insert().from_select(_COLUMNS, select(*source.c).where(true())))
+        if returning:
+            return self.db.execute(stmt.returning(LaborRateStat.trade, LaborRateStat.project_id)).all()
+        return self.db.execute(stmt)
+
+    def _drop_empty(self) -> None:
+        self.db.execute(delete(LaborRateStat).where(LaborRateStat.entry_count <= 0))
+
+    # ---- 조회 ----
+
+    def distribution(
+        self,
+        trade: str,
+        since: date,
+        project_id: Optional[int] = None,
+        task_code_prefix: Optional[str] = None
+    ):
+        """since 이후 작업일의 (원천 단가유형, 단가, 건수) 서브쿼리 (같은 단가가 여러 행일 수 있다)
+
+        실행하지 않고 SELECT만 만들어 돌려주므로 분위수 계산까지 한 쿼리로 DB에서 끝낼 수 있다.
+        프로젝트와 작업코드 접두를 함께 거르는 조합은 집계 단위가 없어 원천 테이블을 그룹 조회한다.
+        """
+        if project_id is not None and task_code_prefix:
+            return self._raw_distribution(trade, since, None, project_id, task_code_prefix).subquery()
+
+        first_month = since if since.day == 1 else next_month(since)
+        stats = select(
+            LaborRateStat.rate_type, LaborRateStat.unit_rate, LaborRateStat.entry_count
+        ).where(
+            LaborRateStat.trade == trade,
+            LaborRateStat.month >= first_month
+        )
+        if task_code_prefix:
+            stats = stats.where(
+                LaborRateStat.project_id == ALL_PROJECTS,
+                LaborRateStat.task_code != ALL_TASK_CODES,
+                LaborRateStat.task_code.like(f"{task_code_prefix}%")
+            )
+        else:
+            stats = stats.where(
+                LaborRateStat.project_id == (project_id if project_id is not None else ALL_PROJECTS),
+                LaborRateStat.task_code == ALL_TASK_CODES
+            )
+        if since < first_month:
+            return union_all(
+                self._raw_distribution(trade, since, first_month, project_id, task_code_prefix), stats
+            ).subquery()
+        return stats.subquery()
+
+    @staticmethod
+    def _raw_distribution(
+        trade: str,
+        since: date,
+        until: Optional[date],
+        project_id: Optional[int],
+        task_code_prefix: Optional[str]
+    ):
+        """원천 노무 투입에서 [since, until) 작업일의 (단가유형, 단가)별 건수 SELECT"""
+        query = select(
+            LaborEntry.rate_type, LaborEntry.unit_rate, func.count().label("entry_count")
+        ).join(
+            WorkItem, LaborEntry.work_item_id == WorkItem.id
+        ).join(
+            WorkLog, WorkItem.work_log_id == WorkLog.id
+        ).where(
+            LaborEntry.trade == trade,
+            WorkLog.work_date >= since
+        )
+        if until is not None:
+            query = query.where(WorkLog.work_date < until)
+        if project_id is not None:
+            query = query.where(WorkLog.project_id == project_id)
+        if task_code_prefix:
+            query = query.where(WorkItem.task_code.like(f"{task_code_prefix}%"))
+        return query.group_by(LaborEntry.rate_type, LaborEntry.unit_rate)
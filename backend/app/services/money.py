@@ -0,0 +1,42 @@
+"""
+금액 계산 규칙
+
+- 금액은 0.01원 단위로 ROUND_HALF_EVEN 반올림한다 (Decimal.quantize 기본 규칙과 동일).
+- 계산 중간값은 반올림하지 않고, 결과를 반환할 때 한 번만 반올림한다.
+
+상수 Decimal은 모듈에서 한 번만 만들고, 입력값은 이미 Decimal이면 그대로 쓰며
+int는 문자열을 거치지 않고 변환한다.
+"""
+from decimal import Decimal, ROUND_HALF_EVEN
+from typing import Union
+
+Number = Union[int, float, str, Decimal]
+
+ZERO = Decimal('0')
+CENT = Decimal('0.01')   # 0.01원
+
+
+def as_decimal(value: Number) -> Decimal:
+    """입력값을 Decimal로 변환 (float는 Decimal(str(x))와 같은 값으로 해석)"""
+    kind = type(value)
+    if kind is Decimal:
+        return value
+    if kind is int:
+        return Decimal(value)
+    if kind is float:
+        return Decimal(repr(value))
+    if isinstance(value, bool):
+        raise TypeError("bool은 금액으로 사용할 수 없습니다")
+    if isinstance(value, (int, Decimal)):
+        return Decimal(value)
+    return Decimal(str(value))
+
+
+def quantize(value: Decimal, quantum: Decimal = CENT) -> Decimal:
+    """0.01원 단위 반올림 (ROUND_HALF_EVEN)"""
+    return value.quantize(quantum, rounding=ROUND_HALF_EVEN)
+
+
+def percent_of(value: Decimal, rate_percent: Decimal) -> Decimal:
+    """value × rate% (100으로 나누기는 지수 이동이라 정확하다)"""
+    return (value * rate_percent).scaleb(-2)
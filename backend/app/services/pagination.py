@@ -0,0 +1,25 @@
+"""
+키셋 페이지네이션 커서
+
+커서는 페이지 마지막 행의 정렬 키 값 목록을 JSON → base64url로 감싼 불투명 문자열이다.
+"""
+from typing import List
+import base64
+import binascii
+import json
+
+
+def encode_cursor(values: List) -> str:
+    """정렬 키 값 목록을 커서 문자열로 변환 (값은 JSON 직렬화 가능해야 한다)"""
+    return base64.urlsafe_b64encode(json.dumps(values, ensure_ascii=False).encode()).decode()
+
+
+def decode_cursor(cursor: str, size: int) -> List:
+    """커서 문자열을 정렬 키 값 목록으로 해석 (형식이나 개수가 맞지 않으면 ValueError)"""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("잘못된 커서입니다")
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("잘못된 커서입니다")
+    return values
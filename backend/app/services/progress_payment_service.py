@@ -0,0 +1,94 @@
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional
+from decimal import Decimal
+from ..models import Project
+from ..models.progress_payments import ProgressPaymentLedger
+from .calculation_service import CostCalculationService
+
+# 행 잠금이 없는 DB(SQLite)에서 같은 차수를 동시에 기록해 유니크 인덱스에 걸렸을 때 다시 계산하는 횟수
+RECORD_ATTEMPTS = 3
+
+class ProgressPaymentService:
+    """기성 원장 서비스
+
+    차수마다 누적 기성액/선급금 공제/하자보수비 유보/기지급 누계를 원장에 남겨,
+    N차 기성 계산 시 이전 청구서를 다시 합산하지 않고 직전 차수 1행만 읽는다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _get_project(self, project_id: int, for_update: bool = False) -> Project:
+        query = self.db.query(Project).filter(Project.id == project_id)
+        if for_update:
+            # 원장 행이 아직 없는 첫 차수도 직렬화되도록 프로젝트 행을 잠근다
+            query = query.with_for_update()
+        project = query.first()
+        if not project:
+            raise ValueError("프로젝트를 찾을 수 없습니다")
+        if project.contract_amount is None:
+            raise ValueError("계약금액이 등록되지 않은 프로젝트입니다")
+        return project
+
+    def _last_entry(self, project_id: int) -> Optional[ProgressPaymentLedger]:
+        """직전 차수 원장 (project_id, sequence 유니크 인덱스로 1행 조회)"""
+        return self.db.query(ProgressPaymentLedger).filter(
+            ProgressPaymentLedger.project_id == project_id
+        ).order_by(ProgressPaymentLedger.sequence.desc()).first()
+
+    def calculate_next(self, project_id: int, progress_rate: Decimal, for_update: bool = False) -> Dict:
+        """다음 차수 기성 계산 (저장하지 않음, for_update면 프로젝트 행을 잠가 차수 할당을 직렬화)"""
+        project = self._get_project(project_id, for_update=for_update)
+        last = self._last_entry(project_id)
+
+        if last is not None and progress_rate < Decimal(str(last.progress_rate)):
+            raise ValueError(f"누적 기성율은 직전 차수({last.progress_rate}%)보다 작을 수 없습니다")
+
+        # 프로젝트의 선급율/하자율은 비율(0.10)로 저장되어 있으므로 %로 변환
+        result = CostCalculationService.calculate_progress_payment(
+            contract_amount=Decimal(str(project.contract_amount)),
+            progress_rate=progress_rate,
+            advance_rate=Decimal(str(project.advance_rate or 0)) * Decimal('100'),
+            defect_rate=Decimal(str(project.defect_rate or 0)) * Decimal('100'),
+            previous_payments=Decimal(str(last.cumulative_paid)) if last is not None else Decimal('0')
+        )
+        result['sequence'] = (last.sequence if last is not None else 0) + 1
+        result['cumulative_paid'] = result['previous_payments'] + result['current_payment']
+        return result
+
+    def record_next(self, project_id: int, progress_rate: Decimal, invoice_id: Optional[int] = None) -> ProgressPaymentLedger:
+        """다음 차수 기성을 계산하여 원장에 기록
+
+        동시에 기록된 요청과 차수가 겹치면(유니크 인덱스 위반) 롤백 후 직전 차수를 다시 읽어 재계산한다.
+        """
+        for attempt in range(RECORD_ATTEMPTS):
+            result = self.calculate_next(project_id, progress_rate, for_update=True)
+
+            entry = ProgressPaymentLedger(
+                project_id=project_id,
+                sequence=result['sequence'],
+                invoice_id=invoice_id,
+                progress_rate=progress_rate,
+                contract_amount=result['contract_amount'],
+                cumulative_amount=result['cumulative_amount'],
+                advance_deduction=result['advance_amount'],
+                defect_retention=result['defect_amount'],
+                current_payment=result['current_payment'],
+                cumulative_paid=result['cumulative_paid']
+            )
+            self.db.add(entry)
+            try:
+                self.db.commit()
+            except IntegrityError:
+                self.db.rollback()
+                continue
+            self.db.refresh(entry)
+            return entry
+        raise ValueError("동시에 기록된 기성과 차수가 겹쳤습니다. 잠시 후 다시 시도해 주세요")
+
+    def get_schedule(self, project_id: int) -> List[ProgressPaymentLedger]:
+        """프로젝트의 전체 기성 내역 (차수순)"""
+        return self.db.query(ProgressPaymentLedger).filter(
+            ProgressPaymentLedger.project_id == project_id
+        ).order_by(ProgressPaymentLedger.sequence).all()
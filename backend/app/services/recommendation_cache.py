@@ -0,0 +1,274 @@
+"""
+노무 단가 추천 결과 캐시 (LRU + TTL, 쓰기 기반 무효화)
+
+작업일지 입력 화면은 같은 직종/조회기간 조합을 계속 요청하므로 RecommendationService
+결과를 모든 인자(+오늘 날짜, 조회 시작일이 바뀌므로)로 캐시한다.
+
+무효화는 세대(generation) 번호로 한다. 캐시 키에 직종 세대(프로젝트 필터가 있으면
+직종+프로젝트 세대)를 넣어 두고, 노무 투입이 바뀐 트랜잭션이 커밋되면 해당 세대를
+올린다. 옛 세대 키는 다시 조회되지 않고 LRU/TTL로 밀려난다. 계산 중에 쓰기가 커밋돼도
+계산 전에 읽은 세대로 저장되므로 오래된 결과가 새 세대로 보이는 일은 없다.
+변경된 (직종, 프로젝트)는 LaborRateStatsService가 단가 분포를 갱신하면서 기록한다.
+
+RECOMMENDATION_CACHE_URL(redis://...)을 주면 워커끼리 Redis로 캐시와 세대를 공유한다
+(항목 수 상한은 Redis maxmemory 정책으로, 적중/미적중 카운터는 워커별).
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+try:
+    import redis
+except ImportError:  # 선택 의존성
+    redis = None
+
+RECOMMENDATION_CACHE_SIZE = int(os.getenv("RECOMMENDATION_CACHE_SIZE", "1024"))
+RECOMMENDATION_CACHE_TTL = float(os.getenv("RECOMMENDATION_CACHE_TTL", "300"))
+RECOMMENDATION_CACHE_URL = os.getenv("RECOMMENDATION_CACHE_URL")
+
+# 전체 무효화용 세대 (모든 키에 들어간다)
+_ALL = "*"
+
+# 커밋 때 세대를 올릴 (직종, 프로젝트) 목록 (session.info 키)
+_CHANGES = "labor_rate_changes"
+
+
+def generation_names(trade: str, project_id: Optional[int]) -> List[str]:
+    """캐시 항목이 의존하는 세대 이름 (프로젝트 필터가 있으면 그 프로젝트의 해당 직종만)"""
+    scope = trade if project_id is None else f"{trade}\x1f{project_id}"
+    return [_ALL, scope]
+
+
+def changed_generation_names(changes: Iterable[Tuple[str, Optional[int]]]) -> Set[str]:
+    """(직종, 프로젝트) 변경으로 올려야 할 세대 이름 (프로젝트가 None이면 직종 전체)"""
+    names = set()
+    for trade, project_id in changes:
+        if trade == _ALL:
+            names.add(_ALL)
+            continue
+        names.add(trade)
+        if project_id is not None:
+            names.add(f"{trade}\x1f{project_id}")
+    return names
+
+
+class _Counters:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.values = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "invalidations": 0}
+
+    def add(self, name: str, count: int = 1) -> None:
+        with self._lock:
+            self.values[name] += count
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.values)
+
+
+class RecommendationCache(ABC):
+    """세대 기반 무효화 공통 로직 (저장소는 하위 클래스)"""
+
+    backend = ""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.counters = _Counters()
+
+    def get_or_compute(self, params: Tuple, trade: str, project_id: Optional[int], compute: Callable):
+        key = (params, self.generations(generation_names(trade, project_id)))
+        value = self.get(key)
+        if value is not None:
+            self.counters.add("hits")
+            return value
+        self.counters.add("misses")
+        value = compute()
+        self.set(key, value)
+        return value
+
+    def invalidate(self, changes: Iterable[Tuple[str, Optional[int]]]) -> None:
+        names = changed_generation_names(changes)
+        if names:
+            self.bump(names)
+            self.counters.add("invalidations")
+
+    def clear(self) -> None:
+        self.bump({_ALL})
+        self.counters.add("invalidations")
+
+    def stats(self) -> Dict:
+        stats = self.counters.snapshot()
+        lookups = stats["hits"] + stats["misses"]
+        stats.update(backend=self.backend, ttl_seconds=self.ttl,
+                     hit_ratio=round(stats["hits"] / lookups, 4) if lookups else 0.0)
+        return stats
+
+    # ---- 저장소 ----
+
+    @abstractmethod
+    def generations(self, names: Sequence[str]) -> Tuple[int, ...]:
+        ...
+
+    @abstractmethod
+    def bump(self, names: Iterable[str]) -> None:
+        ...
+
+    @abstractmethod
+    def get(self, key: Hashable):
+        ...
+
+    @abstractmethod
+    def set(self, key: Hashable, value) -> None:
+        ...
+
+
+class LocalRecommendationCache(RecommendationCache):
+    """프로세스 내 LRU + TTL 캐시"""
+
+    backend = "local"
+
+    def __init__(self, max_entries: int = RECOMMENDATION_CACHE_SIZE, ttl: float = RECOMMENDATION_CACHE_TTL,
+                 clock: Callable[[], float] = time.monotonic):
+        super().__init__(ttl)
+        self.max_entries = max_entries
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, object]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+
+    def generations(self, names: Sequence[str]) -> Tuple[int, ...]:
+        with self._lock:
+            return tuple(self._generations.get(name, 0) for name in names)
+
+    def bump(self, names: Iterable[str]) -> None:
+        with self._lock:
+            for name in names:
+                self._generations[name] = self._generations.get(name, 0) + 1
+
+    def get(self, key: Hashable):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self.clock():
+                del self._entries[key]
+                self.counters.add("expirations")
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value) -> None:
+        with self._lock:
+            self._entries[key] = (self.clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.counters.add("evictions")
+
+    def stats(self) -> Dict:
+        stats = super().stats()
+        with self._lock:
+            stats.update(size=len(self._entries), max_entries=self.max_entries)
+        return stats
+
+
+class RedisRecommendationCache(RecommendationCache):
+    """워커 간 공유 캐시 (값은 JSON, 만료는 Redis TTL, 세대는 INCR)"""
+
+    backend = "redis"
+
+    def __init__(self, url: str, ttl: float = RECOMMENDATION_CACHE_TTL, prefix: str = "cms:labor-rate:"):
+        if redis is None:
+            raise RuntimeError("RECOMMENDATION_CACHE_URL을 쓰려면 redis 패키지가 필요합니다")
+        super().__init__(ttl)
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+
+    def generations(self, names: Sequence[str]) -> Tuple[int, ...]:
+        values = self.client.mget([f"{self.prefix}gen:{name}" for name in names])
+        return tuple(int(value) if value is not None else 0 for value in values)
+
+    def bump(self, names: Iterable[str]) -> None:
+        pipeline = self.client.pipeline(transaction=False)
+        for name in names:
+            pipeline.incr(f"{self.prefix}gen:{name}")
+        pipeline.execute()
+
+    def _value_key(self, key: Hashable) -> str:
+        digest = hashlib.sha1(json.dumps(key, default=str, ensure_ascii=False).encode()).hexdigest()
+        return f"{self.prefix}val:{digest}"
+
+    def get(self, key: Hashable):
+        data = self.client.get(self._value_key(key))
+        return _loads(data) if data is not None else None
+
+    def set(self, key: Hashable, value) -> None:
+        self.client.set(self._value_key(key), _dumps(value), ex=max(int(self.ttl), 1))
+
+
+def _dumps(result) -> bytes:
+    return json.dumps({
+        name: str(value) if isinstance(value, Decimal) else getattr(value, "value", value)
+        for name, value in vars(result).items()
+    }, ensure_ascii=False).encode()
+
+
+def _loads(data: bytes):
+    from ..models.labor_entries import RateType
+    from .recommendation_service import LaborRateRecommendation
+
+    fields = json.loads(data)
+    for name in ("recommended_rate", "historical_median", "p25", "p75", "standard_reference"):
+        if fields[name] is not None:
+            fields[name] = Decimal(fields[name])
+    fields["rate_type"] = RateType(fields["rate_type"])
+    return LaborRateRecommendation(**fields)
+
+
+_cache: Optional[RecommendationCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_recommendation_cache() -> RecommendationCache:
+    """설정에 맞는 캐시 (RECOMMENDATION_CACHE_URL이 있으면 Redis, 없으면 프로세스 내)"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            if RECOMMENDATION_CACHE_URL:
+                _cache = RedisRecommendationCache(RECOMMENDATION_CACHE_URL)
+            else:
+                _cache = LocalRecommendationCache()
+        return _cache
+
+
+def note_labor_changes(session: Session, changes: Iterable[Tuple[str, Optional[int]]]) -> None:
+    """노무 투입이 바뀐 (직종, 프로젝트) 기록 (커밋되면 캐시 무효화, 프로젝트 None은 직종 전체)"""
+    session.info.setdefault(_CHANGES, set()).update(changes)
+
+
+def note_all_changed(session: Session) -> None:
+    note_labor_changes(session, [(_ALL, None)])
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session):
+    changes = session.info.pop(_CHANGES, None)
+    if changes:
+        get_recommendation_cache().invalidate(changes)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_changes(session, transaction):
+    """롤백으로 끝난 트랜잭션의 변경 기록은 버린다"""
+    if transaction.parent is None:
+        session.info.pop(_CHANGES, None)
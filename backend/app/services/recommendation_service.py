@@ -2,16 +2,15 @@ from __future__ import annotations
 
 from datetime import date, timedelta
 from decimal import Decimal
-from statistics import median
 from typing import Dict, List, Optional, Tuple
 
+from sqlalchemy import BigInteger, case, cast, func, select, type_coerce
 from sqlalchemy.orm import Session
-from sqlalchemy import select
 
-from ..models.labor_entries import LaborEntry, RateType
-from ..models.work_items import WorkItem
-from ..models.work_logs import WorkLog
+from ..models.labor_entries import RateType
 from ..data.reference_data import STANDARD_TRADES
+from .labor_stats_service import LaborRateStatsService
+from .recommendation_cache import RecommendationCache, get_recommendation_cache
 
 
 def _find_trade_standard(trade_name: str) -> Optional[dict]:
@@ -37,6 +36,91 @@ def _convert_rate_to(
     return unit_rate
 
 
+# (numerator, denominator) of the quantiles computed in SQL: median, p25, p75
+_QUANTILES = ((1, 2), (1, 4), (3, 4))
+
+
+def _div_half_even(numerator, denominator: int):
+    """Integer SQL division rounded half-to-even, the rounding Decimal.quantize uses by default."""
+    if denominator == 1:
+        return numerator
+    quotient = numerator // denominator
+    remainder = numerator - quotient * denominator
+    round_up = (remainder * 2 > denominator) | ((remainder * 2 == denominator) & (quotient % 2 == 1))
+    return quotient + case((round_up, 1), else_=0)
+
+
+def _converted_cents(source, to_type: RateType, assumed_hours_per_day: Decimal):
+    """SQL expression for source.unit_rate converted to to_type, in integer cents.
+
+    Same values as _convert_rate_to: rates have two decimals, so working in cents keeps
+    every step exact on both PostgreSQL numerics and SQLite reals.
+    """
+    cents = cast(func.round(source.c.unit_rate * 100), BigInteger)
+    hours, hours_scale = assumed_hours_per_day.as_integer_ratio()
+    from_type = RateType.HOURLY if to_type == RateType.DAILY else RateType.DAILY
+    if to_type == RateType.HOURLY:
+        converted = _div_half_even(cents * hours_scale, hours)
+    else:
+        converted = _div_half_even(cents * hours, hours_scale)
+    return type_coerce(case((source.c.rate_type == from_type, converted), else_=cents), BigInteger)
+
+
+def _rate_quantiles(
+    db: Session,
+    source,
+    to_type: RateType,
+    assumed_hours_per_day: Decimal,
+) -> Tuple[int, Optional[Decimal], Optional[Decimal], Optional[Decimal]]:
+    """(sample size, median, p25, p75) of a (rate_type, unit_rate, entry_count) distribution, in one query.
+
+    Works on per-value counts instead of one row per entry, so percentile_cont does not apply;
+    running totals over the sorted values locate the ranks it would interpolate between
+    (k = (n - 1) * p), on PostgreSQL and SQLite alike. Results match statistics.median and the
+    linear-interpolation percentile quantized to 0.01.
+    """
+    converted = select(
+        _converted_cents(source, to_type, assumed_hours_per_day).label("value"), source.c.entry_count
+    ).subquery()
+    entries = func.sum(converted.c.entry_count)
+    histogram = (
+        select(converted.c.value, cast(entries, BigInteger).label("entries"))
+        .group_by(converted.c.value)
+        .having(entries > 0)
+        .subquery()
+    )
+    ranked = select(
+        histogram.c.value,
+        cast(func.sum(histogram.c.entries).over(order_by=histogram.c.value, rows=(None, 0)), BigInteger).label("rank_end"),
+        cast(func.sum(histogram.c.entries).over(), BigInteger).label("total"),
+    ).subquery()
+
+    def value_at(rank):
+        # value of the 0-based rank-th entry in sorted order
+        return type_coerce(func.min(case((ranked.c.rank_end > rank, ranked.c.value))), BigInteger)
+
+    bounds = [func.max(ranked.c.total).label("total")]
+    for index, (numerator, denominator) in enumerate(_QUANTILES):
+        position = (ranked.c.total - 1) * numerator
+        lower = position // denominator
+        upper = case((lower + 1 < ranked.c.total, lower + 1), else_=lower)
+        bounds += [
+            value_at(lower).label(f"lower_{index}"),
+            value_at(upper).label(f"upper_{index}"),
+            type_coerce(func.max(position % denominator), BigInteger).label(f"fraction_{index}"),
+        ]
+    picks = select(*bounds).subquery()
+
+    quantiles = []
+    for index, (_, denominator) in enumerate(_QUANTILES):
+        lower, upper, fraction = (picks.c[f"{name}_{index}"] for name in ("lower", "upper", "fraction"))
+        quantiles.append(_div_half_even(lower * (denominator - fraction) + upper * fraction, denominator))
+    total, *cents = db.execute(select(picks.c.total, *quantiles)).one()
+    if not total:
+        return 0, None, None, None
+    return int(total), *(Decimal(int(c)).scaleb(-2) for c in cents)
+
+
 class LaborRateRecommendation:
     def __init__(
         self,
@@ -78,8 +162,10 @@ class RecommendationService:
     """Labor cost recommendation using recent history + standards.
 
     Strategy:
-    - Use last N days of LaborEntry for the given trade (and optional task_code filter).
-    - Convert rates to requested rate_type with an assumed hours-per-day.
+    - Use last N days of LaborEntry for the given trade (and optional task_code filter),
+      read as per-rate entry counts from labor_rate_stats instead of loading every row.
+    - Convert rates to requested rate_type with an assumed hours-per-day and take
+      median/p25/p75 in the same SQL query.
     - Recommend median of history; fall back to standard reference when sparse.
     - Provide IQR (p25/p75) band and confidence score based on sample size.
     """
@@ -87,6 +173,35 @@ class RecommendationService:
     DEFAULT_LOOKBACK_DAYS = 180
     ASSUMED_HOURS_PER_DAY = Decimal("8.0")
 
+    @classmethod
+    def cached_labor_rate(
+        cls,
+        db: Session,
+        *,
+        trade: str,
+        rate_type: RateType,
+        task_code_prefix: Optional[str] = None,
+        project_id: Optional[int] = None,
+        lookback_days: int = DEFAULT_LOOKBACK_DAYS,
+        cache: Optional[RecommendationCache] = None,
+    ) -> LaborRateRecommendation:
+        """recommend_labor_rate behind the LRU+TTL result cache.
+
+        The key holds every argument plus today's date (the lookback window moves daily);
+        entries are invalidated when labor entries of the trade (or the filtered project) change.
+        """
+        cache = cache if cache is not None else get_recommendation_cache()
+        task_code_prefix = task_code_prefix or None
+        params = (trade, rate_type.value, task_code_prefix, project_id, lookback_days, date.today().isoformat())
+        return cache.get_or_compute(params, trade, project_id, lambda: cls.recommend_labor_rate(
+            db,
+            trade=trade,
+            rate_type=rate_type,
+            task_code_prefix=task_code_prefix,
+            project_id=project_id,
+            lookback_days=lookback_days,
+        ))
+
     @classmethod
     def recommend_labor_rate(
         cls,
@@ -100,63 +215,14 @@ class RecommendationService:
     ) -> LaborRateRecommendation:
         notes: List[str] = []
 
-        # Pull historical records
+        # Median/IQR of the historical rate distribution, converted to the requested rate type in the query
         since = date.today() - timedelta(days=lookback_days)
-
-        stmt = (
-            select(LaborEntry)
-            .join(WorkItem, LaborEntry.work_item_id == WorkItem.id)
-            .join(WorkLog, WorkItem.work_log_id == WorkLog.id)
-            .where(LaborEntry.trade == trade)
-            .where(WorkLog.work_date >= since)
+        distribution = LaborRateStatsService(db).distribution(
+            trade, since, project_id=project_id, task_code_prefix=task_code_prefix
+        )
+        sample_size, historical_median, p25, p75 = _rate_quantiles(
+            db, distribution, rate_type, cls.ASSUMED_HOURS_PER_DAY
         )
-
-        if project_id is not None:
-            stmt = stmt.where(WorkLog.project_id == project_id)
-
-        if task_code_prefix:
-            # simple prefix match
-            stmt = stmt.where(WorkItem.task_code.like(f"{task_code_prefix}%"))
-
-        rows: List[LaborEntry] = list(db.execute(stmt).scalars())
-
-        # Convert to requested rate type values
-        values: List[Decimal] = []
-        for r in rows:
-            try:
-                val = _convert_rate_to(
-                    Decimal(str(r.unit_rate)),
-                    r.rate_type,
-                    rate_type,
-                    cls.ASSUMED_HOURS_PER_DAY,
-                )
-                values.append(val)
-            except Exception:
-                continue
-
-        sample_size = len(values)
-        historical_median: Optional[Decimal] = None
-        p25: Optional[Decimal] = None
-        p75: Optional[Decimal] = None
-
-        if sample_size > 0:
-            values_sorted = sorted(values)
-            historical_median = Decimal(str(median(values_sorted))).quantize(Decimal("0.01"))
-
-            def percentile(sorted_vals: List[Decimal], p: float) -> Decimal:
-                if not sorted_vals:
-                    return Decimal("0")
-                k = (len(sorted_vals) - 1) * p
-                f = int(k)
-                c = min(f + 1, len(sorted_vals) - 1)
-                if f == c:
-                    return sorted_vals[int(k)]
-                d0 = sorted_vals[f] * (Decimal(c) - Decimal(k))
-                d1 = sorted_vals[c] * (Decimal(k) - Decimal(f))
-                return (d0 + d1).quantize(Decimal("0.01"))
-
-            p25 = percentile(values_sorted, 0.25)
-            p75 = percentile(values_sorted, 0.75)
 
         # Standard reference
         std_ref_rate: Optional[Decimal] = None
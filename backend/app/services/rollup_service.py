@@ -0,0 +1,375 @@
+from sqlalchemy import Date, Numeric, case, cast, delete, func, insert, literal, literal_column, select, type_coerce, union_all
+from sqlalchemy.orm import Session
+from typing import Dict, Iterable, List, Optional, Tuple
+from datetime import date, timedelta
+from decimal import Decimal
+import enum
+from ..models import WorkLog, WorkItem, LaborEntry, EquipmentEntry, MaterialEntry
+from ..models.cost_rollups import CostCategory, DailyCostRollup
+from ..models.project_archives import ProjectArchive
+from . import money
+
+# 집계 금액 타입: 수량(소수 3자리) × 단가(소수 2자리)까지 손실 없이 받는다
+AMOUNT_TYPE = Numeric(18, 5)
+
+RollupKey = Tuple[int, date, CostCategory]
+
+
+class TimeBucket(str, enum.Enum):
+    DAY = "day"
+    WEEK = "week"    # 월요일 시작
+    MONTH = "month"
+
+
+def bucket_start(day: date, bucket: TimeBucket) -> date:
+    """day가 속한 구간의 시작일"""
+    if bucket == TimeBucket.WEEK:
+        return day - timedelta(days=day.weekday())
+    if bucket == TimeBucket.MONTH:
+        return day.replace(day=1)
+    return day
+
+
+def next_bucket(start: date, bucket: TimeBucket) -> date:
+    """다음 구간의 시작일"""
+    if bucket == TimeBucket.WEEK:
+        return start + timedelta(days=7)
+    if bucket == TimeBucket.MONTH:
+        return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return start + timedelta(days=1)
+
+
+def bucket_count(period_from: date, period_to: date, bucket: TimeBucket) -> int:
+    """기간을 덮는 구간 수 (빈 구간 포함)"""
+    if bucket == TimeBucket.WEEK:
+        return (bucket_start(period_to, bucket) - bucket_start(period_from, bucket)).days // 7 + 1
+    if bucket == TimeBucket.MONTH:
+        return (period_to.year - period_from.year) * 12 + period_to.month - period_from.month + 1
+    return (period_to - period_from).days + 1
+
+
+def labor_cost_expr():
+    """노무비 = 인원 × 시간 × 단가"""
+    return LaborEntry.persons * LaborEntry.hours * LaborEntry.unit_rate
+
+
+def equipment_cost_expr():
+    """장비비 = (대수 × max(시간, 최소호출시간) × 시간단가) + 이동/설치비"""
+    min_hours = func.coalesce(EquipmentEntry.min_hours, 0)
+    applied_hours = case((EquipmentEntry.hours > min_hours, EquipmentEntry.hours), else_=min_hours)
+    return (EquipmentEntry.units * applied_hours * EquipmentEntry.hourly_rate
+            + func.coalesce(EquipmentEntry.mobilization_fee, 0))
+
+
+def material_cost_expr():
+    """자재비 = 수량 × 단가"""
+    return MaterialEntry.quantity * MaterialEntry.unit_price
+
+
+# (비용구분, 투입 테이블의 작업항목 FK, 금액식)
+COST_SOURCES = (
+    (CostCategory.LABOR, LaborEntry.work_item_id, labor_cost_expr),
+    (CostCategory.EQUIPMENT, EquipmentEntry.work_item_id, equipment_cost_expr),
+    (CostCategory.MATERIAL, MaterialEntry.work_item_id, material_cost_expr),
+)
+
+
+def labor_cost(persons, hours, unit_rate) -> Decimal:
+    """노무비 1건 (labor_cost_expr와 동일 규칙)"""
+    return money.as_decimal(persons) * money.as_decimal(hours) * money.as_decimal(unit_rate)
+
+
+def equipment_cost(units, hours, min_hours, hourly_rate, mobilization_fee) -> Decimal:
+    """장비비 1건 (equipment_cost_expr와 동일 규칙)"""
+    min_hours = money.as_decimal(min_hours) if min_hours is not None else money.ZERO
+    actual_hours = max(money.as_decimal(hours), min_hours)
+    mobilization_fee = money.as_decimal(mobilization_fee) if mobilization_fee is not None else money.ZERO
+    return money.as_decimal(units) * actual_hours * money.as_decimal(hourly_rate) + mobilization_fee
+
+
+def material_cost(quantity, unit_price) -> Decimal:
+    """자재비 1건 (material_cost_expr와 동일 규칙)"""
+    return money.as_decimal(quantity) * money.as_decimal(unit_price)
+
+
+def entry_cost(entry) -> Tuple[CostCategory, Decimal]:
+    """메모리상의 투입 엔티티 1건의 비용구분과 금액 (SQL 금액식과 동일 규칙)"""
+    if isinstance(entry, LaborEntry):
+        return CostCategory.LABOR, labor_cost(entry.persons, entry.hours, entry.unit_rate)
+    if isinstance(entry, EquipmentEntry):
+        return CostCategory.EQUIPMENT, equipment_cost(
+            entry.units, entry.hours, entry.min_hours, entry.hourly_rate, entry.mobilization_fee
+        )
+    if isinstance(entry, MaterialEntry):
+        return CostCategory.MATERIAL, material_cost(entry.quantity, entry.unit_price)
+    raise TypeError(f"지원하지 않는 투입 유형입니다: {type(entry).__name__}")
+
+
+def _to_decimal(value) -> Decimal:
+    """DB 집계값(float/Decimal/None)을 Decimal로 변환"""
+    if value is None:
+        return money.ZERO
+    return money.as_decimal(value)
+
+
+class CostRollupService:
+    """일자별 비용 집계 테이블(daily_cost_rollups) 유지/조회 서비스
+
+    작업일지 쓰기 경로는 같은 트랜잭션 안에서 add_entries/remove_entries로
+    증감분을 반영하고, 조회 경로는 원천 투입 테이블 대신 집계 테이블을 읽는다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    # ---- 증분 갱신 ----
+
+    def add_entries(self, project_id: int, work_date: date, entries: Iterable) -> None:
+        """새로 추가된 투입 데이터를 집계에 더한다 (commit은 호출자가 수행)"""
+        self._apply(project_id, work_date, entries, sign=1)
+
+    def remove_entries(self, project_id: int, work_date: date, entries: Iterable) -> None:
+        """삭제될 투입 데이터를 집계에서 뺀다 (commit은 호출자가 수행)"""
+        self._apply(project_id, work_date, entries, sign=-1)
+
+    def add_deltas(self, deltas: Dict[RollupKey, Tuple[Decimal, int]]) -> None:
+        """(project_id, work_date, category)별 금액/건수 증감분을 한 번에 반영 (대량 적재용, commit은 호출자가 수행)"""
+        if deltas:
+            self._upsert([
+                dict(project_id=project_id, work_date=work_date, category=category, amount=amount, row_count=count)
+                for (project_id, work_date, category), (amount, count) in deltas.items()
+            ])
+
+    def _apply(self, project_id: int, work_date: date, entries: Iterable, sign: int) -> None:
+        entries = list(entries)
+        if not entries:
+            return
+
+        # 최소호출시간 등 컬럼 기본값이 채워지도록 먼저 flush
+        self.db.flush()
+
+        deltas: Dict[RollupKey, Tuple[Decimal, int]] = {}
+        for entry in entries:
+            category, cost = entry_cost(entry)
+            amount, count = deltas.get((project_id, work_date, category), (money.ZERO, 0))
+            deltas[(project_id, work_date, category)] = (amount + sign * cost, count + sign)
+
+        self.add_deltas(deltas)
+
+        if sign < 0:
+            self.db.execute(
+                delete(DailyCostRollup).where(
+                    DailyCostRollup.project_id == project_id,
+                    DailyCostRollup.work_date == work_date,
+                    DailyCostRollup.row_count <= 0
+                )
+            )
+
+    def _upsert(self, rows: List[Dict]) -> None:
+        """(project_id, work_date, category) 행에 금액/건수를 원자적으로 가산 (여러 행은 executemany)"""
+        if self.db.get_bind().dialect.name == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+
+        stmt = dialect_insert(DailyCostRollup)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[DailyCostRollup.project_id, DailyCostRollup.work_date, DailyCostRollup.category],
+            set_={
+                "amount": DailyCostRollup.amount + stmt.excluded.amount,
+                "row_count": DailyCostRollup.row_count + stmt.excluded.row_count,
+            }
+        )
+        self.db.execute(stmt, rows)
+
+    # ---- 조회 ----
+
+    def summarize(self, project_id: int, period_from: date, period_to: date) -> Dict[CostCategory, Tuple[Decimal, int]]:
+        """기간 내 비용구분별 (합계금액, 투입 건수)"""
+        rows = self.db.query(
+            DailyCostRollup.category,
+            type_coerce(func.sum(DailyCostRollup.amount), AMOUNT_TYPE),
+            func.sum(DailyCostRollup.row_count)
+        ).filter(
+            DailyCostRollup.project_id == project_id,
+            DailyCostRollup.work_date >= period_from,
+            DailyCostRollup.work_date <= period_to
+        ).group_by(DailyCostRollup.category).all()
+
+        return {category: (_to_decimal(amount), int(count or 0)) for category, amount, count in rows}
+
+    def summarize_projects(
+        self,
+        project_ids: Optional[List[int]],
+        period_from: date,
+        period_to: date
+    ) -> Dict[int, Dict[CostCategory, Tuple[Decimal, int]]]:
+        """여러 프로젝트의 기간 내 비용구분별 (합계금액, 투입 건수)를 한 번의 그룹 쿼리로 조회
+
+        project_ids가 None이면 기간 내 투입 이력이 있는 모든 프로젝트가 대상이다.
+        """
+        query = self.db.query(
+            DailyCostRollup.project_id,
+            DailyCostRollup.category,
+            type_coerce(func.sum(DailyCostRollup.amount), AMOUNT_TYPE),
+            func.sum(DailyCostRollup.row_count)
+        ).filter(
+            DailyCostRollup.work_date >= period_from,
+            DailyCostRollup.work_date <= period_to
+        )
+        if project_ids is not None:
+            query = query.filter(DailyCostRollup.project_id.in_(project_ids))
+
+        result: Dict[int, Dict[CostCategory, Tuple[Decimal, int]]] = {}
+        for project_id, category, amount, count in query.group_by(DailyCostRollup.project_id, DailyCostRollup.category):
+            result.setdefault(project_id, {})[category] = (_to_decimal(amount), int(count or 0))
+        return result
+
+    def _bucket_expr(self, bucket: TimeBucket):
+        """work_date를 구간 시작일로 내리는 SQL 식 (SQLite/PostgreSQL)"""
+        column = DailyCostRollup.work_date
+        if bucket == TimeBucket.DAY:
+            return column
+        if self.db.get_bind().dialect.name == "sqlite":
+            if bucket == TimeBucket.WEEK:
+                return func.date(column, 'weekday 0', '-6 days')
+            return func.date(column, 'start of month')
+        # GROUP BY와 SELECT의 식이 같도록 구간 단위는 바인드 파라미터가 아닌 리터럴로 넣는다
+        return cast(func.date_trunc(literal_column(f"'{bucket.value}'"), column), Date)
+
+    def summarize_buckets(
+        self,
+        project_id: int,
+        period_from: date,
+        period_to: date,
+        bucket: TimeBucket
+    ) -> Dict[Tuple[date, CostCategory], Tuple[Decimal, int]]:
+        """기간 내 (구간 시작일, 비용구분)별 (합계금액, 투입 건수)를 한 번의 그룹 쿼리로 조회"""
+        bucket_col = self._bucket_expr(bucket).label('bucket')
+        rows = self.db.query(
+            bucket_col,
+            DailyCostRollup.category,
+            type_coerce(func.sum(DailyCostRollup.amount), AMOUNT_TYPE),
+            func.sum(DailyCostRollup.row_count)
+        ).filter(
+            DailyCostRollup.project_id == project_id,
+            DailyCostRollup.work_date >= period_from,
+            DailyCostRollup.work_date <= period_to
+        ).group_by(bucket_col, DailyCostRollup.category).all()
+
+        result = {}
+        for start, category, amount, count in rows:
+            # SQLite의 date()는 문자열을 돌려준다
+            if isinstance(start, str):
+                start = date.fromisoformat(start)
+            result[(start, category)] = (_to_decimal(amount), int(count or 0))
+        return result
+
+    MAX_TIME_SERIES_BUCKETS = 366
+
+    def time_series(self, project_id: int, period_from: date, period_to: date, bucket: TimeBucket) -> List[Dict]:
+        """구간별 비용과 누적 합계 (투입이 없는 구간도 0으로 채운다)"""
+        if bucket_count(period_from, period_to, bucket) > self.MAX_TIME_SERIES_BUCKETS:
+            raise ValueError(
+                f"한 번에 {self.MAX_TIME_SERIES_BUCKETS}개 구간까지 조회할 수 있습니다. 기간을 줄이거나 더 큰 집계 단위를 사용하세요"
+            )
+        totals = self.summarize_buckets(project_id, period_from, period_to, bucket)
+
+        cumulative = {category: money.ZERO for category in CostCategory}
+        series = []
+        start = bucket_start(period_from, bucket)
+        while start <= period_to:
+            end = next_bucket(start, bucket)
+            amounts = {}
+            entries_count = 0
+            for category in CostCategory:
+                amount, count = totals.get((start, category), (money.ZERO, 0))
+                amounts[category] = amount
+                cumulative[category] += amount
+                entries_count += count
+            series.append({
+                'bucket_start': max(start, period_from),
+                'bucket_end': min(end - timedelta(days=1), period_to),
+                'amounts': amounts,
+                'cumulative': dict(cumulative),
+                'entries_count': entries_count
+            })
+            start = end
+        return series
+
+    # ---- 재구축/검증 ----
+    # 보관(콜드 스토리지)된 프로젝트는 원천 행이 운영 DB에 없으므로 집계를 그대로 두고 비교하지 않는다
+
+    def raw_rollup_select(self, project_id: Optional[int] = None):
+        """원천 투입 테이블에서 (project_id, work_date, category)별 합계를 구하는 SELECT"""
+        archived = select(ProjectArchive.project_id)
+        selects = []
+        for category, work_item_fk, cost_expr in COST_SOURCES:
+            stmt = select(
+                WorkLog.project_id.label('project_id'),
+                WorkLog.work_date.label('work_date'),
+                literal(category.name).label('category'),
+                type_coerce(func.sum(cost_expr()), AMOUNT_TYPE).label('amount'),
+                func.count().label('row_count')
+            ).select_from(work_item_fk.table).join(
+                WorkItem, work_item_fk == WorkItem.id
+            ).join(
+                WorkLog, WorkItem.work_log_id == WorkLog.id
+            ).where(
+                WorkLog.project_id.not_in(archived)
+            ).group_by(WorkLog.project_id, WorkLog.work_date)
+
+            if project_id is not None:
+                stmt = stmt.where(WorkLog.project_id == project_id)
+            selects.append(stmt)
+
+        return union_all(*selects)
+
+    def rebuild(self, project_id: Optional[int] = None) -> int:
+        """집계 테이블을 원천 데이터로부터 다시 계산 (INSERT ... SELECT)"""
+        stmt = delete(DailyCostRollup).where(DailyCostRollup.project_id.not_in(select(ProjectArchive.project_id)))
+        if project_id is not None:
+            stmt = stmt.where(DailyCostRollup.project_id == project_id)
+        self.db.execute(stmt)
+
+        source = self.raw_rollup_select(project_id).subquery()
+        result = self.db.execute(
+            insert(DailyCostRollup).from_select(
+                ['project_id', 'work_date', 'category', 'amount', 'row_count'],
+                select(source.c.project_id, source.c.work_date, source.c.category, source.c.amount, source.c.row_count)
+            )
+        )
+        self.db.commit()
+        return result.rowcount
+
+    def verify(self, project_id: Optional[int] = None) -> List[Dict]:
+        """집계 테이블과 원천 데이터 비교, 불일치 목록 반환 (0.01원 단위 비교)"""
+        raw: Dict[RollupKey, Tuple[Decimal, int]] = {}
+        for row in self.db.execute(self.raw_rollup_select(project_id)):
+            raw[(row.project_id, row.work_date, CostCategory[row.category])] = (_to_decimal(row.amount), row.row_count)
+
+        query = self.db.query(DailyCostRollup).filter(
+            DailyCostRollup.project_id.not_in(select(ProjectArchive.project_id))
+        )
+        if project_id is not None:
+            query = query.filter(DailyCostRollup.project_id == project_id)
+        stored: Dict[RollupKey, Tuple[Decimal, int]] = {
+            (r.project_id, r.work_date, r.category): (_to_decimal(r.amount), r.row_count) for r in query
+        }
+
+        cent = Decimal('0.01')
+        mismatches = []
+        for key in sorted(set(raw) | set(stored), key=lambda k: (k[0], k[1], k[2].value)):
+            raw_amount, raw_count = raw.get(key, (Decimal('0'), 0))
+            stored_amount, stored_count = stored.get(key, (Decimal('0'), 0))
+            if raw_count != stored_count or raw_amount.quantize(cent) != stored_amount.quantize(cent):
+                mismatches.append({
+                    'project_id': key[0],
+                    'work_date': key[1],
+                    'category': key[2].value,
+                    'raw_amount': raw_amount,
+                    'rollup_amount': stored_amount,
+                    'raw_count': raw_count,
+                    'rollup_count': stored_count
+                })
+        return mismatches
@@ -0,0 +1,340 @@
+from sqlalchemy import Column, DateTime, Index, Integer, MetaData, String, Table, inspect, select, text, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.schema import CreateTable
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from ..database import Base
+from .. import models  # noqa: F401  (모델 테이블을 Base.metadata에 등록)
+from ..models.sync_tombstones import SYNC_TABLES, create_sync_triggers
+from ..models.work_log_search import create_search_index, rebuild_search_index
+from ..models import EquipmentEntry, ProjectArchive
+from . import money
+from .labor_stats_service import LaborRateStatsService
+from .rollup_service import CostRollupService, equipment_cost
+
+# 적용된 스키마 단계 기록 (모델 메타데이터와 분리해 create_all 대상에서 제외)
+schema_versions = Table(
+    "schema_versions",
+    MetaData(),
+    Column("version", Integer, primary_key=True),
+    Column("description", String, nullable=False),
+    Column("applied_at", DateTime, server_default=func.now()),
+)
+
+# 조회 핫패스 인덱스: (이름, 테이블, 키 컬럼, 커버링 컬럼)
+# 커버링 컬럼은 PostgreSQL에서는 INCLUDE로, INCLUDE가 없는 SQLite에서는 키 뒤에 붙인다.
+HOT_PATH_INDEXES: List[Tuple[str, str, Tuple[str, ...], Tuple[str, ...]]] = [
+    # 프로젝트/기간 필터 + (work_date, id) 키셋 목록
+    ("ix_work_logs_project_date", "work_logs", ("project_id", "work_date", "id"), ()),
+    # 작업일지 → 작업항목 조인
+    ("ix_work_items_work_log", "work_items", ("work_log_id", "id"), ("task_code",)),
+    # 직종별 단가 이력 (추천): 직종으로 찾고 작업항목으로 조인, 단가는 인덱스에서 읽음
+    ("ix_labor_entries_trade", "labor_entries", ("trade", "work_item_id"), ("rate_type", "unit_rate")),
+    # 작업항목 → 투입 내역 조인 (집계/상세/삭제)
+    ("ix_labor_entries_work_item", "labor_entries", ("work_item_id",), ()),
+    ("ix_equipment_entries_work_item", "equipment_entries", ("work_item_id",), ()),
+    ("ix_material_entries_work_item", "material_entries", ("work_item_id",), ()),
+]
+
+# 변경 동기화: (sync_version, PK) 키셋으로 변경분을 읽는다
+SYNC_INDEXES: List[Tuple[str, str, Tuple[str, ...], Tuple[str, ...]]] = [
+    ("ix_clients_sync_version", "clients", ("sync_version", "id"), ()),
+    ("ix_projects_sync_version", "projects", ("sync_version", "id"), ()),
+    ("ix_work_logs_sync_version", "work_logs", ("sync_version", "id"), ()),
+    ("ix_work_items_sync_version", "work_items", ("sync_version", "id"), ()),
+    ("ix_labor_entries_sync_version", "labor_entries", ("sync_version", "id"), ()),
+    ("ix_equipment_entries_sync_version", "equipment_entries", ("sync_version", "entry_id"), ()),
+    ("ix_material_entries_sync_version", "material_entries", ("sync_version", "entry_id"), ()),
+    ("ix_sync_tombstones_version", "sync_tombstones", ("sync_version", "id"), ()),
+]
+
+# 시각 기준 동기화 때 3단계가 만들던 (updated_at, PK) 인덱스 (11단계에서 지운다)
+LEGACY_SYNC_INDEXES: List[Tuple[str, str, Tuple[str, ...], Tuple[str, ...]]] = [
+    ("ix_clients_updated", "clients", ("updated_at", "id"), ()),
+    ("ix_projects_updated", "projects", ("updated_at", "id"), ()),
+    ("ix_work_logs_updated", "work_logs", ("updated_at", "id"), ()),
+    ("ix_work_items_updated", "work_items", ("updated_at", "id"), ()),
+    ("ix_labor_entries_updated", "labor_entries", ("updated_at", "id"), ()),
+    ("ix_equipment_entries_updated", "equipment_entries", ("updated_at", "entry_id"), ()),
+    ("ix_material_entries_updated", "material_entries", ("updated_at", "entry_id"), ()),
+    ("ix_sync_tombstones_deleted", "sync_tombstones", ("deleted_at", "id"), ()),
+]
+
+class IndexManager:
+    """선언된 인덱스와 실제 DB 인덱스를 비교하고 없는 것만 생성
+
+    PostgreSQL에서는 운영 중 쓰기를 막지 않도록 CREATE INDEX CONCURRENTLY를
+    트랜잭션 밖(AUTOCOMMIT)에서 실행한다. 이미 있는 인덱스는 건너뛰므로 재실행해도 안전하다.
+    """
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.dialect = engine.dialect.name
+
+    def existing(self, table_name: str) -> Dict[str, List[str]]:
+        """테이블의 인덱스 이름 → 컬럼 목록"""
+        inspector = inspect(self.engine)
+        if not inspector.has_table(table_name):
+            return {}
+        return {ix['name']: ix['column_names'] for ix in inspector.get_indexes(table_name)}
+
+    def missing(self, specs=HOT_PATH_INDEXES) -> List[str]:
+        """아직 만들어지지 않은 인덱스 이름"""
+        return [name for name, table_name, _, _ in specs if name not in self.existing(table_name)]
+
+    def build(self, name: str, table_name: str, columns: Sequence[str], include: Sequence[str] = (),
+              unique: bool = False) -> Index:
+        """모델 테이블의 복사본에 인덱스 정의 (원본 메타데이터에 붙지 않도록)"""
+        table = Base.metadata.tables[table_name].to_metadata(MetaData())
+        options = {}
+        key_columns = list(columns)
+        if self.dialect == "postgresql":
+            options['postgresql_concurrently'] = True
+            if include:
+                options['postgresql_include'] = list(include)
+        else:
+            key_columns += list(include)
+        return Index(name, *(table.c[column] for column in key_columns), unique=unique, **options)
+
+    def create(self, specs=HOT_PATH_INDEXES) -> List[str]:
+        """없는 인덱스 생성 후 생성한 이름 목록 반환"""
+        created = []
+        for name, table_name, columns, include in specs:
+            if self.ensure(self.build(name, table_name, columns, include)):
+                created.append(name)
+        return created
+
+    def ensure(self, index: Index) -> bool:
+        """인덱스가 없으면 생성 (생성했으면 True)"""
+        if index.name in self.existing(index.table.name):
+            return False
+        with self.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            index.create(conn, checkfirst=True)
+        return True
+
+    def drop(self, specs=HOT_PATH_INDEXES) -> List[str]:
+        """선언된 인덱스 삭제 (벤치마크에서 인덱스 전/후 비교용)"""
+        dropped = []
+        for name, table_name, columns, include in specs:
+            if name in self.existing(table_name):
+                with self.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                    self.build(name, table_name, columns, include).drop(conn)
+                dropped.append(name)
+        return dropped
+
+
+def _hot_path_indexes(engine: Engine) -> None:
+    IndexManager(engine).create(HOT_PATH_INDEXES)
+
+
+def _invoice_idempotency_key(engine: Engine) -> None:
+    """create_all 이전에 만들어진 invoices 테이블에 멱등키 컬럼/유니크 인덱스 추가"""
+    columns = {column['name'] for column in inspect(engine).get_columns("invoices")}
+    if "idempotency_key" not in columns:
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE invoices ADD COLUMN idempotency_key VARCHAR"))
+    manager = IndexManager(engine)
+    manager.ensure(manager.build("ix_invoices_idempotency_key", "invoices", ("idempotency_key",), unique=True))
+
+
+def _sync_change_tracking(engine: Engine) -> None:
+    """작업항목/투입 테이블에 updated_at 추가, 톰스톤 테이블 생성 (동기화 순번/인덱스는 11단계)
+
+    SQLite는 ALTER TABLE로 CURRENT_TIMESTAMP 기본값 컬럼을 추가할 수 없어
+    기본값 없이 추가해 기존 행을 채우고, 새 행은 INSERT 트리거로 채운다.
+    """
+    inspector = inspect(engine)
+    for table_name in ("work_items", "labor_entries", "equipment_entries", "material_entries"):
+        if "updated_at" in {column['name'] for column in inspector.get_columns(table_name)}:
+            continue
+        with engine.begin() as conn:
+            if engine.dialect.name == "postgresql":
+                conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN updated_at TIMESTAMP DEFAULT now()"))
+            else:
+                conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN updated_at DATETIME"))
+                conn.execute(text(f"UPDATE {table_name} SET updated_at = CURRENT_TIMESTAMP"))
+                conn.execute(text(
+                    f"CREATE TRIGGER IF NOT EXISTS trg_{table_name}_updated_at AFTER INSERT ON {table_name} "
+                    f"WHEN NEW.updated_at IS NULL BEGIN "
+                    f"UPDATE {table_name} SET updated_at = CURRENT_TIMESTAMP WHERE rowid = NEW.rowid; END"
+                ))
+    Base.metadata.tables["sync_tombstones"].create(engine, checkfirst=True)
+
+
+def _table_versions(engine: Engine) -> None:
+    Base.metadata.tables["table_versions"].create(engine, checkfirst=True)
+
+
+def _work_log_search(engine: Engine) -> None:
+    """검색 색인 테이블 생성 후 기존 작업일지 전체 색인"""
+    with engine.begin() as conn:
+        create_search_index(conn)
+        rebuild_search_index(conn)
+
+
+def _project_archives(engine: Engine) -> None:
+    Base.metadata.tables["project_archives"].create(engine, checkfirst=True)
+
+
+def _labor_rate_stats(engine: Engine) -> None:
+    """직종별 단가 분포 테이블 생성 후 기존 노무 투입으로 채움"""
+    Base.metadata.tables["labor_rate_stats"].create(engine, checkfirst=True)
+    with Session(engine) as session:
+        LaborRateStatsService(session).rebuild()
+
+
+def _rollup_and_billing_tables(engine: Engine) -> None:
+    """일자별 비용 집계, 일괄 청구 실행, 기성 원장 테이블 생성 (집계는 다음 단계에서 채운다)"""
+    for table_name in ("daily_cost_rollups", "billing_runs", "billing_run_items", "progress_payment_ledger"):
+        Base.metadata.tables[table_name].create(engine, checkfirst=True)
+
+
+def _equipment_units_cost(engine: Engine) -> None:
+    """대수를 빠뜨리고 저장된 장비비(대수 2 이상)를 다시 계산하고 비용 집계 재구축"""
+    with Session(engine) as session:
+        rows = session.execute(
+            select(EquipmentEntry.entry_id, EquipmentEntry.units, EquipmentEntry.hours, EquipmentEntry.min_hours,
+                   EquipmentEntry.hourly_rate, EquipmentEntry.mobilization_fee)
+            .where(EquipmentEntry.units != 1)
+        ).all()
+        if rows:
+            session.execute(update(EquipmentEntry), [
+                {"entry_id": row.entry_id, "total_cost": money.quantize(equipment_cost(
+                    row.units, row.hours, row.min_hours, row.hourly_rate, row.mobilization_fee
+                ))}
+                for row in rows
+            ])
+        CostRollupService(session).rebuild()
+
+
+def _sqlite_autoincrement(engine: Engine) -> None:
+    """SQLite 작업일지/작업항목/투입 테이블을 AUTOINCREMENT로 다시 만든다
+
+    AUTOINCREMENT 없는 SQLite 테이블은 최대 rowid 다음 번호를 새 ID로 써서, 최근 프로젝트를 보관하면
+    그 ID가 새 행에 다시 쓰여 복원이 막힌다. 제약을 바꾸는 ALTER가 없으므로 새 테이블로 옮겨 이름을 바꾸고
+    인덱스/트리거를 다시 만든 뒤, 이미 보관된 행의 최대 ID까지 sqlite_sequence를 올려 둔다.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+    from .archive_service import ARCHIVE_TABLES, archive_engine
+
+    with engine.connect() as conn:
+        foreign_keys = conn.execute(text("PRAGMA foreign_keys")).scalar()
+        conn.execute(text("PRAGMA foreign_keys=OFF"))
+        conn.commit()
+        for name in ARCHIVE_TABLES:
+            table = Base.metadata.tables[name]
+            schema = conn.execute(
+                text("SELECT type, sql FROM sqlite_master WHERE tbl_name = :name AND sql IS NOT NULL"), {"name": name}
+            ).all()
+            create_sql = next(sql for kind, sql in schema if kind == "table")
+            if "AUTOINCREMENT" in create_sql.upper():
+                continue
+            # 이후 단계에서 추가되는 컬럼은 새 테이블의 기본값으로 채워진다
+            columns = [column["name"] for column in inspect(conn).get_columns(name)]
+            if not set(columns) <= set(table.columns.keys()):
+                raise RuntimeError(f"{name} 컬럼이 모델과 달라 AUTOINCREMENT로 옮길 수 없습니다")
+            column_list = ", ".join(columns)
+            conn.execute(text(str(CreateTable(table).compile(engine)).replace(
+                f"CREATE TABLE {name} (", f"CREATE TABLE {name}__new (", 1
+            )))
+            conn.execute(text(f"INSERT INTO {name}__new ({column_list}) SELECT {column_list} FROM {name}"))
+            conn.execute(text(f"DROP TABLE {name}"))
+            conn.execute(text(f"ALTER TABLE {name}__new RENAME TO {name}"))
+            for kind, sql in schema:
+                if kind in ("index", "trigger"):
+                    conn.execute(text(sql))
+            conn.commit()
+
+        if conn.execute(select(func.count()).select_from(ProjectArchive)).scalar():
+            with archive_engine().connect() as archive:
+                for name in ARCHIVE_TABLES:
+                    pk = next(iter(Base.metadata.tables[name].primary_key.columns)).name
+                    archived = archive.execute(text(f"SELECT max({pk}) FROM {name}")).scalar()
+                    if archived is None:
+                        continue
+                    seq = conn.execute(text("SELECT seq FROM sqlite_sequence WHERE name = :name"), {"name": name}).scalar()
+                    if seq is None:
+                        conn.execute(text("INSERT INTO sqlite_sequence (name, seq) VALUES (:name, :seq)"),
+                                     {"name": name, "seq": archived})
+                    elif seq < archived:
+                        conn.execute(text("UPDATE sqlite_sequence SET seq = :seq WHERE name = :name"),
+                                     {"name": name, "seq": archived})
+            conn.commit()
+        conn.execute(text(f"PRAGMA foreign_keys={'ON' if foreign_keys else 'OFF'}"))
+
+
+def _sync_versions(engine: Engine) -> None:
+    """동기화 대상 테이블/톰스톤에 sync_version 컬럼과 트리거, 키셋 인덱스 추가
+
+    기존 행은 0으로 두어 전체 동기화에 포함되고, 시각 기준 워터마크 토큰은 더 이상 받지 않으므로
+    클라이언트는 한 번 전체 동기화를 다시 받는다.
+    """
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table_name in (*SYNC_TABLES, "sync_tombstones"):
+            if "sync_version" not in {column['name'] for column in inspector.get_columns(table_name)}:
+                conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN sync_version BIGINT NOT NULL DEFAULT 0"))
+        create_sync_triggers(conn)
+    manager = IndexManager(engine)
+    manager.drop(LEGACY_SYNC_INDEXES)
+    manager.create(SYNC_INDEXES)
+
+
+def _billing_run_heartbeat(engine: Engine) -> None:
+    """일괄 청구 실행에 작업자 heartbeat 컬럼 추가 (죽은 실행을 넘겨받는 기준)"""
+    if "heartbeat_at" not in {column['name'] for column in inspect(engine).get_columns("billing_runs")}:
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE billing_runs ADD COLUMN heartbeat_at TIMESTAMP"))
+
+
+# 버전 순으로 적용되는 스키마 단계: (버전, 설명, 적용 함수)
+# 적용 함수는 이미 반영된 부분을 건너뛰도록 작성해 중간에 실패해도 다시 실행할 수 있게 한다.
+SCHEMA_STEPS: List[Tuple[int, str, Callable[[Engine], None]]] = [
+    (1, "hot path composite/covering indexes", _hot_path_indexes),
+    (2, "invoices.idempotency_key column and unique index", _invoice_idempotency_key),
+    (3, "change tracking (updated_at, tombstones) for delta sync", _sync_change_tracking),
+    (4, "table version counters for conditional GET", _table_versions),
+    (5, "work log full-text search index", _work_log_search),
+    (6, "project archive registry for cold storage", _project_archives),
+    (7, "labor rate distribution stats for recommendations", _labor_rate_stats),
+    (8, "cost rollup, billing run and progress payment ledger tables", _rollup_and_billing_tables),
+    (9, "equipment total_cost and cost rollups include units", _equipment_units_cost),
+    (10, "SQLite AUTOINCREMENT ids for archivable tables", _sqlite_autoincrement),
+    (11, "commit-ordered sync_version for delta sync", _sync_versions),
+    (12, "billing run worker heartbeat for stale run takeover", _billing_run_heartbeat),
+]
+
+
+class SchemaMigrator:
+    """SCHEMA_STEPS 중 적용되지 않은 단계를 순서대로 적용하고 schema_versions에 기록"""
+
+    def __init__(self, engine: Engine, steps=SCHEMA_STEPS):
+        self.engine = engine
+        self.steps = sorted(steps, key=lambda step: step[0])
+
+    def applied(self) -> Dict[int, Dict]:
+        """적용된 버전 → 기록"""
+        schema_versions.create(self.engine, checkfirst=True)
+        with self.engine.connect() as conn:
+            rows = conn.execute(select(schema_versions).order_by(schema_versions.c.version)).mappings().all()
+        return {row['version']: dict(row) for row in rows}
+
+    def pending(self) -> List[Tuple[int, str, Callable[[Engine], None]]]:
+        applied = self.applied()
+        return [step for step in self.steps if step[0] not in applied]
+
+    def upgrade(self, target: Optional[int] = None, progress: Optional[Callable] = None) -> List[int]:
+        """target 버전까지(생략 시 전부) 적용하고 적용한 버전 목록 반환"""
+        done = []
+        for version, description, apply in self.pending():
+            if target is not None and version > target:
+                break
+            if progress:
+                progress(version, description)
+            apply(self.engine)
+            with self.engine.begin() as conn:
+                conn.execute(schema_versions.insert().values(version=version, description=description))
+            done.append(version)
+        return done
@@ -0,0 +1,73 @@
+from sqlalchemy import column, func, literal_column, select, table
+from sqlalchemy.orm import Session
+from typing import List, Optional, Tuple
+from ..models import WorkLog
+from ..models.work_log_search import SEARCH_TABLE, search_tokens
+from .pagination import decode_cursor, encode_cursor
+
+_search = table(SEARCH_TABLE, column("rowid"), column("work_log_id"), column("document"))
+_HIT_COLUMNS = (WorkLog.id, WorkLog.project_id, WorkLog.work_date, WorkLog.area, WorkLog.weather,
+                WorkLog.process_status, WorkLog.notes)
+
+
+class WorkLogSearchService:
+    """작업일지 전문 검색 (구역/공정상태/비고, 작업항목 작업명/규격)
+
+    검색어는 공백으로 나눈 단어마다 색인과 같은 방식으로 토큰화해 구(phrase)로 찾고,
+    단어끼리는 AND로 묶는다. 각 단어의 마지막 토큰은 접두어로 맞춘다 ("3층" → 3층에서, 3층 ...).
+    관련도 점수는 색인 통계에 따라 달라지는 실수라 키셋 대신 위치(offset) 커서를 쓰고,
+    깊은 페이지는 MAX_OFFSET으로 막는다. 그 너머에 결과가 더 있으면 truncated로 알린다.
+    """
+
+    DEFAULT_LIMIT = 20
+    MAX_LIMIT = 100
+    MAX_OFFSET = 1000
+    MAX_TERMS = 10
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.sqlite = db.get_bind().dialect.name == "sqlite"
+
+    def search(self, q: str, project_id: Optional[int] = None, limit: int = DEFAULT_LIMIT,
+               cursor: Optional[str] = None) -> Tuple[List, Optional[str], bool]:
+        """관련도순 검색 결과 한 페이지(작업일지 컬럼 + score), 다음 페이지 커서, 잘림 여부
+
+        잘림 여부는 결과가 더 있지만 MAX_OFFSET을 넘어 다음 페이지를 줄 수 없을 때 True다.
+        """
+        terms = [tokens for tokens in (search_tokens(term, query=True) for term in q.split()) if tokens]
+        if not terms:
+            raise ValueError("검색어를 입력하세요")
+        if len(terms) > self.MAX_TERMS:
+            raise ValueError(f"검색어는 {self.MAX_TERMS}단어까지 입력할 수 있습니다")
+        offset = 0
+        if cursor:
+            offset = decode_cursor(cursor, 1)[0]
+            if not isinstance(offset, int) or not 0 <= offset <= self.MAX_OFFSET:
+                raise ValueError("잘못된 커서입니다")
+
+        if self.sqlite:
+            # bm25는 낮을수록 관련도가 높다
+            match = " AND ".join(" + ".join(f'"{token}"' for token in tokens) + "*" for tokens in terms)
+            score = -func.bm25(literal_column(SEARCH_TABLE))
+            query = select(*_HIT_COLUMNS, score.label("score")).select_from(
+                _search.join(WorkLog, WorkLog.id == _search.c.rowid)
+            ).where(literal_column(SEARCH_TABLE).op("MATCH")(match))
+        else:
+            tsquery = func.to_tsquery("simple", " & ".join(
+                " <-> ".join(f"'{token}'" for token in tokens) + ":*" for tokens in terms
+            ))
+            score = func.ts_rank_cd(_search.c.document, tsquery)
+            query = select(*_HIT_COLUMNS, score.label("score")).select_from(
+                _search.join(WorkLog, WorkLog.id == _search.c.work_log_id)
+            ).where(_search.c.document.op("@@")(tsquery))
+        if project_id is not None:
+            query = query.where(WorkLog.project_id == project_id)
+
+        rows = self.db.execute(
+            query.order_by(score.desc(), WorkLog.work_date.desc(), WorkLog.id.desc()).offset(offset).limit(limit + 1)
+        ).mappings().all()
+        more = len(rows) > limit
+        next_cursor = None
+        if more and offset + limit <= self.MAX_OFFSET:
+            next_cursor = encode_cursor([offset + limit])
+        return rows[:limit], next_cursor, more and next_cursor is None
@@ -0,0 +1,93 @@
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional
+from ..database import Base
+from ..models.sync_tombstones import SYNC_TABLES, SyncTombstone, sync_upper_bound
+from .pagination import decode_cursor, encode_cursor
+
+
+class SyncService:
+    """워터마크 이후 생성/변경/삭제된 행만 내려주는 변경 동기화
+
+    한 번의 동기화는 sync_version이 [since, until) 구간인 톰스톤 → 동기화 대상 테이블(부모 먼저) 순으로
+    (sync_version, PK) 키셋을 따라 limit 행씩 페이지로 내려준다. until은 첫 페이지에서 커밋이 끝난
+    순번의 상한으로 고정하므로, 아직 진행 중인 트랜잭션의 행은 얼마나 오래 걸렸든 커밋 후 다음 동기화에서
+    받는다. 마지막 페이지의 next 토큰이 다음 동기화의 워터마크가 된다. 클라이언트는 삭제를 먼저,
+    변경을 나중에 반영한다.
+    """
+
+    DEFAULT_LIMIT = 500
+    MAX_LIMIT = 5000
+
+    def __init__(self, db: Session):
+        self.db = db
+        # 0단계는 톰스톤, 이후는 동기화 대상 테이블
+        self.stages = [SyncTombstone.__table__] + [Base.metadata.tables[name] for name in SYNC_TABLES]
+
+    def changes(self, token: Optional[str] = None, limit: int = DEFAULT_LIMIT) -> Dict:
+        """토큰(생략 시 전체 동기화) 이후 변경분 한 페이지"""
+        limit = max(1, min(limit, self.MAX_LIMIT))
+        if token:
+            since, until, stage, last_version, last_id = decode_cursor(token, 5)
+            numbers = (since, until, stage, last_version, last_id)
+            if (not all(value is None or isinstance(value, int) for value in numbers)
+                    or stage is None or not 0 <= stage <= len(self.stages)
+                    or (last_version is None) != (last_id is None)):
+                raise ValueError("잘못된 동기화 토큰입니다")
+        else:
+            since = until = last_version = last_id = None
+            stage = 0
+        if until is None:
+            until = sync_upper_bound(self.db.connection())
+        if since is None and stage == 0:
+            stage = 1  # 전체 동기화에는 삭제 기록이 필요 없다
+
+        changes: Dict[str, Dict] = {}
+        deleted: Dict[str, List[int]] = {}
+        remaining = limit
+        while stage < len(self.stages) and remaining > 0:
+            rows = self._read(self.stages[stage], since, until, last_version, last_id, remaining + 1)
+            page, more = rows[:remaining], len(rows) > remaining
+            if page:
+                self._collect(self.stages[stage], page, changes, deleted)
+                remaining -= len(page)
+            if more:
+                last_version, last_id = page[-1][0], page[-1][1]
+                break
+            stage, last_version, last_id = stage + 1, None, None
+
+        has_more = stage < len(self.stages)
+        if has_more:
+            next_token = encode_cursor([since, until, stage, last_version, last_id])
+        else:
+            next_token = encode_cursor([until, None, 0, None, None])
+        return {
+            'reset': token is None,
+            'changes': changes,
+            'deleted': deleted,
+            'next': next_token,
+            'has_more': has_more
+        }
+
+    def _read(self, table, since, until, last_version, last_id, limit) -> List:
+        """구간 안의 행을 (sync_version, PK) 순으로 읽는다 (각 행은 (sync_version, PK, *컬럼))"""
+        version = table.c.sync_version
+        pk = list(table.primary_key.columns)[0]
+
+        query = select(version.label('_sync_version'), pk.label('_sync_pk'), *table.c).where(version < until)
+        if since is not None:
+            query = query.where(version >= since)
+        if last_version is not None:
+            query = query.where(tuple_(version, pk) > tuple_(last_version, last_id))
+        return self.db.execute(query.order_by(version, pk).limit(limit)).all()
+
+    def _collect(self, table, rows, changes: Dict, deleted: Dict) -> None:
+        if table is SyncTombstone.__table__:
+            for row in rows:
+                deleted.setdefault(row.entity, []).append(row.entity_id)
+            return
+        columns = [column.name for column in table.c]
+        changes[table.name] = {
+            'columns': columns,
+            'rows': [list(row[2:]) for row in rows]
+        }
@@ -0,0 +1,389 @@
+from sqlalchemy import Column, Date, Integer, MetaData, String, Table, case, func, insert, literal, select, true, tuple_, union_all
+from sqlalchemy.orm import Session, selectinload
+from typing import Dict, Iterable, List, Optional, Tuple
+from datetime import date, timedelta
+from decimal import Decimal
+from ..models import WorkLog, WorkItem, LaborEntry, EquipmentEntry, MaterialEntry
+from ..models.cost_rollups import CostCategory
+from ..models.work_log_search import reindex_work_logs
+from ..schemas.work_logs import EquipmentOverride, LaborOverride, WorkLogCreate, WorkLogResponse
+from . import money
+from .labor_stats_service import LaborRateStatsService
+from .pagination import decode_cursor, encode_cursor
+from .rollup_service import CostRollupService, entry_cost, equipment_cost, labor_cost, material_cost
+
+# 작업항목/투입 테이블의 PK 컬럼 (SQLite에서 PK를 미리 할당할 때 사용)
+_PK_COLUMNS = (
+    (WorkItem, WorkItem.id),
+    (LaborEntry, LaborEntry.id),
+    (EquipmentEntry, EquipmentEntry.entry_id),
+    (MaterialEntry, MaterialEntry.entry_id),
+)
+
+# 복사 중 원본 작업항목 → 새 작업항목 ID 대응표 (트랜잭션 안에서 만들고 지우는 임시 테이블)
+_clone_item_map = Table(
+    "clone_item_map",
+    MetaData(),
+    Column("old_id", Integer, nullable=False),
+    Column("work_log_id", Integer, nullable=False),
+    Column("new_id", Integer, primary_key=True, autoincrement=False),
+    prefixes=["TEMPORARY"],
+)
+
+# SQLite AUTOINCREMENT 테이블별 마지막 ID
+_sqlite_sequence = Table("sqlite_sequence", MetaData(), Column("name", String), Column("seq", Integer))
+
+
+def _last_sqlite_id(pk):
+    """SQLite에서 이미 쓴 가장 큰 ID (AUTOINCREMENT 테이블은 보관으로 지워진 번호까지 sqlite_sequence에 남는다)"""
+    return func.max(
+        func.coalesce(select(func.max(pk)).scalar_subquery(), 0),
+        func.coalesce(select(_sqlite_sequence.c.seq).where(_sqlite_sequence.c.name == pk.table.name).scalar_subquery(), 0),
+    )
+
+
+def _override(column, key_column, overrides: Dict, field: str):
+    """키(직종/장비코드)별 변경값을 CASE로 적용 (변경값이 없으면 원본 컬럼)"""
+    values = {
+        key: literal(getattr(override, field), column.type)
+        for key, override in overrides.items() if not override.exclude and getattr(override, field) is not None
+    }
+    return case(values, value=key_column, else_=column) if values else column
+
+
+def _by_id(column, id_column, values: Dict):
+    """원본 행 ID별로 계산한 값을 CASE로 적용 (없으면 원본 컬럼)"""
+    if not values:
+        return column
+    return case({row_id: literal(value, column.type) for row_id, value in values.items()}, value=id_column, else_=column)
+
+
+class WorkLogService:
+    """작업일지 저장/조회 서비스
+
+    작업일지 1건을 작업항목 수와 무관한 고정 횟수의 DB 왕복으로 저장한다.
+    - PostgreSQL: 관계로 묶은 트리를 한 번 flush하면 테이블마다 다중 행 INSERT ... RETURNING 1회
+    - SQLite: 다중 행 RETURNING 순서를 보장하지 못해 행마다 INSERT가 나가므로, 작업일지 INSERT로
+      쓰기 잠금을 잡은 뒤 하위 테이블 PK를 한 번에 미리 할당해 executemany로 넣는다
+    응답은 다시 조회하지 않고 입력값과 INSERT가 돌려준 id/생성일시로 만든다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def create(self, work_log: WorkLogCreate) -> WorkLogResponse:
+        """작업일지 생성 (투입 내역은 첫 번째 작업항목에 연결)"""
+        has_entries = work_log.labor_entries or work_log.equipment_entries or work_log.material_entries
+        if has_entries and not work_log.work_items:
+            raise ValueError("투입 내역을 연결할 작업항목이 없습니다")
+
+        db_work_log = WorkLog(**work_log.dict(exclude={'work_items', 'labor_entries', 'equipment_entries', 'material_entries'}))
+        db_work_log.work_items = []
+        items = [WorkItem(**item_data.dict()) for item_data in work_log.work_items]
+
+        entries = []
+        if items:
+            first_item = items[0]
+            first_item.labor_entries = [LaborEntry(**labor_data.dict()) for labor_data in work_log.labor_entries]
+            first_item.equipment_entries = [EquipmentEntry(**equipment_data.dict()) for equipment_data in work_log.equipment_entries]
+            first_item.material_entries = [MaterialEntry(**material_data.dict()) for material_data in work_log.material_entries]
+            entries = first_item.labor_entries + first_item.equipment_entries + first_item.material_entries
+            for entry in entries:
+                entry.total_cost = money.quantize(entry_cost(entry)[1])
+
+        self.db.add(db_work_log)
+        if self.db.get_bind().dialect.name == "sqlite" and items:
+            self.db.flush()
+            self._reserve_sqlite_ids(items + entries)
+        db_work_log.work_items.extend(items)
+        self.db.flush()
+
+        # 같은 트랜잭션에서 일자별 비용 집계와 직종별 단가 분포 반영
+        CostRollupService(self.db).add_entries(db_work_log.project_id, db_work_log.work_date, entries)
+        LaborRateStatsService(self.db).add_entries(
+            db_work_log.project_id, db_work_log.work_date, items[0].task_code if items else None, entries
+        )
+
+        response = WorkLogResponse(
+            work_id=db_work_log.id,
+            created_at=db_work_log.created_at,
+            updated_at=db_work_log.updated_at,
+            **work_log.dict()
+        )
+        self.db.commit()
+        return response
+
+    def _with_children(self, query):
+        """작업항목/투입 내역을 테이블별 IN 조회 1회씩 미리 로딩 (행마다 지연 로딩하지 않도록)"""
+        return query.options(
+            selectinload(WorkLog.work_items),
+            selectinload(WorkLog.labor_entries),
+            selectinload(WorkLog.equipment_entries),
+            selectinload(WorkLog.material_entries)
+        )
+
+    def get(self, work_id: int) -> Optional[WorkLog]:
+        """작업일지 1건 (하위 데이터 포함)"""
+        return self._with_children(self.db.query(WorkLog)).filter(WorkLog.id == work_id).first()
+
+    def list_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        project_id: Optional[int] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None
+    ) -> Tuple[List[WorkLog], Optional[str]]:
+        """작업일지 목록 한 페이지와 다음 페이지 커서 ((work_date, id) 내림차순 키셋)
+
+        페이지 깊이와 무관하게 인덱스 범위 조회 1회 + 하위 테이블별 IN 조회 4회로 끝난다.
+        """
+        query = self.db.query(WorkLog)
+        if project_id is not None:
+            query = query.filter(WorkLog.project_id == project_id)
+        if date_from is not None:
+            query = query.filter(WorkLog.work_date >= date_from)
+        if date_to is not None:
+            query = query.filter(WorkLog.work_date <= date_to)
+        if cursor:
+            last_date, last_id = decode_cursor(cursor, 2)
+            try:
+                last_date, last_id = date.fromisoformat(last_date), int(last_id)
+            except (TypeError, ValueError):
+                raise ValueError("잘못된 커서입니다")
+            query = query.filter(tuple_(WorkLog.work_date, WorkLog.id) < tuple_(last_date, last_id))
+
+        logs = self._with_children(query).order_by(
+            WorkLog.work_date.desc(), WorkLog.id.desc()
+        ).limit(limit + 1).all()
+
+        next_cursor = None
+        if len(logs) > limit:
+            logs = logs[:limit]
+            next_cursor = encode_cursor([logs[-1].work_date.isoformat(), logs[-1].id])
+        return logs, next_cursor
+
+    # ---- 전날 복사 ----
+
+    MAX_CLONE_DAYS = 31
+
+    @classmethod
+    def clone_dates(cls, work_date: Optional[date] = None, date_from: Optional[date] = None,
+                    date_to: Optional[date] = None, exclude_weekdays: Iterable[int] = ()) -> List[date]:
+        """복사할 작업일 목록 (하루 또는 기간, 기간은 제외 요일을 건너뛴다)"""
+        if work_date is not None:
+            if date_from is not None or date_to is not None:
+                raise ValueError("work_date와 기간(date_from/date_to)은 함께 지정할 수 없습니다")
+            return [work_date]
+        if date_from is None or date_to is None:
+            raise ValueError("work_date 또는 date_from/date_to를 지정하세요")
+        if date_from > date_to:
+            raise ValueError("시작일이 종료일보다 늦습니다")
+        excluded = set(exclude_weekdays)
+        days = (date_to - date_from).days + 1
+        dates = [d for d in (date_from + timedelta(days=i) for i in range(days)) if d.weekday() not in excluded]
+        if not dates:
+            raise ValueError("복사할 날짜가 없습니다")
+        if len(dates) > cls.MAX_CLONE_DAYS:
+            raise ValueError(f"한 번에 {cls.MAX_CLONE_DAYS}일까지 복사할 수 있습니다")
+        return dates
+
+    def clone(self, work_id: int, dates: List[date],
+              labor_overrides: Optional[Dict[str, LaborOverride]] = None,
+              equipment_overrides: Optional[Dict[str, EquipmentOverride]] = None) -> Optional[Dict]:
+        """작업일지를 작업항목/투입 내역째 여러 날짜로 복사 (원본이 없으면 None)
+
+        날짜 수·작업항목 수와 무관하게 테이블별 INSERT ... SELECT 1회씩으로 복사한다.
+        새 작업항목 ID는 미리 할당해 (원본 작업항목, 새 작업일지, 새 ID) 임시 대응표에 넣고,
+        작업항목과 투입 내역은 이 대응표와 조인해 넣는다 (INSERT 순서에 따른 ID 부여에 기대지 않는다).
+        직종/장비코드별 변경값은 CASE로 적용하고, 금액은 Python에서 같은 규칙으로 계산해
+        일자별 비용 집계에도 반영한다.
+        """
+        labor_overrides = labor_overrides or {}
+        equipment_overrides = equipment_overrides or {}
+        source = self.db.execute(
+            select(WorkLog.project_id).where(WorkLog.id == work_id)
+        ).first()
+        if source is None:
+            return None
+
+        sources, per_day = self._clone_entries(work_id, labor_overrides, equipment_overrides)
+
+        # 1) 작업일지: 원본 1행 × 날짜
+        day_selects = [select(literal(day, Date()).label("work_date")) for day in sorted(set(dates))]
+        days = (union_all(*day_selects) if len(day_selects) > 1 else day_selects[0]).subquery("days")
+        log_columns = ["project_id", "area", "weather", "process_status", "notes"]
+        new_logs = self.db.execute(
+            insert(WorkLog).from_select(
+                log_columns + ["work_date"],
+                select(*(getattr(WorkLog, column) for column in log_columns), days.c.work_date)
+                .select_from(WorkLog).join(days, true()).where(WorkLog.id == work_id)
+            ).returning(WorkLog.id, WorkLog.work_date)
+        ).all()
+        new_ids = sorted(row.id for row in new_logs)
+
+        # 2) 작업항목: 원본 작업항목 × 새 작업일지, 미리 할당한 ID로 대응표를 만들어 넣는다
+        old_item_ids = self.db.execute(
+            select(WorkItem.id).where(WorkItem.work_log_id == work_id).order_by(WorkItem.id)
+        ).scalars().all()
+        items_count = len(old_item_ids) * len(new_ids)
+        entries_count = 0
+        if items_count:
+            item_ids = iter(self._allocate_ids(WorkItem.id, items_count))
+            connection = self.db.connection()
+            _clone_item_map.create(connection)  # 실패하면 롤백과 함께 사라진다
+            self.db.execute(insert(_clone_item_map), [
+                {"old_id": old_id, "work_log_id": new_log_id, "new_id": next(item_ids)}
+                for new_log_id in new_ids for old_id in old_item_ids
+            ])
+            item_columns = ["task_code", "task_name", "specification", "quantity", "unit", "progress_rate", "notes"]
+            self.db.execute(
+                insert(WorkItem).from_select(
+                    ["id", "work_log_id"] + item_columns,
+                    select(_clone_item_map.c.new_id, _clone_item_map.c.work_log_id,
+                           *(getattr(WorkItem, column) for column in item_columns))
+                    .select_from(WorkItem).join(_clone_item_map, WorkItem.id == _clone_item_map.c.old_id)
+                )
+            )
+
+            # 3) 투입 내역: 원본 작업항목 → 새 작업항목 대응표로 연결
+            for model, columns, where in sources:
+                names = ["work_item_id"] + list(columns)
+                entries_count += self.db.execute(
+                    insert(model).from_select(
+                        names,
+                        select(_clone_item_map.c.new_id, *columns.values())
+                        .select_from(model).join(_clone_item_map, model.work_item_id == _clone_item_map.c.old_id)
+                        .where(*where)
+                    )
+                ).rowcount
+            _clone_item_map.drop(connection)
+
+        # 같은 트랜잭션에서 일자별 비용 집계, 직종별 단가 분포와 검색 색인 반영
+        CostRollupService(self.db).add_deltas({
+            (source.project_id, row.work_date, category): amount_count
+            for row in new_logs for category, amount_count in per_day.items()
+        })
+        LaborRateStatsService(self.db).add_work_logs(new_ids)
+        reindex_work_logs(self.db, new_ids)
+        self.db.commit()
+
+        return {
+            'source_work_id': work_id,
+            'work_logs': sorted(({'work_id': row.id, 'work_date': row.work_date} for row in new_logs),
+                                key=lambda log: log['work_date']),
+            'work_items_count': items_count,
+            'entries_count': entries_count
+        }
+
+    def _clone_entries(self, work_id: int, labor_overrides: Dict[str, LaborOverride],
+                       equipment_overrides: Dict[str, EquipmentOverride]):
+        """원본 투입 내역을 읽어 복사할 테이블별 (모델, 컬럼식, 조건)과 하루치 비용구분별 (금액, 건수) 계산"""
+        def source_rows(model):
+            return self.db.execute(
+                select(model).join(WorkItem, model.work_item_id == WorkItem.id).where(WorkItem.work_log_id == work_id)
+            ).scalars().all()
+
+        per_day: Dict[CostCategory, Tuple[Decimal, int]] = {}
+
+        def add(category, cost):
+            amount, count = per_day.get(category, (money.ZERO, 0))
+            per_day[category] = (amount + cost, count + 1)
+
+        # 노무: 직종별 인원/시간/단가 변경
+        labor_totals = {}
+        for entry in source_rows(LaborEntry):
+            override = labor_overrides.get(entry.trade)
+            if override is not None and override.exclude:
+                continue
+            persons, hours, unit_rate = entry.persons, entry.hours, entry.unit_rate
+            if override is not None:
+                persons = override.persons if override.persons is not None else persons
+                hours = override.hours if override.hours is not None else hours
+                unit_rate = override.unit_rate if override.unit_rate is not None else unit_rate
+            cost = labor_cost(persons, hours, unit_rate)
+            if override is not None:
+                labor_totals[entry.id] = money.quantize(cost)
+            add(CostCategory.LABOR, cost)
+
+        # 장비: 장비코드별 대수/시간/시간단가 변경
+        equipment_totals = {}
+        for entry in source_rows(EquipmentEntry):
+            override = equipment_overrides.get(entry.equipment_code)
+            if override is not None and override.exclude:
+                continue
+            units, hours, hourly_rate = entry.units, entry.hours, entry.hourly_rate
+            if override is not None:
+                units = override.units if override.units is not None else units
+                hours = override.hours if override.hours is not None else hours
+                hourly_rate = override.hourly_rate if override.hourly_rate is not None else hourly_rate
+            cost = equipment_cost(units, hours, entry.min_hours, hourly_rate, entry.mobilization_fee)
+            if override is not None:
+                equipment_totals[entry.entry_id] = money.quantize(cost)
+            add(CostCategory.EQUIPMENT, cost)
+
+        for entry in source_rows(MaterialEntry):
+            add(CostCategory.MATERIAL, material_cost(entry.quantity, entry.unit_price))
+
+        excluded_trades = [trade for trade, override in labor_overrides.items() if override.exclude]
+        excluded_codes = [code for code, override in equipment_overrides.items() if override.exclude]
+        labor_columns = {
+            'trade': LaborEntry.trade,
+            'persons': _override(LaborEntry.persons, LaborEntry.trade, labor_overrides, 'persons'),
+            'hours': _override(LaborEntry.hours, LaborEntry.trade, labor_overrides, 'hours'),
+            'rate_type': LaborEntry.rate_type,
+            'unit_rate': _override(LaborEntry.unit_rate, LaborEntry.trade, labor_overrides, 'unit_rate'),
+            'total_cost': _by_id(LaborEntry.total_cost, LaborEntry.id, labor_totals),
+        }
+        equipment_columns = {
+            'equipment_code': EquipmentEntry.equipment_code,
+            'equipment_name': EquipmentEntry.equipment_name,
+            'specification': EquipmentEntry.specification,
+            'units': _override(EquipmentEntry.units, EquipmentEntry.equipment_code, equipment_overrides, 'units'),
+            'hours': _override(EquipmentEntry.hours, EquipmentEntry.equipment_code, equipment_overrides, 'hours'),
+            'hourly_rate': _override(EquipmentEntry.hourly_rate, EquipmentEntry.equipment_code, equipment_overrides,
+                                     'hourly_rate'),
+            'min_hours': EquipmentEntry.min_hours,
+            'mobilization_fee': EquipmentEntry.mobilization_fee,
+            'total_cost': _by_id(EquipmentEntry.total_cost, EquipmentEntry.entry_id, equipment_totals),
+        }
+        material_columns = {
+            name: getattr(MaterialEntry, name)
+            for name in ('material_code', 'material_name', 'specification', 'quantity', 'unit', 'unit_price',
+                         'total_cost', 'stock_type', 'supplier')
+        }
+        sources = []
+        if per_day.get(CostCategory.LABOR):
+            sources.append((LaborEntry, labor_columns, [LaborEntry.trade.not_in(excluded_trades)]))
+        if per_day.get(CostCategory.EQUIPMENT):
+            sources.append((EquipmentEntry, equipment_columns, [EquipmentEntry.equipment_code.not_in(excluded_codes)]))
+        if per_day.get(CostCategory.MATERIAL):
+            sources.append((MaterialEntry, material_columns, []))
+        return sources, per_day
+
+    def _allocate_ids(self, pk, count: int) -> List[int]:
+        """PK 컬럼의 새 번호 count개 (PostgreSQL은 시퀀스에서, SQLite는 쓰기 잠금을 잡은 트랜잭션에서 최대값 다음부터)"""
+        if self.db.get_bind().dialect.name == "sqlite":
+            last = self.db.execute(select(_last_sqlite_id(pk))).scalar()
+            return list(range(last + 1, last + 1 + count))
+        sequence = func.pg_get_serial_sequence(pk.table.name, pk.name)
+        return self.db.execute(
+            select(func.nextval(sequence)).select_from(func.generate_series(1, count))
+        ).scalars().all()
+
+    def _reserve_sqlite_ids(self, objects: List) -> None:
+        """테이블별 현재 최대 PK 다음 번호를 객체에 할당 (쓰기 잠금을 잡은 트랜잭션 안에서만 호출)
+
+        SQLite는 쓰기 트랜잭션이 하나뿐이므로 잠금을 잡은 뒤 읽은 마지막 ID(테이블 최대값과
+        sqlite_sequence 중 큰 값) 이후 번호는 다른 트랜잭션이나 보관된 행과 겹치지 않는다.
+        """
+        maxima = self.db.execute(select(*(
+            _last_sqlite_id(pk) for _, pk in _PK_COLUMNS
+        ))).one()
+        next_ids = {model: last + 1 for (model, _), last in zip(_PK_COLUMNS, maxima)}
+        pk_names = {model: pk.key for model, pk in _PK_COLUMNS}
+
+        for obj in objects:
+            model = type(obj)
+            setattr(obj, pk_names[model], next_ids[model])
+            next_ids[model] += 1
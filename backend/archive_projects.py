@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+정산이 끝난 프로젝트의 작업 상세를 보관 DB(ARCHIVE_DATABASE_URL)로 옮기거나 되돌리는 스크립트
+
+    python archive_projects.py --status            # 보관된 프로젝트 목록
+    python archive_projects.py --archive 3 7       # 프로젝트 3, 7 보관
+    python archive_projects.py --restore 3         # 프로젝트 3 복원
+
+중간에 끊겨도 같은 명령을 다시 실행하면 남은 부분부터 이어 간다.
+"""
+import argparse
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.database import ARCHIVE_DATABASE_URL, SessionLocal
+from app.models import ProjectArchive
+from app.services.archive_service import ProjectArchiveService
+
+def print_status(db):
+    records = db.query(ProjectArchive).order_by(ProjectArchive.project_id).all()
+    if not records:
+        print("   보관된 프로젝트가 없습니다")
+    for record in records:
+        print(f"   📦 프로젝트 {record.project_id}: {record.status.value} "
+              f"(작업일지 {record.work_logs_count}, 작업항목 {record.work_items_count}, "
+              f"투입 {record.entries_count}, {record.archived_at})")
+
+def main():
+    parser = argparse.ArgumentParser(description="프로젝트 작업 상세 보관/복원")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--status", action="store_true", help="보관 현황만 출력")
+    group.add_argument("--archive", type=int, nargs="+", metavar="PROJECT_ID", help="보관할 프로젝트 ID")
+    group.add_argument("--restore", type=int, nargs="+", metavar="PROJECT_ID", help="복원할 프로젝트 ID")
+    parser.add_argument("--batch-size", type=int, default=ProjectArchiveService.DEFAULT_BATCH_SIZE,
+                        help="한 번에 옮길 작업일지 수")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.status:
+            print_status(db)
+            return True
+
+        service = ProjectArchiveService(db, batch_size=args.batch_size)
+        print(f"🗄️ 보관 DB: {ARCHIVE_DATABASE_URL}")
+        ok = True
+        for project_id in args.archive or args.restore:
+            progress = lambda count: print(f"   → 프로젝트 {project_id}: 작업일지 {count}건")
+            try:
+                if args.archive:
+                    record = service.archive_project(project_id, progress=progress)
+                    print(f"✅ 프로젝트 {project_id} 보관: 작업일지 {record.work_logs_count}건, "
+                          f"작업항목 {record.work_items_count}건, 투입 {record.entries_count}건")
+                else:
+                    restored = service.restore_project(project_id, progress=progress)
+                    print(f"✅ 프로젝트 {project_id} 복원: 작업일지 {restored}건")
+            except ValueError as e:
+                db.rollback()
+                print(f"❌ 프로젝트 {project_id}: {e}")
+                ok = False
+        print_status(db)
+        return ok
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    if not main():
+        sys.exit(1)
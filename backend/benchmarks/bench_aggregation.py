@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+비용 집계 벤치마크: ORM 로딩 방식(기존) vs SQL 그룹 집계(InvoiceAggregationService)
+
+    python -m benchmarks.bench_aggregation --projects 3 --days 90
+
+두 방식의 노무비/장비비/자재비 합계가 일치하는지 확인하고 소요 시간을 출력한다.
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.orm import sessionmaker
+
+from app.models import WorkLog, WorkItem, LaborEntry, EquipmentEntry, MaterialEntry
+from app.services.invoice_service import InvoiceAggregationService
+from benchmarks.seed_data import make_engine, seed
+
+
+def legacy_aggregate(db, project_id: int, period_from: date, period_to: date) -> dict:
+    """기존 구현: 모든 행을 ORM 객체로 읽어 Python에서 합산"""
+    work_logs = db.query(WorkLog).filter(
+        WorkLog.project_id == project_id,
+        WorkLog.work_date >= period_from,
+        WorkLog.work_date <= period_to
+    ).all()
+    work_items = db.query(WorkItem).filter(
+        WorkItem.work_log_id.in_([log.id for log in work_logs])
+    ).all()
+    item_ids = [item.id for item in work_items]
+
+    labor = Decimal('0')
+    for entry in db.query(LaborEntry).filter(LaborEntry.work_item_id.in_(item_ids)).all():
+        labor += Decimal(str(entry.persons)) * Decimal(str(entry.hours)) * Decimal(str(entry.unit_rate))
+
+    equipment = Decimal('0')
+    for entry in db.query(EquipmentEntry).filter(EquipmentEntry.work_item_id.in_(item_ids)).all():
+        actual_hours = max(Decimal(str(entry.hours)), Decimal(str(entry.min_hours)))
+        equipment += (entry.units * actual_hours * Decimal(str(entry.hourly_rate))) + Decimal(str(entry.mobilization_fee))
+
+    material = Decimal('0')
+    for entry in db.query(MaterialEntry).filter(MaterialEntry.work_item_id.in_(item_ids)).all():
+        material += Decimal(str(entry.quantity)) * Decimal(str(entry.unit_price))
+
+    return {
+        'labor_cost': labor,
+        'equipment_cost': equipment,
+        'material_cost': material,
+        'total_supply_amount': labor + equipment + material,
+        'work_logs_count': len(work_logs),
+        'work_items_count': len(work_items)
+    }
+
+
+def timed(fn, repeat: int):
+    best = None
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=None, help="기본값: 임시 SQLite 파일")
+    parser.add_argument("--projects", type=int, default=3)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--items-per-log", type=int, default=5)
+    parser.add_argument("--entries-per-item", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    engine = make_engine(args.database_url)
+    print("🌱 시드 데이터 생성 중...")
+    counts = seed(engine, projects=args.projects, days=args.days,
+                  items_per_log=args.items_per_log, entries_per_item=args.entries_per_item)
+    print(f"   {counts}")
+
+    db = sessionmaker(bind=engine)()
+    period_from = date(2024, 1, 1)
+    period_to = period_from + timedelta(days=args.days - 1)
+    service = InvoiceAggregationService(db)
+
+    mismatches = 0
+    for project_id in range(1, args.projects + 1):
+        legacy, legacy_time = timed(lambda: legacy_aggregate(db, project_id, period_from, period_to), args.repeat)
+        current, sql_time = timed(lambda: service.aggregate_work_costs(project_id, period_from, period_to), args.repeat)
+
+        for key in legacy:
+            if Decimal(legacy[key]).quantize(Decimal('0.01')) != Decimal(current[key]).quantize(Decimal('0.01')):
+                mismatches += 1
+                print(f"❌ project={project_id} {key}: legacy={legacy[key]} sql={current[key]}")
+
+        print(f"📊 project={project_id} total={current['total_supply_amount']:,.2f} "
+              f"legacy={legacy_time * 1000:.1f}ms sql={sql_time * 1000:.1f}ms "
+              f"(x{legacy_time / sql_time:.1f})")
+
+    db.close()
+    if mismatches:
+        print(f"❌ 합계 불일치 {mismatches}건")
+        sys.exit(1)
+    print("✅ 모든 합계 일치")
+
+
+if __name__ == "__main__":
+    main()
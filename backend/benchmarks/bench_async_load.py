@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+동기/비동기 DB 엔진 모드 부하 테스트
+
+    python -m benchmarks.bench_async_load --concurrency 1 2 4 8 16 32 64 128 256 --p95-budget-ms 500
+    python -m benchmarks.bench_async_load --database-url postgresql://... --skip-seed
+
+같은 DB를 대상으로 DB_ASYNC=false / DB_ASYNC=true 서버(uvicorn)를 차례로 띄우고,
+동시 요청 수를 늘려 가며 집계/추천/작업일지 조회 API의 처리량과 p95 지연시간을 잰다.
+p95가 예산을 넘거나 오류가 난 첫 단계 직전까지를 모드별 동시성 한계로 출력한다.
+두 모드 모두 첫 단계부터 예산을 넘어 한계를 찾지 못하면 종료코드 1 (단계를 더 낮추거나 예산을 늘린다).
+SQLite는 쓰기/연결이 직렬화되므로 실제 비교는 --database-url로 PostgreSQL(Supabase)을 지정해 실행한다.
+"""
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from fastapi import FastAPI
+
+from benchmarks.seed_data import make_engine, seed
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def create_app() -> FastAPI:
+    """부하 테스트 대상 라우터만 올린 앱 (uvicorn --factory 용)"""
+    from app.routers import aggregation, recommendations, work_logs
+
+    app = FastAPI()
+    app.include_router(work_logs.router, prefix="/api/work-logs")
+    app.include_router(aggregation.router, prefix="/api/aggregation")
+    app.include_router(recommendations.router, prefix="/api/recommendations")
+    return app
+
+
+def request_paths(projects: int) -> list:
+    paths = []
+    for project_id in range(1, projects + 1):
+        period = "period_from=2024-01-01&period_to=2024-02-29"
+        paths += [
+            f"/api/aggregation/projects/{project_id}/cost-summary?{period}",
+            f"/api/aggregation/projects/{project_id}/cost-breakdown?{period}&dimension=trade",
+            f"/api/work-logs/?project_id={project_id}&limit=20",
+            "/api/recommendations/labor?trade=목공",
+        ]
+    return paths
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(database_url: str, async_mode: bool, port: int) -> subprocess.Popen:
+    env = dict(os.environ, DATABASE_URL=database_url, DB_ASYNC="true" if async_mode else "false")
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "benchmarks.bench_async_load:create_app", "--factory",
+         "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR, env=env
+    )
+
+
+async def wait_ready(base_url: str, timeout: float = 20.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            try:
+                await client.get("/docs")
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.2)
+    raise RuntimeError("서버가 시작되지 않았습니다")
+
+
+async def run_level(base_url: str, paths: list, concurrency: int, requests: int, timeout: float) -> dict:
+    """동시 요청 concurrency개를 유지하며 requests건 호출"""
+    latencies = []
+    errors = 0
+    queue = iter(range(requests))
+
+    async def worker(client):
+        nonlocal errors
+        for i in queue:
+            started = time.perf_counter()
+            try:
+                response = await client.get(paths[i % len(paths)])
+                if response.status_code != 200:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=timeout) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50": latencies[len(latencies) // 2],
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+        "errors": errors,
+    }
+
+
+async def measure_mode(database_url: str, async_mode: bool, paths: list, args) -> int:
+    """모드 하나를 측정하고 동시성 한계를 반환"""
+    port = free_port()
+    server = start_server(database_url, async_mode, port)
+    base_url = f"http://127.0.0.1:{port}"
+    ceiling = 0
+    try:
+        await wait_ready(base_url)
+        await run_level(base_url, paths, 4, len(paths), args.timeout)  # 워밍업
+        label = "비동기" if async_mode else "동기"
+        for concurrency in args.concurrency:
+            result = await run_level(base_url, paths, concurrency, max(args.requests, concurrency * 4), args.timeout)
+            ok = result["errors"] == 0 and result["p95"] <= args.p95_budget_ms
+            print(f"📊 {label} 동시 {concurrency:>4}: {result['rps']:>7,.0f}건/초, p50 {result['p50']:>7.1f}ms, "
+                  f"p95 {result['p95']:>7.1f}ms, 오류 {result['errors']}{'' if ok else '  ← 한계 초과'}")
+            if not ok:
+                break
+            ceiling = concurrency
+    finally:
+        server.terminate()
+        server.wait()
+    return ceiling
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=None, help="기본값: 임시 SQLite 파일")
+    parser.add_argument("--skip-seed", action="store_true", help="이미 데이터가 있는 DB를 그대로 사용")
+    parser.add_argument("--projects", type=int, default=5)
+    parser.add_argument("--days", type=int, default=60)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32, 64, 128, 256])
+    parser.add_argument("--requests", type=int, default=400, help="단계별 최소 요청 수")
+    parser.add_argument("--p95-budget-ms", type=float, default=500.0)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args()
+
+    database_url = args.database_url
+    if not args.skip_seed:
+        engine = make_engine(database_url)
+        database_url = database_url or engine.url.render_as_string(hide_password=False)
+        counts = seed(engine, projects=args.projects, days=args.days)
+        engine.dispose()
+        print(f"시드 데이터: {counts}")
+    elif database_url is None:
+        parser.error("--skip-seed에는 --database-url이 필요합니다")
+
+    paths = request_paths(args.projects)
+    ceilings = {}
+    for async_mode in (False, True):
+        ceilings[async_mode] = asyncio.run(measure_mode(database_url, async_mode, paths, args))
+
+    summary = (f"동시성 한계 (p95 ≤ {args.p95_budget_ms:.0f}ms, 오류 0): "
+               f"동기 {ceilings[False]}, 비동기 {ceilings[True]}")
+    if not any(ceilings.values()):
+        print(f"❌ {summary} — 두 모드 모두 첫 단계({args.concurrency[0]})부터 예산 초과")
+        sys.exit(1)
+    print(f"✅ {summary}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+일괄 원가 계산 벤치마크: 단건 계산 반복 vs BatchCostCalculator
+
+    python -m benchmarks.bench_batch_calc --rows 10000
+
+단건 API(/calculate/*)와 같은 방식(Decimal(str(x)) → CostCalculationService → float)으로
+계산한 결과와 일괄 계산 결과가 행마다 같은지 확인하고, 초당 처리 행 수를 출력한다.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from decimal import Decimal
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.batch_calculation_service import BatchCostCalculator
+from app.services.calculation_service import CostCalculationService
+
+
+def rand_float(rng, max_int, scale):
+    """소수 scale자리 값 (끝자리 5 경계값과 자릿수 초과 값을 섞음)"""
+    units = rng.randint(0, max_int * 10 ** scale)
+    if scale and rng.random() < 0.3:
+        units = units - units % 10 + 5
+    value = units / 10 ** scale
+    if rng.random() < 0.01:
+        value += 1e-7  # 정해진 자릿수를 넘는 입력 → 단건 계산 경로
+    return value
+
+
+def single_labor(p, h, r):
+    return float(CostCalculationService.calculate_labor_cost(p, Decimal(str(h)), Decimal(str(r))))
+
+
+def single_equipment(n, h, r, m, f):
+    result = CostCalculationService.calculate_equipment_cost(n, Decimal(str(h)), Decimal(str(r)),
+                                                             Decimal(str(m)), Decimal(str(f)))
+    return {
+        'base_cost': float(result['base_cost']),
+        'mobilization_fee': float(result['mobilization_fee']),
+        'total_cost': float(result['total_cost']),
+        'applied_hours': float(result['applied_hours']),
+        'min_hours_applied': result['min_hours_applied']
+    }
+
+
+def single_material(q, p, w):
+    result = CostCalculationService.calculate_material_cost(Decimal(str(q)), Decimal(str(p)), Decimal(str(w)))
+    return {
+        'base_cost': float(result['base_cost']),
+        'waste_amount': float(result['waste_amount']),
+        'total_cost': float(result['total_cost']),
+        'waste_rate_percent': float(result['waste_rate'])
+    }
+
+
+def single_vat(s, r, mode):
+    result = CostCalculationService.calculate_vat(Decimal(str(s)), Decimal(str(r)), mode)
+    return {
+        'supply_amount': float(result['supply_amount']),
+        'vat_amount': float(result['vat_amount']),
+        'total_amount': float(result['total_amount']),
+        'vat_rate': float(result['vat_rate']),
+        'tax_mode': result['tax_mode']
+    }
+
+
+def run(name, rows, single, batch, columns):
+    started = time.perf_counter()
+    expected = [single(*row) for row in rows]
+    single_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    actual = batch(*columns)
+    batch_time = time.perf_counter() - started
+
+    mismatches = [i for i, (a, b) in enumerate(zip(expected, actual)) if a != b]
+    for i in mismatches[:5]:
+        print(f"❌ {name} row {i} {rows[i]}: single={expected[i]} batch={actual[i]}")
+
+    print(f"📊 {name:<10} single={len(rows) / single_time:>10,.0f} rows/s "
+          f"batch={len(rows) / batch_time:>12,.0f} rows/s (x{single_time / batch_time:.1f})")
+    return len(mismatches)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    n = args.rows
+
+    labor = [(rng.randint(1, 50), rand_float(rng, 24, 1), rand_float(rng, 500000, 2)) for _ in range(n)]
+    equipment = [(rng.randint(1, 5), rand_float(rng, 12, 1), rand_float(rng, 300000, 2),
+                  rng.choice([4.0, 8.0, 0.0]), rand_float(rng, 500000, 0)) for _ in range(n)]
+    material = [(rand_float(rng, 10000, 3), rand_float(rng, 100000, 2), rand_float(rng, 1, 3)) for _ in range(n)]
+    vat = [(rand_float(rng, 10 ** 9, 2), rng.choice([10.0, 0.0, 5.5]), rng.choice(["taxable", "exempt", "zero"]))
+           for _ in range(n)]
+
+    def columns(rows):
+        return [list(col) for col in zip(*rows)]
+
+    failures = 0
+    failures += run("labor", labor, single_labor, BatchCostCalculator.labor_costs, columns(labor))
+    failures += run("equipment", equipment, single_equipment, BatchCostCalculator.equipment_costs, columns(equipment))
+    failures += run("material", material, single_material, BatchCostCalculator.material_costs, columns(material))
+    failures += run("vat", vat, single_vat, BatchCostCalculator.vat, columns(vat))
+
+    if failures:
+        print(f"❌ 불일치 {failures}건")
+        sys.exit(1)
+    print(f"✅ {n}행 × 4종 결과가 단건 계산과 일치")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+작업일지 대량 가져오기 벤치마크: 건별 ORM 저장(create_work_log 방식) vs 청크 일괄 적재
+
+    python -m benchmarks.bench_import --logs 20000 --baseline-logs 1000
+
+JSONL 파일을 임시로 만들어 스트리밍으로 가져오고, 초당 처리 건수와
+(파일 크기와 무관해야 하는) 최대 추적 메모리를 출력한다. 가져온 뒤
+일자별 집계(daily_cost_rollups)가 원천 데이터와 다르면 종료코드 1.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Client, Project, WorkLog, WorkItem, LaborEntry, EquipmentEntry, MaterialEntry
+from app.services.import_service import ImportFormat, WorkLogImportService
+from app.services.rollup_service import CostRollupService
+from app.schemas.work_logs import WorkLogImport
+from benchmarks.seed_data import EQUIPMENT, MATERIALS, TASKS, TRADES, make_engine
+
+
+def make_record(rng: random.Random, project_id: int, day: int) -> dict:
+    code, name = rng.choice(TASKS)
+    eq_code, eq_name = rng.choice(EQUIPMENT)
+    mat_code, mat_name, unit = rng.choice(MATERIALS)
+    return {
+        "project_id": project_id,
+        "work_date": str(date(2024, 1, 1) + timedelta(days=day % 365)),
+        "area": f"{rng.randint(1, 5)}동",
+        "weather": "맑음",
+        "work_items": [{
+            "task_code": code, "task_name": name, "quantity": rng.randint(1, 500), "unit": "m2",
+            "labor_entries": [{"trade": rng.choice(TRADES), "persons": rng.randint(1, 10), "hours": 8.0,
+                               "rate_type": "daily", "unit_rate": rng.randint(150, 300) * 1000}],
+            "equipment_entries": [{"equipment_code": eq_code, "equipment_name": eq_name, "units": 1,
+                                   "hours": rng.choice([2.0, 6.0]), "hourly_rate": rng.randint(50, 200) * 1000}],
+            "material_entries": [{"material_code": mat_code, "material_name": mat_name,
+                                  "quantity": rng.randint(1, 100000) / 1000, "unit": unit,
+                                  "unit_price": rng.randint(1000, 90000), "supplier": "공급처1"}],
+        }],
+    }
+
+
+def write_jsonl(path: str, count: int, project_id: int, seed: int = 42) -> None:
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(count):
+            f.write(json.dumps(make_record(rng, project_id, i), ensure_ascii=False))
+            f.write("\n")
+
+
+def import_one_by_one(db, path: str) -> int:
+    """기존 방식: 작업일지마다 ORM 객체 생성 + flush + 집계 반영 + commit"""
+    count = 0
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            record = WorkLogImport(**json.loads(line))
+            log = WorkLog(project_id=record.project_id, work_date=record.work_date,
+                          area=record.area, weather=record.weather)
+            db.add(log)
+            db.flush()
+            entries = []
+            for item_data in record.work_items:
+                item = WorkItem(work_log_id=log.id, task_code=item_data.task_code, task_name=item_data.task_name,
+                                quantity=item_data.quantity, unit=item_data.unit,
+                                progress_rate=item_data.progress_rate)
+                db.add(item)
+                db.flush()
+                for labor in item_data.labor_entries:
+                    entries.append(LaborEntry(work_item_id=item.id, total_cost=0, **labor.dict()))
+                for equipment in item_data.equipment_entries:
+                    entries.append(EquipmentEntry(work_item_id=item.id, total_cost=0, **equipment.dict()))
+                for material in item_data.material_entries:
+                    entries.append(MaterialEntry(work_item_id=item.id, total_cost=0, **material.dict()))
+            db.add_all(entries)
+            CostRollupService(db).add_entries(log.project_id, log.work_date, entries)
+            db.commit()
+            count += 1
+    return count
+
+
+def run_import(db, path: str, chunk_size: int):
+    tracemalloc.start()
+    with open(path, encoding="utf-8", newline="") as f:
+        summary = WorkLogImportService(db, chunk_size=chunk_size).import_stream(f, ImportFormat.JSONL)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return summary, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=None, help="기본값: 임시 SQLite 파일")
+    parser.add_argument("--logs", type=int, default=20000)
+    parser.add_argument("--baseline-logs", type=int, default=1000)
+    parser.add_argument("--chunk-size", type=int, default=WorkLogImportService.DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    engine = make_engine(args.database_url)
+    db = sessionmaker(bind=engine)()
+    client = Client(company_name="벤치마크 발주처")
+    db.add(client)
+    db.flush()
+    project = Project(client_id=client.id, project_name="가져오기 벤치마크 현장")
+    db.add(project)
+    db.commit()
+
+    workdir = tempfile.mkdtemp(prefix="cms_import_")
+    small = os.path.join(workdir, "small.jsonl")
+    large = os.path.join(workdir, "large.jsonl")
+    write_jsonl(small, args.baseline_logs, project.id, seed=1)
+    write_jsonl(large, args.logs, project.id, seed=2)
+
+    started = time.perf_counter()
+    baseline = import_one_by_one(db, small)
+    baseline_rate = baseline / (time.perf_counter() - started)
+    print(f"📊 건별 저장: {baseline:,}건, {baseline_rate:,.0f}건/초")
+
+    small_summary, small_peak = run_import(db, small, args.chunk_size)
+    large_summary, large_peak = run_import(db, large, args.chunk_size)
+    print(f"📊 일괄 적재 {small_summary['records_read']:,}건: {small_summary['records_per_second']:,}건/초, "
+          f"최대 메모리 {small_peak / 1024 / 1024:.1f}MB")
+    print(f"📊 일괄 적재 {large_summary['records_read']:,}건: {large_summary['records_per_second']:,}건/초, "
+          f"최대 메모리 {large_peak / 1024 / 1024:.1f}MB")
+    print(f"   건별 대비 {large_summary['records_per_second'] / baseline_rate:.1f}배")
+
+    mismatches = CostRollupService(db).verify()
+    db.close()
+
+    if large_summary['failed'] or small_summary['failed']:
+        print(f"❌ 가져오기 실패: {large_summary['errors'][:5] or small_summary['errors'][:5]}")
+        sys.exit(1)
+    if mismatches:
+        print(f"❌ 집계 불일치 {len(mismatches)}건")
+        sys.exit(1)
+    print("✅ 집계 일치")
+
+
+if __name__ == "__main__":
+    main()
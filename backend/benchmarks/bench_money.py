@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+금액 계산 검증/벤치마크: 기존 Decimal 구현 vs CostCalculationService (money 모듈 규칙)
+
+    python -m benchmarks.bench_money --cases 20000
+
+무작위 입력(반올림 경계값 포함)으로 기존 Decimal 계산 결과와 비트 단위로 같은지 확인하고
+함수별 처리 시간을 비교한다.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from decimal import Decimal
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.calculation_service import CostCalculationService
+
+
+# ---- 기존 Decimal 구현 (비교 기준) ----
+
+def legacy_labor(persons, hours, unit_rate, rate_type="daily"):
+    return (Decimal(str(persons)) * hours * unit_rate).quantize(Decimal('0.01'))
+
+
+def legacy_equipment(units, hours, hourly_rate, min_hours=Decimal('4.0'), mobilization_fee=Decimal('0')):
+    actual_hours = max(hours, min_hours)
+    base_cost = Decimal(str(units)) * actual_hours * hourly_rate
+    total_cost = base_cost + mobilization_fee
+    return {
+        'base_cost': base_cost.quantize(Decimal('0.01')),
+        'mobilization_fee': mobilization_fee.quantize(Decimal('0.01')),
+        'total_cost': total_cost.quantize(Decimal('0.01')),
+        'applied_hours': actual_hours,
+        'min_hours_applied': actual_hours > hours
+    }
+
+
+def legacy_material(quantity, unit_price, waste_rate=Decimal('0.03')):
+    base_cost = quantity * unit_price
+    waste_amount = base_cost * waste_rate
+    total_cost = base_cost + waste_amount
+    return {
+        'base_cost': base_cost.quantize(Decimal('0.01')),
+        'waste_amount': waste_amount.quantize(Decimal('0.01')),
+        'total_cost': total_cost.quantize(Decimal('0.01')),
+        'waste_rate': waste_rate * 100
+    }
+
+
+def legacy_vat(supply_amount, vat_rate=Decimal('10.0'), tax_mode="taxable"):
+    if tax_mode == "exempt" or tax_mode == "zero":
+        vat_amount = Decimal('0')
+    else:
+        vat_amount = supply_amount * (vat_rate / Decimal('100'))
+    total_amount = supply_amount + vat_amount
+    return {
+        'supply_amount': supply_amount.quantize(Decimal('0.01')),
+        'vat_amount': vat_amount.quantize(Decimal('0.01')),
+        'total_amount': total_amount.quantize(Decimal('0.01')),
+        'vat_rate': vat_rate,
+        'tax_mode': tax_mode
+    }
+
+
+def legacy_progress(contract_amount, progress_rate, advance_rate=Decimal('10.0'),
+                    defect_rate=Decimal('3.0'), previous_payments=Decimal('0')):
+    cumulative_amount = contract_amount * (progress_rate / Decimal('100'))
+    advance_amount = contract_amount * (advance_rate / Decimal('100'))
+    defect_amount = cumulative_amount * (defect_rate / Decimal('100'))
+    current_payment = cumulative_amount - advance_amount - previous_payments - defect_amount
+    return {
+        'contract_amount': contract_amount.quantize(Decimal('0.01')),
+        'cumulative_amount': cumulative_amount.quantize(Decimal('0.01')),
+        'advance_amount': advance_amount.quantize(Decimal('0.01')),
+        'defect_amount': defect_amount.quantize(Decimal('0.01')),
+        'previous_payments': previous_payments.quantize(Decimal('0.01')),
+        'current_payment': max(current_payment, Decimal('0')).quantize(Decimal('0.01')),
+        'progress_rate': progress_rate
+    }
+
+
+# ---- 무작위 입력 ----
+
+def rand_decimal(rng, max_int, scale):
+    """max_int 이하, 소수 scale자리 Decimal (끝자리 5 경계값 비중을 높임)"""
+    units = rng.randint(0, max_int * 10 ** scale)
+    if scale and rng.random() < 0.3:
+        units = units - units % 10 + 5
+    return Decimal(units).scaleb(-scale)
+
+
+def cases(rng, n):
+    for _ in range(n):
+        yield {
+            'labor': (rng.randint(1, 50), rand_decimal(rng, 24, 1), rand_decimal(rng, 500000, 2)),
+            'equipment': (rng.randint(1, 5), rand_decimal(rng, 12, 1), rand_decimal(rng, 300000, 2),
+                          rand_decimal(rng, 8, 1), rand_decimal(rng, 500000, 2)),
+            'material': (rand_decimal(rng, 10000, 3), rand_decimal(rng, 100000, 2), rand_decimal(rng, 1, 3)),
+            'vat': (rand_decimal(rng, 10 ** 9, rng.randint(0, 5)), rand_decimal(rng, 20, 2),
+                    rng.choice(["taxable", "exempt", "zero"])),
+            'progress': (rand_decimal(rng, 10 ** 10, 2), rand_decimal(rng, 100, 2), rand_decimal(rng, 30, 2),
+                         rand_decimal(rng, 10, 2), rand_decimal(rng, 10 ** 9, 2)),
+        }
+
+
+PAIRS = {
+    'labor': (legacy_labor, CostCalculationService.calculate_labor_cost),
+    'equipment': (legacy_equipment, CostCalculationService.calculate_equipment_cost),
+    'material': (legacy_material, CostCalculationService.calculate_material_cost),
+    'vat': (legacy_vat, CostCalculationService.calculate_vat),
+    'progress': (legacy_progress, CostCalculationService.calculate_progress_payment),
+}
+
+
+def same(a, b):
+    """값과 표현(자릿수)까지 동일한지 비교"""
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(same(a[k], b[k]) for k in a)
+    if isinstance(a, Decimal):
+        return isinstance(b, Decimal) and a == b and str(a) == str(b)
+    return a == b
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cases", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    inputs = list(cases(random.Random(args.seed), args.cases))
+
+    failures = 0
+    for name, (legacy, current) in PAIRS.items():
+        for case in inputs:
+            expected, actual = legacy(*case[name]), current(*case[name])
+            if not same(expected, actual):
+                failures += 1
+                if failures <= 10:
+                    print(f"❌ {name}{case[name]}: legacy={expected} current={actual}")
+
+        started = time.perf_counter()
+        for case in inputs:
+            legacy(*case[name])
+        legacy_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for case in inputs:
+            current(*case[name])
+        current_time = time.perf_counter() - started
+
+        print(f"📊 {name:<10} legacy={legacy_time * 1e6 / len(inputs):6.2f}µs "
+              f"current={current_time * 1e6 / len(inputs):6.2f}µs per call")
+
+    if failures:
+        print(f"❌ 불일치 {failures}건")
+        sys.exit(1)
+    print(f"✅ {args.cases}개 입력 × {len(PAIRS)}개 함수 결과 일치")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+포트폴리오 비용 집계 벤치마크: 프로젝트별 N회 호출 vs 단일 그룹 쿼리
+
+    python -m benchmarks.bench_portfolio --projects 500 --target-ms 200
+
+단일 호출(/api/aggregation/portfolio/cost-summary)의 지연시간이 목표치를 넘으면 종료코드 1.
+엔드포인트는 동기 세션 모드(DB_ASYNC 미설정)의 DBRunner로 실행한다.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.orm import sessionmaker
+
+from app.database import DBRunner
+from app.routers.aggregation import PortfolioCostSummaryRequest, get_portfolio_cost_summary
+from app.services.invoice_service import InvoiceAggregationService
+from benchmarks.seed_data import make_engine, seed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=None, help="기본값: 임시 SQLite 파일")
+    parser.add_argument("--projects", type=int, default=500)
+    parser.add_argument("--days", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--target-ms", type=float, default=200.0)
+    args = parser.parse_args()
+
+    engine = make_engine(args.database_url)
+    print("🌱 시드 데이터 생성 중...")
+    counts = seed(engine, projects=args.projects, days=args.days, items_per_log=1, entries_per_item=1)
+    print(f"   {counts}")
+
+    db = sessionmaker(bind=engine)()
+    period_from = date(2024, 1, 1)
+    period_to = period_from + timedelta(days=args.days - 1)
+    project_ids = list(range(1, args.projects + 1))
+
+    # 기존 방식: 프로젝트마다 cost-summary 1회
+    started = time.perf_counter()
+    per_project_total = Decimal('0')
+    service = InvoiceAggregationService(db)
+    for project_id in project_ids:
+        per_project_total += service.aggregate_work_costs(project_id, period_from, period_to)['total_supply_amount']
+    per_project_ms = (time.perf_counter() - started) * 1000
+
+    # 일괄 방식 (엔드포인트를 동기 세션 DBRunner로 직접 실행)
+    runner = DBRunner(db)
+    request = PortfolioCostSummaryRequest(period_from=period_from, period_to=period_to, project_ids=project_ids)
+    best_ms = None
+    response = None
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        response = asyncio.run(get_portfolio_cost_summary(request, runner))
+        elapsed = (time.perf_counter() - started) * 1000
+        best_ms = elapsed if best_ms is None else min(best_ms, elapsed)
+
+    db.close()
+
+    grand_total = Decimal(str(response['grand_total']['total_supply_amount'])).quantize(Decimal('0.01'))
+    print(f"📊 프로젝트별 {args.projects}회 호출: {per_project_ms:.1f}ms (합계 {per_project_total:,.2f})")
+    print(f"📊 일괄 조회 1회: {best_ms:.1f}ms (합계 {grand_total:,.2f})")
+
+    if abs(grand_total - per_project_total.quantize(Decimal('0.01'))) > Decimal('0.05'):
+        print("❌ 합계 불일치")
+        sys.exit(1)
+    if best_ms > args.target_ms:
+        print(f"❌ 목표 지연시간 {args.target_ms:.0f}ms 초과")
+        sys.exit(1)
+    print(f"✅ 목표 지연시간 {args.target_ms:.0f}ms 이내")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+집계/추천 쿼리 실행계획(EXPLAIN)과 지연시간 점검
+
+    python -m benchmarks.bench_query_plans --projects 10 --days 365
+    python -m benchmarks.bench_query_plans --save-baseline plans.json      # 기준 저장
+    python -m benchmarks.bench_query_plans --baseline plans.json           # 기준과 비교
+
+대용량 시드 데이터에서 핫패스 인덱스 없이/있이 각 서비스 호출이 실행하는 SQL을 잡아
+EXPLAIN 결과와 지연시간을 출력한다. 인덱스 적용 후 핫 테이블을 전체 스캔하거나,
+--baseline과 실행계획이 달라지거나, 지연시간이 허용치 이상 늘면 종료코드 1.
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import sys
+import time
+from datetime import date
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from app.models.labor_entries import RateType
+from app.services.breakdown_service import BreakdownDimension, CostBreakdownService
+from app.services.invoice_service import InvoiceAggregationService
+from app.services.recommendation_service import RecommendationService
+from app.services.rollup_service import CostRollupService, TimeBucket
+from app.services.schema_service import IndexManager, SchemaMigrator
+from app.services.work_log_service import WorkLogService
+from benchmarks.seed_data import make_engine, seed
+
+HOT_TABLES = ("work_logs", "work_items", "labor_entries", "equipment_entries", "material_entries")
+PERIOD = (date(2024, 1, 1), date(2024, 3, 31))
+
+# 이름 → 서비스 호출 (추천은 기준일이 오늘이므로 조회 기간을 넉넉히 둔다)
+QUERIES = {
+    "aggregation.cost_summary": lambda db: InvoiceAggregationService(db).aggregate_work_costs(3, *PERIOD),
+    "aggregation.time_series": lambda db: CostRollupService(db).time_series(3, *PERIOD, TimeBucket.WEEK),
+    "aggregation.breakdown_trade": lambda db: CostBreakdownService(db).breakdown(3, *PERIOD, BreakdownDimension.TRADE),
+    "aggregation.breakdown_material": lambda db: CostBreakdownService(db).breakdown(
+        3, *PERIOD, BreakdownDimension.MATERIAL_CODE),
+    "work_logs.list_page": lambda db: WorkLogService(db).list_page(limit=100, project_id=3, date_from=PERIOD[0]),
+    "recommendation.trade": lambda db: RecommendationService.recommend_labor_rate(
+        db, trade="목공", rate_type=RateType.DAILY, lookback_days=3650),
+    "recommendation.trade_project_task": lambda db: RecommendationService.recommend_labor_rate(
+        db, trade="철근공", rate_type=RateType.DAILY, project_id=3, task_code_prefix="03", lookback_days=3650),
+}
+
+
+def capture_statements(db, fn):
+    """fn이 실행한 SELECT 문과 파라미터"""
+    statements = []
+
+    def listener(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        fn(db)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    return statements
+
+
+def explain(db, statement, parameters):
+    """방언별 실행계획 (비용/행 수 추정치는 비교에서 빼도록 정규화)"""
+    conn = db.connection()
+    if conn.dialect.name == "sqlite":
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+        return [row[-1] for row in rows]
+    rows = conn.exec_driver_sql(f"EXPLAIN {statement}", parameters).fetchall()
+    return [re.sub(r"\s+\(cost=[^)]*\)", "", row[0]).rstrip() for row in rows]
+
+
+def full_scans(plan):
+    """핫 테이블 전체 스캔 단계"""
+    scans = []
+    for line in plan:
+        for table in HOT_TABLES:
+            if re.search(rf"^\s*SCAN {table}\b(?! USING (COVERING )?INDEX)", line) or \
+                    re.search(rf"Seq Scan on {table}\b", line):
+                scans.append(line.strip())
+    return scans
+
+
+def measure(db, repeat: int):
+    results = {}
+    for name, fn in QUERIES.items():
+        statements = capture_statements(db, fn)
+        plans = [explain(db, statement, parameters) for statement, parameters in statements]
+        db.rollback()
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            fn(db)
+            timings.append((time.perf_counter() - started) * 1000)
+            db.rollback()
+        results[name] = {
+            "ms": round(statistics.median(timings), 3),
+            "plan": [line for plan in plans for line in plan],
+        }
+    return results
+
+
+def report(label, results, previous=None):
+    print(f"\n===== {label} =====")
+    for name, result in results.items():
+        speedup = ""
+        if previous and name in previous and result["ms"]:
+            speedup = f" ({previous[name]['ms'] / result['ms']:.1f}배)"
+        print(f"📊 {name}: {result['ms']:.2f}ms{speedup}")
+        for line in result["plan"]:
+            print(f"      {line}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=None, help="기본값: 임시 SQLite 파일")
+    parser.add_argument("--projects", type=int, default=10)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", default=None, help="비교할 기준 JSON")
+    parser.add_argument("--save-baseline", default=None, help="인덱스 적용 후 결과를 기준 JSON으로 저장")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="기준 대비 허용 지연 증가율")
+    args = parser.parse_args()
+
+    engine = make_engine(args.database_url)
+    started = time.perf_counter()
+    counts = seed(engine, projects=args.projects, days=args.days)
+    print(f"시드 데이터: {counts} ({time.perf_counter() - started:.0f}초)")
+
+    db = sessionmaker(bind=engine)()
+    IndexManager(engine).drop()
+    before = measure(db, args.repeat)
+    report("핫패스 인덱스 없음", before)
+
+    SchemaMigrator(engine).upgrade()
+    after = measure(db, args.repeat)
+    report("핫패스 인덱스 적용", after, before)
+    db.close()
+
+    failures = []
+    for name, result in after.items():
+        for scan in full_scans(result["plan"]):
+            failures.append(f"{name}: 전체 스캔 {scan}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        for name, result in after.items():
+            expected = baseline.get(name)
+            if expected is None:
+                continue
+            if expected["plan"] != result["plan"]:
+                failures.append(f"{name}: 실행계획 변경\n        기준: {expected['plan']}\n        현재: {result['plan']}")
+            if result["ms"] > expected["ms"] * (1 + args.tolerance):
+                failures.append(f"{name}: {expected['ms']:.2f}ms → {result['ms']:.2f}ms")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(after, f, ensure_ascii=False, indent=2)
+        print(f"\n기준 저장: {args.save_baseline}")
+
+    if failures:
+        print(f"\n❌ 실행계획 회귀 {len(failures)}건")
+        for failure in failures:
+            print(f"   - {failure}")
+        sys.exit(1)
+    print("\n✅ 핫 테이블 전체 스캔 없음" + (", 기준과 일치" if args.baseline else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+노무 단가 추천 벤치마크: 노무 투입 전체 로딩 후 정렬(기존) vs 직종별 단가 분포 집계(labor_rate_stats) + DB 분위수 계산
+
+    python -m benchmarks.bench_recommendations --projects 10 --days 365
+
+오늘 기준 과거 --days일치 시드 데이터에서 직종/단가유형/필터/조회기간 조합마다
+기존 방식(행 로딩 + statistics.median)과 같은 건수/중앙값/p25/p75가 나오는지 확인하고
+지연시간을 비교한다. 하나라도 다르면 종료코드 1.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+from app.models import LaborEntry, WorkItem, WorkLog
+from app.models.labor_entries import RateType
+from app.services.recommendation_service import RecommendationService, _convert_rate_to
+from benchmarks.seed_data import TRADES, seed, make_engine
+
+FILTERS = [
+    ("필터 없음", {}),
+    ("프로젝트", {"project_id": 1}),
+    ("작업코드 접두", {"task_code_prefix": "03"}),
+    ("프로젝트+접두", {"project_id": 1, "task_code_prefix": "03"}),
+]
+LOOKBACKS = [30, 90, 180, 365]
+
+
+def legacy_stats(db, trade, rate_type, task_code_prefix=None, project_id=None, lookback_days=180):
+    """기존 방식: 조건에 맞는 노무 투입을 모두 읽어 변환/정렬 후 (건수, 중앙값, p25, p75)"""
+    since = date.today() - timedelta(days=lookback_days)
+    stmt = (
+        select(LaborEntry)
+        .join(WorkItem, LaborEntry.work_item_id == WorkItem.id)
+        .join(WorkLog, WorkItem.work_log_id == WorkLog.id)
+        .where(LaborEntry.trade == trade)
+        .where(WorkLog.work_date >= since)
+    )
+    if project_id is not None:
+        stmt = stmt.where(WorkLog.project_id == project_id)
+    if task_code_prefix:
+        stmt = stmt.where(WorkItem.task_code.like(f"{task_code_prefix}%"))
+    values = sorted(
+        _convert_rate_to(Decimal(str(r.unit_rate)), r.rate_type, rate_type, RecommendationService.ASSUMED_HOURS_PER_DAY)
+        for r in db.execute(stmt).scalars()
+    )
+    if not values:
+        return 0, None, None, None
+
+    def percentile(sorted_vals, p):
+        k = (len(sorted_vals) - 1) * p
+        f = int(k)
+        c = min(f + 1, len(sorted_vals) - 1)
+        if f == c:
+            return sorted_vals[int(k)]
+        d0 = sorted_vals[f] * (Decimal(c) - Decimal(k))
+        d1 = sorted_vals[c] * (Decimal(k) - Decimal(f))
+        return (d0 + d1).quantize(Decimal("0.01"))
+
+    median = Decimal(str(statistics.median(values))).quantize(Decimal("0.01"))
+    return len(values), median, percentile(values, 0.25), percentile(values, 0.75)
+
+
+def timed(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=None, help="기본값: 임시 SQLite 파일")
+    parser.add_argument("--projects", type=int, default=10)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = make_engine(args.database_url)
+    started = time.perf_counter()
+    counts = seed(engine, projects=args.projects, days=args.days, start=date.today() - timedelta(days=args.days - 1))
+    print(f"시드 데이터: {counts} ({time.perf_counter() - started:.0f}초)")
+    db = sessionmaker(bind=engine)()
+
+    mismatches = []
+    for trade in TRADES:
+        for rate_type in RateType:
+            for _, filters in FILTERS:
+                for lookback in LOOKBACKS:
+                    expected = legacy_stats(db, trade, rate_type, lookback_days=lookback, **filters)
+                    result = RecommendationService.recommend_labor_rate(
+                        db, trade=trade, rate_type=rate_type, lookback_days=lookback, **filters
+                    )
+                    actual = (result.sample_size, result.historical_median, result.p25, result.p75)
+                    if actual != expected:
+                        mismatches.append(f"{trade}/{rate_type.value}/{filters}/{lookback}일: {expected} != {actual}")
+
+    trade = TRADES[0]
+    for name, filters in FILTERS:
+        legacy_ms = timed(lambda: legacy_stats(db, trade, RateType.DAILY, lookback_days=365, **filters), args.repeat)
+        stats_ms = timed(lambda: RecommendationService.recommend_labor_rate(
+            db, trade=trade, rate_type=RateType.DAILY, lookback_days=365, **filters
+        ), args.repeat)
+        print(f"📊 {trade} 365일 {name}: 행 로딩 {legacy_ms:.1f}ms → 단가 분포 {stats_ms:.1f}ms")
+    db.close()
+
+    if mismatches:
+        print(f"\n❌ 기존 방식과 다른 결과 {len(mismatches)}건")
+        for mismatch in mismatches[:20]:
+            print(f"   - {mismatch}")
+        sys.exit(1)
+    print("\n✅ 모든 조합에서 기존 방식과 건수/중앙값/p25/p75 일치")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+응답 직렬화/압축 벤치마크: 기본 JSONResponse(jsonable_encoder + json.dumps) vs FastJSONResponse(orjson)
+
+    python -m benchmarks.bench_responses --projects 5 --days 120
+
+작업일지 목록, 일별 비용 추이, 변경 동기화 첫 페이지, 참조 데이터 응답을 만들어
+두 방식의 직렬화 시간과 본문 크기, gzip/brotli 압축 후 크기와 압축 시간을 출력한다.
+두 방식의 JSON 내용이 다르면 종료코드 1.
+"""
+import argparse
+import gzip
+import os
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from typing import List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy.orm import sessionmaker
+
+from app.compression import brotli
+from app.data import reference_data
+from app.responses import FastJSONResponse
+from app.schemas.work_logs import WorkLogResponse
+from app.services.rollup_service import CostRollupService, TimeBucket
+from app.services.sync_service import SyncService
+from app.services.work_log_service import WorkLogService
+from benchmarks.seed_data import make_engine, seed
+
+START = date(2024, 1, 1)  # seed 기본 시작일
+WORK_LOG_LIST = TypeAdapter(List[WorkLogResponse])
+
+
+def build_payloads(db, days: int) -> dict:
+    """이름 → (response_model 여부, 응답 내용)"""
+    logs, _ = WorkLogService(db).list_page(limit=100)
+    models = [WorkLogResponse.model_validate(log, from_attributes=True) for log in logs]
+    series = CostRollupService(db).time_series(1, START, START + timedelta(days=days - 1), TimeBucket.DAY)
+    reference = {
+        "equipment_types": reference_data.CONSTRUCTION_EQUIPMENT_TYPES,
+        "trades": reference_data.STANDARD_TRADES,
+        "work_items": reference_data.STANDARD_WORK_ITEMS,
+        "units": reference_data.STANDARD_UNITS,
+        "weather_conditions": reference_data.WEATHER_CONDITIONS,
+    }
+    return {
+        "work_logs.list (100건)": (True, models),
+        "aggregation.cost_timeseries (일별)": (False, series),
+        "sync.changes (첫 페이지)": (False, SyncService(db).changes(None, SyncService.MAX_LIMIT)),
+        "reference (전체)": (False, reference),
+    }
+
+
+def render_default(is_model: bool, content) -> bytes:
+    """기존: response_model은 pydantic 직렬화, dict는 jsonable_encoder 후 json.dumps"""
+    data = WORK_LOG_LIST.dump_python(content, mode="json") if is_model else jsonable_encoder(content)
+    return JSONResponse(data).body
+
+
+def render_fast(is_model: bool, content) -> bytes:
+    """변경: response_model은 pydantic 직렬화 후 orjson, dict는 FastJSONResponse로 바로 반환"""
+    data = WORK_LOG_LIST.dump_python(content, mode="json") if is_model else content
+    return FastJSONResponse(data).body
+
+
+def timed(fn, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return result, statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=None, help="기본값: 임시 SQLite 파일")
+    parser.add_argument("--projects", type=int, default=5)
+    parser.add_argument("--days", type=int, default=120)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--gzip-level", type=int, default=6)
+    parser.add_argument("--brotli-quality", type=int, default=4)
+    args = parser.parse_args()
+
+    engine = make_engine(args.database_url)
+    counts = seed(engine, projects=args.projects, days=args.days)
+    print(f"시드 데이터: {counts}")
+    db = sessionmaker(bind=engine)()
+    payloads = build_payloads(db, args.days)
+    db.close()
+
+    failures = []
+    for name, (is_model, content) in payloads.items():
+        before, before_ms = timed(lambda: render_default(is_model, content), args.repeat)
+        after, after_ms = timed(lambda: render_fast(is_model, content), args.repeat)
+        if orjson.loads(before) != orjson.loads(after):
+            failures.append(name)
+
+        print(f"\n📊 {name}")
+        print(f"   직렬화: 기본 {before_ms:.2f}ms → orjson {after_ms:.2f}ms ({before_ms / after_ms:.1f}배)")
+        print(f"   본문: 기본 {len(before):,}B, orjson {len(after):,}B")
+        gzipped, gzip_ms = timed(lambda: gzip.compress(after, compresslevel=args.gzip_level), args.repeat)
+        print(f"   gzip-{args.gzip_level}: {len(gzipped):,}B ({len(gzipped) / len(after):.1%}), {gzip_ms:.2f}ms")
+        if brotli is not None:
+            compressed, br_ms = timed(lambda: brotli.compress(after, quality=args.brotli_quality), args.repeat)
+            print(f"   br-{args.brotli_quality}: {len(compressed):,}B ({len(compressed) / len(after):.1%}), {br_ms:.2f}ms")
+        else:
+            print("   br: brotli 패키지 없음")
+
+    if failures:
+        print(f"\n❌ JSON 내용 불일치: {failures}")
+        sys.exit(1)
+    print("\n✅ 두 방식의 JSON 내용 일치")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+작업일지 전문 검색 벤치마크: LIKE 전체 스캔 vs 검색 색인(FTS5/tsvector)
+
+    python -m benchmarks.bench_search --projects 20 --days 365 --max-ms 50
+
+시드 데이터(ORM으로 넣으므로 색인은 커밋 때 함께 채워진다)에서 한글 검색어별로
+색인 검색 결과를 LIKE '%단어%' 스캔 결과와 비교하고 첫 페이지 지연시간을 비교한다.
+
+- 프로젝트 필터 검색(--compare-projects개 프로젝트): 전체 페이지가 LIKE 결과와 같아야 한다
+  (결과가 조회 상한을 넘으면 비교할 수 없으므로 실패로 본다).
+- 전체 검색: 조회 상한(MAX_OFFSET + 페이지 크기)까지 받은 결과가 LIKE 결과에 모두 들고,
+  건수가 min(LIKE 건수, 상한)이며, 상한을 넘는 경우에만 잘림(truncated)으로 표시돼야 한다.
+
+결과가 다르거나 첫 페이지 중앙값이 --max-ms를 넘으면 종료코드 1.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import and_, exists, or_, select
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Project, WorkItem, WorkLog
+from app.services.search_service import WorkLogSearchService
+from benchmarks.seed_data import make_engine, seed
+
+# 한글만으로 된 단어는 색인 검색과 부분 문자열 검색의 결과가 같아야 한다
+QUERIES = ["터파기", "거푸집 설치", "철근", "방수", "3동", "바닥 방수"]
+
+
+def like_scan(db, q: str, project_id=None) -> set:
+    """기존 방식: 단어마다 작업일지/작업항목 텍스트 컬럼을 LIKE로 전체 스캔"""
+    conditions = []
+    for term in q.split():
+        pattern = f"%{term}%"
+        conditions.append(or_(
+            WorkLog.area.like(pattern), WorkLog.process_status.like(pattern), WorkLog.notes.like(pattern),
+            exists().where(WorkItem.work_log_id == WorkLog.id,
+                           or_(WorkItem.task_name.like(pattern), WorkItem.specification.like(pattern)))
+        ))
+    if project_id is not None:
+        conditions.append(WorkLog.project_id == project_id)
+    return set(db.execute(select(WorkLog.id).where(and_(*conditions))).scalars())
+
+
+def search_all(db, q: str, project_id=None):
+    """색인 검색 전체 페이지 (ID 집합, 잘림 여부)"""
+    service = WorkLogSearchService(db)
+    ids, cursor = set(), None
+    while True:
+        rows, cursor, truncated = service.search(q, project_id=project_id, limit=service.MAX_LIMIT, cursor=cursor)
+        ids |= {row["id"] for row in rows}
+        if not cursor:
+            return ids, truncated
+
+
+def timed(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=None, help="기본값: 임시 SQLite 파일")
+    parser.add_argument("--projects", type=int, default=20)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, default=50.0, help="색인 검색 첫 페이지 지연시간 상한")
+    parser.add_argument("--compare-projects", type=int, default=3, help="전체 결과를 비교할 프로젝트 수")
+    args = parser.parse_args()
+
+    engine = make_engine(args.database_url)
+    started = time.perf_counter()
+    counts = seed(engine, projects=args.projects, days=args.days, items_per_log=3, entries_per_item=1)
+    print(f"시드 데이터: {counts} ({time.perf_counter() - started:.0f}초)")
+    db = sessionmaker(bind=engine)()
+
+    failures = []
+    compared = 0
+    cap = WorkLogSearchService.MAX_OFFSET + WorkLogSearchService.MAX_LIMIT
+    project_ids = db.execute(select(Project.id).order_by(Project.id).limit(args.compare_projects)).scalars().all()
+    for q in QUERIES:
+        for project_id in project_ids:
+            expected = like_scan(db, q, project_id)
+            found, truncated = search_all(db, q, project_id)
+            compared += 1
+            if found != expected or truncated:
+                failures.append(f"{q} (프로젝트 {project_id}): LIKE {len(expected)}건, 색인 {len(found)}건")
+
+        expected = like_scan(db, q)
+        found, truncated = search_all(db, q)
+        compared += 1
+        if not found <= expected or len(found) != min(len(expected), cap) or truncated != (len(expected) > cap):
+            failures.append(f"{q}: LIKE {len(expected)}건, 색인 {len(found)}건 (잘림 {truncated})")
+
+        like_ms = timed(lambda: like_scan(db, q), args.repeat)
+        search_ms = timed(lambda: WorkLogSearchService(db).search(q), args.repeat)
+        print(f"📊 '{q}': {len(expected):,}건, LIKE 스캔 {like_ms:.1f}ms → 색인 첫 페이지 {search_ms:.1f}ms")
+        if search_ms > args.max_ms:
+            failures.append(f"{q}: 첫 페이지 {search_ms:.1f}ms > {args.max_ms:.0f}ms")
+    db.close()
+
+    if failures:
+        print(f"\n❌ 검색 점검 실패 {len(failures)}건")
+        for failure in failures:
+            print(f"   - {failure}")
+        sys.exit(1)
+    print(f"\n✅ 색인 검색 결과가 LIKE 스캔과 일치 ({compared}회 비교)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+변경 동기화 벤치마크/검증: 전체 동기화 페이지 순회 + 변경분 누락 검사
+
+    python -m benchmarks.bench_sync --projects 5 --days 60 --limit 2000
+
+전체 동기화를 페이지 단위로 끝까지 받아 테이블별 건수와 시간을 출력한 뒤, 워터마크 이후의
+ORM 수정/Core 일괄 수정/삭제와 함께, 클라이언트가 워터마크를 받는 동안 커밋되지 않았고
+updated_at이 그 워터마크보다 이른(오래 걸린 트랜잭션) 행이 다음 동기화에 들어오는지 확인한다.
+빠지거나 건수가 다르면 종료코드 1.
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import LaborEntry, Project, WorkItem, WorkLog
+from app.models.sync_tombstones import SYNC_TABLES
+from app.services.sync_service import SyncService
+from benchmarks.seed_data import make_engine, seed
+
+
+def sync(Session, token, limit):
+    """token 이후 변경분을 끝까지 받아 (테이블 → PK 집합, 테이블 → 삭제 PK 집합, 다음 워터마크, 페이지 수)"""
+    changed, deleted, pages = {}, {}, 0
+    while True:
+        with Session() as db:
+            page = SyncService(db).changes(token, limit)
+        pages += 1
+        for name, block in page["changes"].items():
+            pk = list(Base.metadata.tables[name].primary_key.columns)[0].name
+            position = block["columns"].index(pk)
+            changed.setdefault(name, set()).update(row[position] for row in block["rows"])
+        for name, ids in page["deleted"].items():
+            deleted.setdefault(name, set()).update(ids)
+        token = page["next"]
+        if not page["has_more"]:
+            return changed, deleted, token, pages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=None, help="기본값: 임시 SQLite 파일")
+    parser.add_argument("--projects", type=int, default=5)
+    parser.add_argument("--days", type=int, default=60)
+    parser.add_argument("--limit", type=int, default=2000, help="페이지당 행 수")
+    args = parser.parse_args()
+
+    engine = make_engine(args.database_url)
+    print("🌱 시드 데이터 생성 중...")
+    print(f"   {seed(engine, projects=args.projects, days=args.days)}")
+    Session = sessionmaker(bind=engine)
+    failures = []
+
+    started = time.perf_counter()
+    changed, _, watermark, pages = sync(Session, None, args.limit)
+    elapsed = time.perf_counter() - started
+    with Session() as db:
+        expected = {
+            name: db.execute(select(func.count()).select_from(Base.metadata.tables[name])).scalar()
+            for name in SYNC_TABLES
+        }
+    received = {name: len(changed.get(name, ())) for name in SYNC_TABLES}
+    print(f"📊 전체 동기화: {sum(received.values())}행, {pages}페이지, {elapsed * 1000:.0f}ms")
+    if received != expected:
+        failures.append(f"전체 동기화 건수 불일치: {received} != {expected}")
+
+    # 워터마크 이후 변경: ORM 수정, Core 일괄 수정(onupdate 없음), ORM 삭제
+    with Session() as db:
+        project = db.query(Project).order_by(Project.id).first()
+        project.project_name = project.project_name + " (변경)"
+        item_id = db.execute(select(WorkItem.id).order_by(WorkItem.id.desc()).limit(1)).scalar()
+        db.execute(update(WorkItem).where(WorkItem.id == item_id).values(progress_rate=50))
+        entry = db.query(LaborEntry).order_by(LaborEntry.id).first()
+        entry_id = entry.id
+        db.delete(entry)
+        db.commit()
+        project_id = project.id
+
+    # 오래 걸린 트랜잭션: 워터마크를 받기 전에 시작해 그보다 이른 updated_at으로 쓰고, 받은 뒤에 커밋
+    slow = Session()
+    late = WorkLog(project_id=project_id, work_date=date(2024, 1, 1), area="지연 커밋",
+                   updated_at=datetime.utcnow() - timedelta(hours=1))
+    slow.add(late)
+    slow.flush()
+    late_id = late.id
+
+    changed, deleted, watermark, _ = sync(Session, watermark, args.limit)
+    if project_id not in changed.get("projects", ()):
+        failures.append("ORM으로 수정한 프로젝트가 빠짐")
+    if item_id not in changed.get("work_items", ()):
+        failures.append("Core 일괄 수정한 작업항목이 빠짐")
+    if entry_id not in deleted.get("labor_entries", ()):
+        failures.append("삭제한 노무 투입의 톰스톤이 빠짐")
+    if late_id in changed.get("work_logs", ()):
+        failures.append("커밋되지 않은 작업일지가 내려감")
+
+    slow.commit()
+    slow.close()
+    changed, _, _, _ = sync(Session, watermark, args.limit)
+    if late_id not in changed.get("work_logs", ()):
+        failures.append("워터마크보다 이른 시각으로 늦게 커밋된 작업일지가 다음 동기화에서 빠짐")
+    else:
+        print("📊 워터마크보다 이른 updated_at으로 늦게 커밋된 행: 다음 동기화에 포함")
+
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        sys.exit(1)
+    print("✅ 전체/변경 동기화 누락 없음")
+
+
+if __name__ == "__main__":
+    main()
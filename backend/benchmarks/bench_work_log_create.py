@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+작업일지 생성 DB 왕복 횟수 점검
+
+    python -m benchmarks.bench_work_log_create --items 1 10 30 --max-round-trips 10
+
+작업항목 수를 바꿔 가며 WorkLogService.create의 DB 왕복(SQL 실행 + 커밋) 횟수와
+지연시간을 출력한다. 왕복 횟수가 작업항목 수에 따라 달라지거나 상한을 넘으면 종료코드 1.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.orm import sessionmaker
+
+from app.database import count_round_trips
+from app.models import Client, Project
+from app.schemas.work_logs import WorkLogCreate
+from app.services.rollup_service import CostRollupService
+from app.services.work_log_service import WorkLogService
+from benchmarks.seed_data import make_engine
+
+
+def make_payload(project_id: int, items: int) -> WorkLogCreate:
+    return WorkLogCreate(
+        project_id=project_id,
+        work_date="2024-03-01",
+        area="1동 3층",
+        work_items=[
+            {"task_code": f"03.01.{i:03d}", "task_name": "거푸집 설치", "quantity": 12.5, "unit": "m2", "progress_rate": 50}
+            for i in range(items)
+        ],
+        labor_entries=[{"trade": "형틀목공", "persons": 4, "hours": 8, "rate_type": "daily", "unit_rate": 250000}] * 3,
+        equipment_entries=[{"equipment_code": "06", "equipment_name": "트럭크레인", "units": 1, "hours": 3,
+                            "hourly_rate": 120000, "mobilization_fee": 150000}],
+        material_entries=[{"material_code": "M-003", "material_name": "합판", "quantity": 40, "unit": "장",
+                           "unit_price": 18000, "supplier": "공급처1"}],
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=None, help="기본값: 임시 SQLite 파일")
+    parser.add_argument("--items", type=int, nargs="+", default=[1, 10, 30])
+    parser.add_argument("--max-round-trips", type=int, default=10)
+    args = parser.parse_args()
+
+    engine = make_engine(args.database_url)
+    db = sessionmaker(bind=engine)()
+    client = Client(company_name="벤치마크 발주처")
+    db.add(client)
+    db.flush()
+    project = Project(client_id=client.id, project_name="왕복 횟수 점검 현장")
+    db.add(project)
+    db.commit()
+    project_id = project.id
+
+    counts = {}
+    for items in args.items:
+        payload = make_payload(project_id, items)
+        started = time.perf_counter()
+        with count_round_trips() as counter:
+            response = WorkLogService(db).create(payload)
+        elapsed = (time.perf_counter() - started) * 1000
+        counts[items] = counter.count
+        print(f"📊 작업항목 {items:>3}개: DB 왕복 {counter.count}회, {elapsed:.1f}ms (work_id={response.work_id})")
+
+    mismatches = CostRollupService(db).verify()
+    db.close()
+
+    if mismatches:
+        print(f"❌ 집계 불일치 {len(mismatches)}건")
+        sys.exit(1)
+    if len(set(counts.values())) != 1:
+        print("❌ 작업항목 수에 따라 왕복 횟수가 달라짐")
+        sys.exit(1)
+    if max(counts.values()) > args.max_round_trips:
+        print(f"❌ 왕복 횟수 상한 {args.max_round_trips}회 초과")
+        sys.exit(1)
+    print(f"✅ 작업항목 수와 무관하게 {max(counts.values())}회")
+
+
+if __name__ == "__main__":
+    main()
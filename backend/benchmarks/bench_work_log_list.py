@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+작업일지 목록 조회 벤치마크: offset + 지연 로딩 vs 키셋 + selectin 로딩
+
+    python -m benchmarks.bench_work_log_list --projects 20 --days 100 --page-size 100
+
+첫 페이지와 마지막 쪽 페이지의 쿼리 수/지연시간을 비교한다. 키셋 방식의 페이지당
+쿼리 수가 --max-queries를 넘거나 페이지 위치에 따라 달라지면 종료코드 1.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.orm import sessionmaker
+
+from app.database import count_round_trips
+from app.models import WorkLog
+from app.schemas.work_logs import WorkLogResponse
+from app.services.work_log_service import WorkLogService
+from benchmarks.seed_data import make_engine, seed
+
+
+def serialize(logs):
+    """응답 직렬화 (response_model과 같은 방식으로 하위 관계에 접근)"""
+    return [WorkLogResponse.model_validate(log, from_attributes=True) for log in logs]
+
+
+def offset_page(db, skip: int, limit: int):
+    """기존 방식"""
+    return serialize(db.query(WorkLog).offset(skip).limit(limit).all())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=None, help="기본값: 임시 SQLite 파일")
+    parser.add_argument("--projects", type=int, default=20)
+    parser.add_argument("--days", type=int, default=100)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--max-queries", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = make_engine(args.database_url)
+    print("🌱 시드 데이터 생성 중...")
+    counts = seed(engine, projects=args.projects, days=args.days, items_per_log=2, entries_per_item=1)
+    print(f"   {counts}")
+    Session = sessionmaker(bind=engine)
+    total = counts["work_logs"]
+    last_skip = (total - 1) // args.page_size * args.page_size
+
+    def measure(fn):
+        db = Session()
+        try:
+            started = time.perf_counter()
+            with count_round_trips() as counter:
+                rows = fn(db)
+            return rows, counter.count, (time.perf_counter() - started) * 1000
+        finally:
+            db.close()
+
+    for label, skip in (("첫 페이지", 0), ("마지막 페이지", last_skip)):
+        rows, queries, ms = measure(lambda db: offset_page(db, skip, args.page_size))
+        print(f"📊 offset {label}: {len(rows)}건, 쿼리 {queries}회, {ms:.1f}ms")
+
+    # 키셋: 전 페이지를 순회하며 페이지별 쿼리 수 확인
+    db = Session()
+    cursor = None
+    page_queries = []
+    seen = 0
+    first_ms = last_ms = 0.0
+    while True:
+        started = time.perf_counter()
+        with count_round_trips() as counter:
+            logs, cursor = WorkLogService(db).list_page(limit=args.page_size, cursor=cursor)
+            serialize(logs)
+        elapsed = (time.perf_counter() - started) * 1000
+        page_queries.append(counter.count)
+        first_ms = first_ms or elapsed
+        last_ms = elapsed
+        seen += len(logs)
+        db.expunge_all()
+        if not cursor:
+            break
+    db.close()
+
+    print(f"📊 keyset 첫 페이지: 쿼리 {page_queries[0]}회, {first_ms:.1f}ms")
+    print(f"📊 keyset 마지막 페이지: 쿼리 {page_queries[-1]}회, {last_ms:.1f}ms ({len(page_queries)}페이지, {seen}건)")
+
+    if seen != total:
+        print(f"❌ 전체 순회 건수 불일치: {seen} != {total}")
+        sys.exit(1)
+    if len(set(page_queries)) != 1 or page_queries[0] > args.max_queries:
+        print(f"❌ 페이지당 쿼리 수가 고정되지 않음: {sorted(set(page_queries))}")
+        sys.exit(1)
+    print(f"✅ 페이지당 쿼리 {page_queries[0]}회 고정")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+벤치마크용 대용량 시드 데이터 생성
+
+DATABASE_URL과 무관하게 별도 엔진(기본: 임시 SQLite 파일)에 테이블을 만들고
+프로젝트/작업일지/작업항목/노무·장비·자재 투입 데이터를 채운다.
+"""
+import os
+import random
+import sys
+import tempfile
+from datetime import date, timedelta
+from decimal import Decimal
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import (
+    Client, Project, WorkLog, WorkItem, LaborEntry, EquipmentEntry, MaterialEntry
+)
+from app.models.labor_entries import RateType
+from app.services.labor_stats_service import LaborRateStatsService
+from app.services.rollup_service import CostRollupService
+
+TRADES = ["목공", "철근공", "형틀목공", "타일공", "미장공", "도장공", "방수공", "보통인부"]
+EQUIPMENT = [("01", "굴삭기"), ("04", "덤프트럭"), ("06", "트럭크레인"), ("07", "콘크리트펌프")]
+MATERIALS = [("M-001", "레미콘", "m3"), ("M-002", "철근", "ton"), ("M-003", "합판", "장"), ("M-004", "방수시트", "m2")]
+TASKS = [("01.01.001", "터파기"), ("03.01.001", "거푸집 설치"), ("03.02.001", "철근 배근"), ("05.01.001", "바닥 방수")]
+
+
+def make_engine(url: str = None):
+    """벤치마크 전용 엔진 생성 후 스키마 생성"""
+    if url is None:
+        fd, path = tempfile.mkstemp(prefix="cms_bench_", suffix=".db")
+        os.close(fd)
+        url = f"sqlite:///{path}"
+
+    if url.startswith("sqlite"):
+        engine = create_engine(url, connect_args={"check_same_thread": False})
+    else:
+        engine = create_engine(url)
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def seed(
+    engine,
+    projects: int = 5,
+    days: int = 60,
+    items_per_log: int = 4,
+    entries_per_item: int = 3,
+    start: date = date(2024, 1, 1),
+    random_seed: int = 42,
+) -> dict:
+    """프로젝트 × 일수 만큼 작업일지와 하위 투입 데이터를 생성"""
+    rng = random.Random(random_seed)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+
+    counts = {"projects": 0, "work_logs": 0, "work_items": 0, "entries": 0}
+    try:
+        client = Client(company_name="벤치마크 발주처")
+        db.add(client)
+        db.flush()
+
+        for p in range(projects):
+            project = Project(client_id=client.id, project_name=f"벤치마크 현장 {p + 1}",
+                              contract_amount=Decimal("1000000000"))
+            db.add(project)
+            db.flush()
+            counts["projects"] += 1
+
+            for d in range(days):
+                log = WorkLog(project_id=project.id, work_date=start + timedelta(days=d),
+                              area=f"{rng.randint(1, 5)}동 {rng.randint(1, 20)}층", weather="맑음")
+                db.add(log)
+                db.flush()
+                counts["work_logs"] += 1
+
+                for _ in range(items_per_log):
+                    code, name = rng.choice(TASKS)
+                    item = WorkItem(work_log_id=log.id, task_code=code, task_name=name,
+                                    quantity=Decimal(str(rng.randint(1, 500))), unit="m2")
+                    db.add(item)
+                    db.flush()
+                    counts["work_items"] += 1
+
+                    for _ in range(entries_per_item):
+                        persons = rng.randint(1, 10)
+                        hours = Decimal(str(rng.choice([4.0, 8.0, 8.5, 10.0])))
+                        rate_type = rng.choice([RateType.DAILY, RateType.HOURLY])
+                        unit_rate = Decimal(str(rng.randint(150, 300) * 1000)) if rate_type == RateType.DAILY \
+                            else Decimal(str(rng.randint(18000, 40000)))
+                        db.add(LaborEntry(work_item_id=item.id, trade=rng.choice(TRADES), persons=persons,
+                                          hours=hours, rate_type=rate_type, unit_rate=unit_rate,
+                                          total_cost=persons * hours * unit_rate))
+
+                        eq_code, eq_name = rng.choice(EQUIPMENT)
+                        eq_hours = Decimal(str(rng.choice([2.0, 3.5, 6.0, 8.0])))
+                        hourly_rate = Decimal(str(rng.randint(50, 200) * 1000))
+                        mobilization = Decimal(str(rng.choice([0, 50000, 150000])))
+                        units = rng.choice([1, 1, 1, 2, 3])
+                        db.add(EquipmentEntry(work_item_id=item.id, equipment_code=eq_code, equipment_name=eq_name,
+                                              units=units, hours=eq_hours, hourly_rate=hourly_rate,
+                                              min_hours=Decimal("4.0"), mobilization_fee=mobilization,
+                                              total_cost=units * max(eq_hours, Decimal("4.0")) * hourly_rate
+                                              + mobilization))
+
+                        mat_code, mat_name, unit = rng.choice(MATERIALS)
+                        quantity = Decimal(str(rng.randint(1, 100000))) / Decimal("1000")
+                        unit_price = Decimal(str(rng.randint(1000, 90000)))
+                        db.add(MaterialEntry(work_item_id=item.id, material_code=mat_code, material_name=mat_name,
+                                             quantity=quantity, unit=unit, unit_price=unit_price,
+                                             total_cost=(quantity * unit_price).quantize(Decimal("0.01")),
+                                             supplier=f"공급처{rng.randint(1, 5)}"))
+                        counts["entries"] += 3
+
+            db.commit()
+
+        # 시드는 ORM으로 직접 넣으므로 일자별 집계와 단가 분포는 한 번에 재구축
+        CostRollupService(db).rebuild()
+        LaborRateStatsService(db).rebuild()
+    finally:
+        db.close()
+
+    return counts
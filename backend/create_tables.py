@@ -10,7 +10,9 @@ from app.database import engine, Base
 from app.models import (
     clients, projects, work_logs, work_items, 
     labor_entries, equipment_entries, material_entries,
-    invoices, invoice_lines, reference_data
+    invoices, invoice_lines, reference_data, cost_rollups,
+    billing_runs, progress_payments, sync_tombstones, table_versions, work_log_search,
+    project_archives, labor_rate_stats
 )
 
 def create_all_tables():
@@ -33,6 +35,14 @@ def create_all_tables():
         print("   - invoices (청구서)")
         print("   - invoice_lines (청구서 라인)")
         print("   - reference_data (참조 데이터)")
+        print("   - daily_cost_rollups (일자별 비용 집계)")
+        print("   - billing_runs, billing_run_items (일괄 청구 실행)")
+        print("   - progress_payment_ledger (기성 원장)")
+        print("   - sync_tombstones (동기화 삭제 기록)")
+        print("   - table_versions (조건부 GET 버전)")
+        print("   - work_log_search (작업일지 전문 검색 색인)")
+        print("   - project_archives (보관 프로젝트)")
+        print("   - labor_rate_stats (직종별 단가 분포)")
         
         return True
         
@@ -56,6 +66,8 @@ if __name__ == "__main__":
     # 테이블 생성
     if create_all_tables():
         print("\n🎉 Supabase 데이터베이스 설정 완료!")
+        print("💡 조회 인덱스 등 버전별 스키마 단계를 적용하세요:")
+        print("   python3 migrate_schema.py")
         print("💡 이제 백엔드 서버를 시작할 수 있습니다:")
         print("   python3 run_server.py")
     else:
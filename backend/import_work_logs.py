@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+작업일지 대량 가져오기 스크립트
+
+    python import_work_logs.py diaries.csv
+    python import_work_logs.py diaries.jsonl --chunk-size 1000
+    cat diaries.jsonl | python import_work_logs.py - --format jsonl
+"""
+import argparse
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.database import SessionLocal
+from app.services.import_service import ImportFormat, WorkLogImportService
+
+def print_progress(summary):
+    print(f"   {summary['records_read']:,}건 처리 "
+          f"(성공 {summary['work_logs_imported']:,} / 실패 {summary['failed']:,}, "
+          f"{summary['records_per_second']:,}건/초)")
+
+def main():
+    parser = argparse.ArgumentParser(description="작업일지 대량 가져오기 (CSV/JSONL)")
+    parser.add_argument("path", help="가져올 파일 경로 (- 는 표준입력)")
+    parser.add_argument("--format", choices=[f.value for f in ImportFormat], help="파일 형식 (생략 시 확장자로 판단)")
+    parser.add_argument("--chunk-size", type=int, default=WorkLogImportService.DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    import_format = args.format
+    if import_format is None:
+        if args.path.lower().endswith(".csv"):
+            import_format = "csv"
+        elif args.path.lower().endswith((".jsonl", ".ndjson")):
+            import_format = "jsonl"
+        else:
+            parser.error("파일 형식을 알 수 없습니다. --format을 지정하세요")
+
+    db = SessionLocal()
+    stream = sys.stdin if args.path == "-" else open(args.path, encoding="utf-8-sig", newline="")
+    try:
+        print(f"📥 작업일지 가져오기: {args.path} ({import_format})")
+        summary = WorkLogImportService(db, chunk_size=args.chunk_size).import_stream(
+            stream, ImportFormat(import_format), progress=print_progress
+        )
+        for error in summary['errors']:
+            print(f"   ❌ {error['line']}행: {error['error']}")
+        print(f"🏁 작업일지 {summary['work_logs_imported']:,}건 / 작업항목 {summary['work_items_imported']:,}건 / "
+              f"투입 {summary['entries_imported']:,}건 적재, 실패 {summary['failed']:,}건 "
+              f"({summary['elapsed_seconds']}초, {summary['records_per_second']}건/초)")
+        return summary['failed'] == 0
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+        db.close()
+
+if __name__ == "__main__":
+    if not main():
+        sys.exit(1)
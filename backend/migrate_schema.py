@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+버전별 스키마 단계(인덱스 등) 적용 스크립트
+
+    python migrate_schema.py            # 적용되지 않은 단계 전부 적용
+    python migrate_schema.py --status   # 적용 현황과 누락 인덱스만 출력
+    python migrate_schema.py --target 1 # 1단계까지만 적용
+"""
+import argparse
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.database import engine
+from app.services.schema_service import IndexManager, SchemaMigrator
+
+def print_status(migrator: SchemaMigrator):
+    applied = migrator.applied()
+    for version, description, _ in migrator.steps:
+        if version in applied:
+            print(f"   ✅ {version:>3} {description} ({applied[version]['applied_at']})")
+        else:
+            print(f"   ⏳ {version:>3} {description}")
+    missing = IndexManager(engine).missing()
+    if missing:
+        print(f"   누락 인덱스: {', '.join(missing)}")
+
+def main():
+    parser = argparse.ArgumentParser(description="버전별 스키마 단계 적용")
+    parser.add_argument("--status", action="store_true", help="적용하지 않고 현황만 출력")
+    parser.add_argument("--target", type=int, default=None, help="이 버전까지만 적용")
+    args = parser.parse_args()
+
+    migrator = SchemaMigrator(engine)
+    if args.status:
+        print_status(migrator)
+        return True
+
+    print("🔄 스키마 단계 적용 중...")
+    applied = migrator.upgrade(
+        target=args.target,
+        progress=lambda version, description: print(f"   → {version} {description}")
+    )
+    print(f"✅ {len(applied)}개 단계 적용" if applied else "✅ 적용할 단계가 없습니다")
+    print_status(migrator)
+    return True
+
+if __name__ == "__main__":
+    if not main():
+        sys.exit(1)
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+일자별 비용 집계(daily_cost_rollups) 재구축/검증 스크립트
+
+    python rebuild_cost_rollups.py                 # 전체 재구축 후 검증
+    python rebuild_cost_rollups.py --project-id 3  # 특정 프로젝트만
+    python rebuild_cost_rollups.py --verify-only   # 재구축 없이 검증만
+    python rebuild_cost_rollups.py --labor-stats   # 직종별 단가 분포(labor_rate_stats)도 재구축
+"""
+import argparse
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.database import SessionLocal
+from app.services.labor_stats_service import LaborRateStatsService
+from app.services.rollup_service import CostRollupService
+
+def main():
+    parser = argparse.ArgumentParser(description="일자별 비용 집계 재구축/검증")
+    parser.add_argument("--project-id", type=int, default=None, help="대상 프로젝트 ID (기본: 전체)")
+    parser.add_argument("--verify-only", action="store_true", help="재구축 없이 원천 데이터와 비교만 수행")
+    parser.add_argument("--labor-stats", action="store_true", help="단가 추천용 직종별 단가 분포도 전체 재구축")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        service = CostRollupService(db)
+
+        if not args.verify_only:
+            print("🔄 비용 집계 재구축 중...")
+            rows = service.rebuild(args.project_id)
+            print(f"✅ 집계 행 {rows}건 생성")
+
+        if args.labor_stats and not args.verify_only:
+            print("🔄 직종별 단가 분포 재구축 중...")
+            rows = LaborRateStatsService(db).rebuild()
+            print(f"✅ 단가 분포 행 {rows}건 생성")
+
+        print("🔍 원천 투입 데이터와 비교 중...")
+        mismatches = service.verify(args.project_id)
+        if mismatches:
+            print(f"❌ 불일치 {len(mismatches)}건")
+            for m in mismatches[:20]:
+                print(f"   - project={m['project_id']} date={m['work_date']} {m['category']}: "
+                      f"raw={m['raw_amount']} ({m['raw_count']}건) / rollup={m['rollup_amount']} ({m['rollup_count']}건)")
+            return False
+
+        print("✅ 집계 테이블이 원천 데이터와 일치합니다")
+        return True
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    if not main():
+        sys.exit(1)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+월말 일괄 청구 실행 스크립트
+
+    python run_billing.py --from 2024-01-01 --to 2024-01-31
+    python run_billing.py --resume 12            # 중단된 실행 재개
+    python run_billing.py --resume 12 --force    # 작업자가 죽은 실행을 heartbeat 만료 전에 바로 넘겨받기
+"""
+import argparse
+import sys
+import os
+from datetime import date
+from decimal import Decimal
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.database import SessionLocal
+from app.services.billing_service import BatchBillingService, BillingRunInProgressError
+
+def print_progress(done, total, item):
+    mark = "✅" if item.status.value == "succeeded" else "❌"
+    detail = f"invoice={item.invoice_id}" if item.invoice_id else item.error
+    print(f"   [{done}/{total}] {mark} project={item.project_id} {detail}")
+
+def main():
+    parser = argparse.ArgumentParser(description="월말 일괄 청구")
+    parser.add_argument("--from", dest="period_from", type=date.fromisoformat, help="청구 시작일 (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="period_to", type=date.fromisoformat, help="청구 종료일 (YYYY-MM-DD)")
+    parser.add_argument("--project-id", type=int, action="append", dest="project_ids", help="대상 프로젝트 (반복 지정 가능)")
+    parser.add_argument("--vat-rate", type=Decimal, default=Decimal("10.0"))
+    parser.add_argument("--concurrency", type=int, default=BatchBillingService.DEFAULT_CONCURRENCY)
+    parser.add_argument("--resume", type=int, metavar="RUN_ID", help="기존 실행 재개")
+    parser.add_argument("--force", action="store_true", help="heartbeat가 살아 있어도 재개 (작업자가 없을 때만)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        service = BatchBillingService(db)
+
+        if args.resume is not None:
+            run_id = args.resume
+        else:
+            if args.period_from is None or args.period_to is None:
+                parser.error("--from/--to 또는 --resume 중 하나가 필요합니다")
+            run = service.create_run(args.period_from, args.period_to, args.project_ids, args.vat_rate)
+            run_id = run.id
+            print(f"🧾 일괄 청구 실행 #{run_id} 생성: 대상 {len(run.items)}개 프로젝트")
+
+        try:
+            service.claim_run(run_id, force=args.force)
+        except BillingRunInProgressError as e:
+            print(f"❌ 실행 #{run_id}: {e} (작업자가 없으면 --force)")
+            return False
+        run = service.execute(run_id, concurrency=args.concurrency, progress=print_progress, claimed=True)
+        progress = service.get_progress(run.id)
+        print(f"🏁 실행 #{run.id} {progress['status']}: {progress['counts']}")
+        return run.status.value == "completed"
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    if not main():
+        sys.exit(1)